@@ -0,0 +1,666 @@
+import os
+import random
+import time
+import tracemalloc
+from heapq import heappush, heappop
+from itertools import count
+
+from . import solve
+from .graphs.graph import Grafo
+from .graphs.heap import IndexedDaryHeap
+from .graphs.algorithms import (_dijkstra_multisource, _weight_function,
+                                single_source_dijkstra, single_source_dijkstra_indexed,
+                                delta_stepping, bfs, bfs_direction_optimizing,
+                                multi_source_bfs, bfs_path, bidirectional_bfs_path,
+                                betweenness_centrality, closeness_centrality, top_k_closeness,
+                                pagerank, personalized_pagerank, diameter, eccentricities,
+                                kruskal_mst, prim_mst)
+
+# ===================================================================
+# Utilitários
+# ===================================================================
+
+def _medir(funcao, *args, **kwargs):
+    """
+    Executa a função medindo tempo e pico de memória alocada (tracemalloc).
+    Retorna (resultado, tempo_segundos, pico_bytes).
+    """
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    elapsed = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, elapsed, pico
+
+
+def _origens_padrao(grafo, num_origens=3):
+    """ Primeiro, meio e último nó do grafo, como em executar_bfs_parte2. """
+    todos_nos = grafo.get_todos_os_nos()
+    return [todos_nos[0], todos_nos[len(todos_nos) // 2], todos_nos[-1]][:num_origens]
+
+
+def grafo_aleatorio(num_nos, grau_medio, seed=0, dirigido=True):
+    """
+    Grafo aleatório simples (sem laços nem arestas paralelas) com pesos em
+    [1, 100), para medir escala em grafos maiores que os do projeto.
+    """
+    rng = random.Random(seed)
+    grafo = Grafo(dirigido=dirigido)
+    for no in range(num_nos):
+        grafo.add_node(no)
+
+    arestas = set()
+    for _ in range(num_nos * grau_medio):
+        u, v = rng.randrange(num_nos), rng.randrange(num_nos)
+        chave = (u, v) if dirigido else (min(u, v), max(u, v))
+        if u == v or chave in arestas:
+            continue
+        arestas.add(chave)
+        grafo.add_edge(u, v, rng.uniform(1, 100))
+    return grafo
+
+
+def grafo_livre_de_escala(num_nos, m=4, seed=0):
+    """
+    Grafo não-dirigido de Barabási-Albert: cada nó novo liga-se a `m` nós
+    existentes escolhidos com probabilidade proporcional ao grau. Gera
+    hubs e diâmetro pequeno, como redes de rotas aéreas.
+    """
+    rng = random.Random(seed)
+    grafo = Grafo(dirigido=False)
+    for no in range(num_nos):
+        grafo.add_node(no)
+
+    extremidades = list(range(m))  # cada nó aparece uma vez por aresta incidente
+    for novo in range(m, num_nos):
+        alvos = set()
+        while len(alvos) < m:
+            alvos.add(rng.choice(extremidades))
+        for alvo in alvos:
+            grafo.add_edge(novo, alvo, 1)
+            extremidades.extend((novo, alvo))
+    return grafo
+
+
+# ===================================================================
+# Heaps do Dijkstra: deleção preguiçosa vs heap d-ário indexado
+# ===================================================================
+
+def _contar_heap_preguicoso(csr, origem):
+    """
+    Repete o laço de _dijkstra_multisource (uma tupla nova por melhoria)
+    contando tuplas empilhadas e o tamanho máximo do heap.
+    """
+    indptr, indices, pesos = csr.indptr.tolist(), csr.indices.tolist(), csr.pesos.tolist()
+    dist, seen = {}, {origem: 0}
+    c = count()
+    fringe = [(0, next(c), origem)]
+    tuplas, tamanho_max = 1, 1
+
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        for slot in range(indptr[v], indptr[v + 1]):
+            u = indices[slot]
+            vu_dist = d + pesos[slot]
+            if u not in dist and (u not in seen or vu_dist < seen[u]):
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u))
+                tuplas += 1
+                tamanho_max = max(tamanho_max, len(fringe))
+
+    return {'tamanho_max_heap': tamanho_max, 'tuplas_alocadas': tuplas, 'operacoes_heap': tuplas}
+
+
+def _contar_heap_indexado(csr, origem, d):
+    """ Mesmo laço com IndexedDaryHeap, contando inserções e decrease-keys. """
+    indptr, indices, pesos = csr.indptr.tolist(), csr.indices.tolist(), csr.pesos.tolist()
+    n = len(csr.nos)
+    feito = [False] * n
+    heap = IndexedDaryHeap(n, d)
+    heap.push(origem, 0)
+    insercoes, diminuicoes, tamanho_max = 1, 0, 1
+
+    while heap:
+        v, dist_v = heap.pop()
+        feito[v] = True
+        for slot in range(indptr[v], indptr[v + 1]):
+            u = indices[slot]
+            if feito[u]:
+                continue
+            estava = u in heap
+            if heap.push_or_decrease(u, dist_v + pesos[slot]):
+                if estava:
+                    diminuicoes += 1
+                else:
+                    insercoes += 1
+                    tamanho_max = max(tamanho_max, len(heap))
+
+    return {'tamanho_max_heap': tamanho_max, 'tuplas_alocadas': 0,
+            'operacoes_heap': insercoes + diminuicoes, 'decrease_keys': diminuicoes}
+
+
+def comparar_heaps_dijkstra(grafo, origens=None, d=4):
+    """
+    Compara o heap com deleção preguiçosa de _dijkstra_multisource com o
+    heap d-ário indexado de single_source_dijkstra_indexed.
+
+    Para cada origem informa tamanho máximo do heap, tuplas alocadas,
+    operações no heap, tempo e pico de memória (tracemalloc) das duas versões.
+    """
+    if origens is None:
+        origens = _origens_padrao(grafo)
+
+    csr = grafo.para_csr()
+    weight = _weight_function(grafo, "weight")
+    resultados = []
+
+    for origem in origens:
+        _, t_lazy, pico_lazy = _medir(_dijkstra_multisource, grafo, [origem], weight)
+        _, t_idx, pico_idx = _medir(single_source_dijkstra_indexed, grafo, origem, d)
+
+        preguicoso = _contar_heap_preguicoso(csr, csr.indice[origem])
+        preguicoso.update({'tempo_segundos': t_lazy, 'pico_memoria_bytes': pico_lazy})
+        indexado = _contar_heap_indexado(csr, csr.indice[origem], d)
+        indexado.update({'tempo_segundos': t_idx, 'pico_memoria_bytes': pico_idx})
+
+        resultados.append({'origem': origem, 'heap_preguicoso': preguicoso,
+                           f'heap_{d}_ario_indexado': indexado})
+
+    return resultados
+
+
+# ===================================================================
+# Delta-stepping vs Dijkstra
+# ===================================================================
+
+def comparar_delta_stepping(grafo, origem=None, deltas=(None,), lista_workers=None):
+    """
+    Mede delta_stepping para cada Δ e número de processos, contra
+    single_source_dijkstra a partir da mesma origem.
+
+    `lista_workers` padrão: 1, 2, 4, ... até o número de núcleos da máquina.
+    """
+    if origem is None:
+        origem = _origens_padrao(grafo, 1)[0]
+    if lista_workers is None:
+        nucleos = os.cpu_count() or 1
+        lista_workers = [1]
+        while lista_workers[-1] * 2 <= nucleos:
+            lista_workers.append(lista_workers[-1] * 2)
+
+    grafo.para_csr()  # a CSR fica em cache; não entra na medição
+
+    t0 = time.perf_counter()
+    esperado, _ = single_source_dijkstra(grafo, origem)
+    t_dijkstra = time.perf_counter() - t0
+
+    resultados = {'origem': origem, 'dijkstra_segundos': t_dijkstra, 'delta_stepping': []}
+    for delta in deltas:
+        for workers in lista_workers:
+            t0 = time.perf_counter()
+            r = delta_stepping(grafo, origem, delta=delta, workers=workers,
+                               parallel_threshold=1 if workers > 1 else 50000)
+            elapsed = time.perf_counter() - t0
+
+            resultados['delta_stepping'].append({
+                'delta': r['delta'],
+                'workers': workers,
+                'num_buckets': r['num_buckets'],
+                'tempo_segundos': elapsed,
+                'speedup_vs_dijkstra': t_dijkstra / elapsed if elapsed > 0 else None,
+                'distancias_iguais': len(r['distances']) == len(esperado) and all(
+                    abs(r['distances'][no] - d) <= 1e-9 * max(1.0, abs(d)) for no, d in esperado.items())
+            })
+
+    return resultados
+
+
+# ===================================================================
+# BFS: top-down vs direction-optimizing
+# ===================================================================
+
+def comparar_bfs_direcao(grafo, origens=None):
+    """
+    Mede bfs (fila, top-down) contra bfs_direction_optimizing para cada
+    origem, conferindo se os níveis são iguais e registrando a direção
+    escolhida em cada nível.
+    """
+    if origens is None:
+        origens = _origens_padrao(grafo)
+
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+
+    resultados = []
+    for origem in origens:
+        t0 = time.perf_counter()
+        esperado = bfs(grafo, origem)
+        t_bfs = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        r = bfs_direction_optimizing(grafo, origem)
+        t_do = time.perf_counter() - t0
+
+        resultados.append({
+            'origem': origem,
+            'bfs_segundos': t_bfs,
+            'direction_optimizing_segundos': t_do,
+            'speedup': t_bfs / t_do if t_do > 0 else None,
+            'niveis_iguais': r['levels'] == esperado['levels'],
+            'direcoes': r['directions']
+        })
+
+    return resultados
+
+
+# ===================================================================
+# BFS de todas as origens: bit-paralelo vs uma BFS por origem
+# ===================================================================
+
+def comparar_bfs_multiplas_origens(grafo, origens=None, words=4):
+    """
+    Mede multi_source_bfs (64 * words origens por passada) contra uma
+    chamada de bfs por origem, conferindo as distâncias em saltos.
+    Por padrão usa todos os nós como origem.
+    """
+    if origens is None:
+        origens = grafo.get_todos_os_nos()
+
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+
+    t0 = time.perf_counter()
+    r = multi_source_bfs(grafo, origens, words=words)
+    t_bits = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    niveis = [bfs(grafo, origem)['levels'] for origem in origens]
+    t_bfs = time.perf_counter() - t0
+
+    iguais = all(
+        [lv.get(no, -1) for no in r['nodes']] == r['hops'][i].tolist()
+        for i, lv in enumerate(niveis)
+    )
+
+    return {
+        'num_origens': len(origens),
+        'bfs_segundos': t_bfs,
+        'bit_paralelo_segundos': t_bits,
+        'speedup': t_bfs / t_bits if t_bits > 0 else None,
+        'saltos_iguais': iguais,
+        'excentricidade_max': max(r['eccentricity'].values()) if origens else None
+    }
+
+
+# ===================================================================
+# Caminho mínimo em saltos: BFS completo, parada antecipada e bidirecional
+# ===================================================================
+
+def comparar_caminho_bfs(grafo, num_pares=20, seed=0):
+    """
+    Para pares (origem, destino) sorteados, mede o tempo total de:
+    uma bfs completa a partir da origem (o que bfs_path fazia antes),
+    bfs_path com parada ao descobrir o destino e bidirectional_bfs_path.
+    Confere se os dois caminhos têm o mesmo número de saltos.
+    """
+    rng = random.Random(seed)
+    todos_nos = grafo.get_todos_os_nos()
+    pares = [(rng.choice(todos_nos), rng.choice(todos_nos)) for _ in range(num_pares)]
+
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+
+    t0 = time.perf_counter()
+    for origem, _ in pares:
+        bfs(grafo, origem)
+    t_completo = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    caminhos = [bfs_path(grafo, origem, destino) for origem, destino in pares]
+    t_antecipado = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    caminhos_bi = [bidirectional_bfs_path(grafo, origem, destino) for origem, destino in pares]
+    t_bidirecional = time.perf_counter() - t0
+
+    return {
+        'num_pares': num_pares,
+        'bfs_completo_segundos': t_completo,
+        'parada_antecipada_segundos': t_antecipado,
+        'bidirecional_segundos': t_bidirecional,
+        'saltos_iguais': all(
+            (a is None and b is None) or (a is not None and b is not None and len(a) == len(b))
+            for a, b in zip(caminhos, caminhos_bi)
+        )
+    }
+
+
+# ===================================================================
+# Betweenness: exato, paralelo e amostrado
+# ===================================================================
+
+def _cronometrar(funcao, *args, **kwargs):
+    """ Executa a função medindo só o tempo (tracemalloc deixaria laços com muitas alocações bem mais lentos). """
+    t0 = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - t0
+
+
+def comparar_betweenness(grafo, lista_pivos=(32, 128), workers=None):
+    """
+    Mede betweenness_centrality exato (1 processo e `workers` processos) e
+    amostrado com cada número de pivôs, informando o maior erro absoluto
+    da amostra contra o exato e o erro padrão médio estimado.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    grafo.para_csr()  # a CSR fica em cache; não entra na medição
+
+    exato, t_exato = _cronometrar(betweenness_centrality, grafo, weighted=True)
+    resultados = {'exato_segundos': t_exato, 'amostras': []}
+
+    if workers > 1:
+        _, t_paralelo = _cronometrar(betweenness_centrality, grafo, weighted=True, workers=workers)
+        resultados['paralelo'] = {'workers': workers, 'segundos': t_paralelo}
+
+    n = grafo.get_numero_de_nos()
+    for k in lista_pivos:
+        if k >= n:
+            continue
+        r, t = _cronometrar(betweenness_centrality, grafo, weighted=True, k=k, seed=0)
+        resultados['amostras'].append({
+            'pivos': k,
+            'segundos': t,
+            'erro_max': max(abs(r['nodes'][no] - v) for no, v in exato['nodes'].items()),
+            'erro_padrao_medio': sum(r['std_error'].values()) / n
+        })
+
+    return resultados
+
+
+# ===================================================================
+# Closeness: uma bfs por nó vs buscas em lote, e top-k aproximado
+# ===================================================================
+
+def comparar_closeness(grafo, k=10, seed=0):
+    """
+    Mede a closeness (sem pesos) de todos os nós calculada com uma chamada
+    de bfs por nó contra closeness_centrality (BFS bit-paralelo em lotes),
+    e top_k_closeness contra o top-k exato. A versão com bfs usa distâncias
+    de saída, então só é conferida em grafos não-dirigidos.
+    """
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+    n = grafo.get_numero_de_nos()
+
+    def closeness_por_bfs():
+        valores = {}
+        for no in grafo.get_todos_os_nos():
+            niveis = bfs(grafo, no)['levels']
+            total = sum(niveis.values())
+            alcancados = len(niveis) - 1
+            valores[no] = alcancados / total * alcancados / (n - 1) if total > 0 else 0.0
+        return valores
+
+    por_bfs, t_bfs = _cronometrar(closeness_por_bfs)
+    exato, t_lote = _cronometrar(closeness_centrality, grafo)
+    k = min(k, n)
+    topo, t_topo = _cronometrar(top_k_closeness, grafo, k, seed=seed)
+
+    topo_exato = set(sorted(exato, key=exato.get, reverse=True)[:k])
+    return {
+        'bfs_segundos': t_bfs,
+        'lote_segundos': t_lote,
+        'speedup': t_bfs / t_lote if t_lote > 0 else None,
+        'iguais': None if grafo.dirigido else all(abs(por_bfs[no] - v) < 1e-9 for no, v in exato.items()),
+        'top_k': k,
+        'top_k_segundos': t_topo,
+        'buscas_top_k': topo['num_pivots'] + topo['num_exact'],
+        'acertos_top_k': len(topo_exato & {no for no, _ in topo['top']})
+    }
+
+
+# ===================================================================
+# Diâmetro: iFUB e Takes-Kosters vs busca a partir de todos os nós
+# ===================================================================
+
+def comparar_diametro(grafo):
+    """
+    Mede diameter (iFUB) e eccentricities (Takes-Kosters), em saltos,
+    contra o método ingênuo de buscar a partir de todos os nós (com o BFS
+    bit-paralelo de multi_source_bfs), e compara as buscas usadas com as n
+    do método ingênuo. O ingênuo usa
+    distâncias de saída no grafo todo, então só é conferido em grafos
+    não-dirigidos e conexos.
+    """
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+    n = grafo.get_numero_de_nos()
+
+    ingenuo, t_ingenuo = _cronometrar(multi_source_bfs, grafo)
+    diam, t_diam = _cronometrar(diameter, grafo)
+    ecc, t_ecc = _cronometrar(eccentricities, grafo)
+
+    iguais = None
+    if not grafo.dirigido and diam['component_size'] == n:
+        esperado = {origem: int(ingenuo['hops'][i].max()) for i, origem in enumerate(ingenuo['sources'])}
+        iguais = esperado == ecc['eccentricity'] and max(esperado.values()) == diam['diameter']
+
+    return {
+        'num_nos': n,
+        'tamanho_componente': diam['component_size'],
+        'ingenuo_segundos': t_ingenuo,
+        'diametro': diam['diameter'],
+        'buscas_diametro': diam['num_searches'],
+        'diametro_segundos': t_diam,
+        'raio': ecc['radius'],
+        'buscas_excentricidades': ecc['num_searches'],
+        'excentricidades_segundos': t_ecc,
+        'iguais': iguais
+    }
+
+
+# ===================================================================
+# Árvore geradora mínima: Kruskal vs Prim
+# ===================================================================
+
+def comparar_mst(grafo, d=4):
+    """
+    Mede a árvore geradora mínima com Kruskal (arestas ordenadas e
+    union-find) e com Prim (heap d-ário indexado), conferindo o peso total.
+    """
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+
+    kruskal, t_kruskal = _cronometrar(kruskal_mst, grafo)
+    prim, t_prim = _cronometrar(prim_mst, grafo, d=d)
+
+    return {
+        'kruskal_segundos': t_kruskal,
+        'prim_segundos': t_prim,
+        'peso_total': kruskal['total_weight'],
+        'num_arvores': kruskal['num_trees'],
+        'pesos_iguais': abs(kruskal['total_weight'] - prim['total_weight']) <= 1e-9 * max(1.0, abs(kruskal['total_weight']))
+    }
+
+
+# ===================================================================
+# PageRank: partida a frio vs a quente e push local vs iteração global
+# ===================================================================
+
+def comparar_pagerank(grafo, num_arestas_novas=20, epsilons=(1e-5, 1e-6), tol=1e-10, seed=0):
+    """
+    Mede o PageRank do grafo, adiciona `num_arestas_novas` arestas
+    aleatórias (o grafo é alterado) e compara as iterações partindo do
+    uniforme e do vetor anterior. Depois compara o PageRank personalizado
+    de uma origem por iteração global e por push local com cada epsilon,
+    informando os nós tocados e o maior erro por nó (em grafos
+    não-dirigidos, no máximo epsilon vezes o grau do nó).
+    """
+    rng = random.Random(seed)
+    todos_nos = grafo.get_todos_os_nos()
+
+    grafo.para_csr()  # a CSR fica em cache; não entra na medição
+    antes, _ = _cronometrar(pagerank, grafo, tol=tol, max_iter=1000)
+
+    for _ in range(num_arestas_novas):
+        grafo.add_edge(rng.choice(todos_nos), rng.choice(todos_nos), 1.0)
+    grafo.para_csr()
+
+    frio, t_frio = _cronometrar(pagerank, grafo, tol=tol, max_iter=1000)
+    quente, t_quente = _cronometrar(pagerank, grafo, start=antes['scores'], tol=tol, max_iter=1000)
+
+    origem = rng.choice(todos_nos)
+    exato, t_global = _cronometrar(pagerank, grafo, personalization={origem: 1.0}, tol=tol, max_iter=1000)
+    locais = []
+    for epsilon in epsilons:
+        r, t = _cronometrar(personalized_pagerank, grafo, origem, epsilon=epsilon)
+        locais.append({
+            'epsilon': epsilon,
+            'segundos': t,
+            'nos_tocados': len(r['scores']),
+            'erro_max': max(abs(r['scores'].get(no, 0.0) - v) for no, v in exato['scores'].items()),
+            'residuo': r['residual']
+        })
+
+    return {
+        'frio': {'iteracoes': frio['iterations'], 'segundos': t_frio},
+        'quente': {'iteracoes': quente['iterations'], 'segundos': t_quente},
+        'origem': origem,
+        'global_segundos': t_global,
+        'push_local': locais
+    }
+
+
+# ===================================================================
+# Execução
+# ===================================================================
+
+def _imprimir_heaps(nome, resultados):
+    print(f"\n{nome}")
+    for r in resultados:
+        print(f"  Origem: {r['origem']}")
+        for versao, m in r.items():
+            if versao == 'origem':
+                continue
+            print(f"    {versao:<24} heap máx={m['tamanho_max_heap']:<6} "
+                  f"tuplas={m['tuplas_alocadas']:<7} ops={m['operacoes_heap']:<7} "
+                  f"tempo={m['tempo_segundos']:.6f}s pico={m['pico_memoria_bytes']} B")
+
+
+def main():
+    print("=" * 80)
+    print("Benchmarks")
+    print("=" * 80)
+
+    grafo_recife, _, _ = solve.construir_grafo_principal()
+    grafo_parte2, _ = solve.construir_grafo_parte2()
+
+    grafos = [("Recife", grafo_recife), ("Parte 2", grafo_parte2)]
+    for nome, grafo in grafos:
+        if grafo is None:
+            print(f"\n{nome}: grafo indisponível, pulando.")
+            continue
+        _imprimir_heaps(f"Heaps do Dijkstra - {nome}", comparar_heaps_dijkstra(grafo))
+
+    grafos.append(("Aleatório (100 mil nós, grau 8)", grafo_aleatorio(100_000, 8)))
+    for nome, grafo in grafos:
+        if grafo is None:
+            continue
+        r = comparar_delta_stepping(grafo, deltas=(None, 10.0, 50.0))
+        print(f"\nDelta-stepping - {nome} (origem {r['origem']}, Dijkstra {r['dijkstra_segundos']:.4f}s)")
+        for m in r['delta_stepping']:
+            print(f"    Δ={m['delta']:<10.4g} workers={m['workers']:<3} buckets={m['num_buckets']:<6} "
+                  f"tempo={m['tempo_segundos']:.4f}s speedup={m['speedup_vs_dijkstra']:.2f}x "
+                  f"iguais={m['distancias_iguais']}")
+
+    grafos.append(("Livre de escala (100 mil nós, m=4)", grafo_livre_de_escala(100_000, 4)))
+    for nome, grafo in grafos:
+        if grafo is None:
+            continue
+        print(f"\nBFS direction-optimizing - {nome}")
+        for m in comparar_bfs_direcao(grafo):
+            direcoes = ''.join('T' if d == 'top_down' else 'B' for d in m['direcoes'])
+            print(f"    Origem: {m['origem']:<12} bfs={m['bfs_segundos']:.4f}s "
+                  f"direction-optimizing={m['direction_optimizing_segundos']:.4f}s "
+                  f"speedup={m['speedup']:.2f}x iguais={m['niveis_iguais']} direções={direcoes}")
+
+    for nome, grafo in grafos:
+        if grafo is None:
+            continue
+        m = comparar_caminho_bfs(grafo)
+        print(f"\nCaminho mínimo em saltos - {nome} ({m['num_pares']} pares)")
+        print(f"    bfs completo={m['bfs_completo_segundos']:.4f}s "
+              f"parada antecipada={m['parada_antecipada_segundos']:.4f}s "
+              f"bidirecional={m['bidirecional_segundos']:.4f}s iguais={m['saltos_iguais']}")
+
+    grafos_betweenness = [("Recife", grafo_recife),
+                          ("Aleatório (2 mil nós, grau 6)", grafo_aleatorio(2_000, 6))]
+    for nome, grafo in grafos_betweenness:
+        m = comparar_betweenness(grafo)
+        print(f"\nBetweenness - {nome} (exato {m['exato_segundos']:.4f}s)")
+        if 'paralelo' in m:
+            print(f"    {m['paralelo']['workers']} processos: {m['paralelo']['segundos']:.4f}s")
+        for a in m['amostras']:
+            print(f"    {a['pivos']:<4} pivôs: {a['segundos']:.4f}s erro máx={a['erro_max']:.5f} "
+                  f"erro padrão médio={a['erro_padrao_medio']:.5f}")
+
+    grafos_todas_origens = [("Recife", grafo_recife), ("Parte 2", grafo_parte2),
+                            ("Livre de escala (3 mil nós, m=4)", grafo_livre_de_escala(3_000, 4))]
+    for nome, grafo in grafos_todas_origens:
+        if grafo is None:
+            continue
+        m = comparar_bfs_multiplas_origens(grafo)
+        print(f"\nBFS de todas as origens - {nome} ({m['num_origens']} origens)")
+        print(f"    bfs={m['bfs_segundos']:.4f}s bit-paralelo={m['bit_paralelo_segundos']:.4f}s "
+              f"speedup={m['speedup']:.2f}x iguais={m['saltos_iguais']} "
+              f"excentricidade máx={m['excentricidade_max']}")
+
+    for nome, grafo in grafos_todas_origens:
+        if grafo is None:
+            continue
+        m = comparar_closeness(grafo)
+        print(f"\nCloseness - {nome}")
+        print(f"    bfs por nó={m['bfs_segundos']:.4f}s lote={m['lote_segundos']:.4f}s "
+              f"speedup={m['speedup']:.2f}x iguais={m['iguais']}")
+        print(f"    top-{m['top_k']}: {m['top_k_segundos']:.4f}s com {m['buscas_top_k']} buscas, "
+              f"{m['acertos_top_k']}/{m['top_k']} no top-{m['top_k']} exato")
+
+    for nome, grafo in grafos_todas_origens:
+        if grafo is None:
+            continue
+        m = comparar_diametro(grafo)
+        print(f"\nDiâmetro e excentricidades - {nome} (componente com {m['tamanho_componente']} de {m['num_nos']} nós)")
+        print(f"    todas as origens (bit-paralelo)={m['ingenuo_segundos']:.4f}s | "
+              f"iFUB: diâmetro {m['diametro']} com {m['buscas_diametro']} buscas {m['diametro_segundos']:.4f}s | "
+              f"Takes-Kosters: raio {m['raio']} com {m['buscas_excentricidades']} buscas "
+              f"{m['excentricidades_segundos']:.4f}s iguais={m['iguais']}")
+
+    grafos_mst = [("Recife", grafo_recife), ("Parte 2", grafo_parte2),
+                  ("Aleatório (100 mil nós, grau 8)", grafo_aleatorio(100_000, 8))]
+    for nome, grafo in grafos_mst:
+        if grafo is None:
+            continue
+        m = comparar_mst(grafo)
+        print(f"\nÁrvore geradora mínima - {nome} (peso {m['peso_total']:.2f}, {m['num_arvores']} árvores)")
+        print(f"    kruskal={m['kruskal_segundos']:.4f}s prim={m['prim_segundos']:.4f}s "
+              f"iguais={m['pesos_iguais']}")
+
+    # Por último: comparar_pagerank adiciona arestas aos grafos
+    grafos_pagerank = [("Parte 2", grafo_parte2),
+                       ("Aleatório dirigido (100 mil nós, grau 8)", grafo_aleatorio(100_000, 8)),
+                       ("Livre de escala (100 mil nós, m=4)", grafo_livre_de_escala(100_000, 4))]
+    for nome, grafo in grafos_pagerank:
+        if grafo is None:
+            continue
+        m = comparar_pagerank(grafo)
+        print(f"\nPageRank - {nome}")
+        print(f"    a frio: {m['frio']['iteracoes']} iterações {m['frio']['segundos']:.4f}s | "
+              f"a quente: {m['quente']['iteracoes']} iterações {m['quente']['segundos']:.4f}s")
+        print(f"    personalizado (origem {m['origem']}): iteração global={m['global_segundos']:.4f}s")
+        for p in m['push_local']:
+            print(f"    push local ε={p['epsilon']:g}: {p['segundos']:.4f}s nós tocados={p['nos_tocados']} "
+                  f"erro máx={p['erro_max']:.2e} (resíduo {p['residuo']:.5f})")
+
+
+if __name__ == "__main__":
+    main()
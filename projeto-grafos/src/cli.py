@@ -27,6 +27,8 @@ def main():
         df_graus = solve.analisar_graus_e_rankings(G)            # exibe bairro com maior grau e bairro mais denso
         solve.calcular_distancias_enderecos(G)   
         solve.gerar_arvore_percurso(G)
+        solve.gerar_arvore_geradora_minima(G)
+        solve.analisar_pontes_e_articulacoes(G)
         solve.exploracoes_visuais(df_graus, G)
 
         
@@ -1,11 +1,30 @@
+import random
 from heapq import heappush, heappop
+from bisect import bisect_right
 from itertools import count
 from collections import deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .graph import Grafo
+from .heap import IndexedDaryHeap
+from .union_find import UnionFind
 
 # ===================================================================
 # BFS (Breadth-First Search)
 # ===================================================================
 
+def _in_different_components(G, u, v):
+    """
+    True when `G` tracks its components (Grafo's union-find) and `u` and `v`
+    are in different ones, so no path between them can exist. On directed
+    graphs the components are weakly connected, which is still enough.
+    """
+    return hasattr(G, 'mesmo_componente') and not G.mesmo_componente(u, v)
+
 def bfs(G, source):
     """
     Breadth-First Search algorithm.
@@ -83,6 +102,12 @@ def bfs_path(G, source, target):
     -------
     list
         Path from source to target, or None if no path exists
+
+    Notes
+    -----
+    The search stops as soon as `target` is discovered. The path is the
+    same one the full bfs() parent tree gives. When the graph tracks its
+    components and they differ, None is returned without searching.
     """
     if source not in G:
         raise Exception(f"Node {source} not found in graph")
@@ -91,363 +116,2285 @@ def bfs_path(G, source, target):
 
     if source == target:
         return [source]
-
-    bfs_result = bfs(G, source)
-
-    if target not in bfs_result['visited']:
+    if _in_different_components(G, source, target):
         return None
 
-    # Reconstruct path from target to source
-    path = []
-    current = target
-    while current is not None:
-        path.append(current)
-        current = bfs_result['parent'][current]
-
-    path.reverse()
-    return path
+    parent = {source: None}
+    queue = deque([source])
 
+    while queue:
+        current = queue.popleft()
+        neighbors = G.get_vizinhos(current)
+        if not neighbors:
+            continue
+        for neighbor, weight in neighbors:
+            if neighbor in parent:
+                continue
+            parent[neighbor] = current
+            if neighbor == target:
+                # Reconstruct path from target to source
+                path = []
+                node = target
+                while node is not None:
+                    path.append(node)
+                    node = parent[node]
+                path.reverse()
+                return path
+            queue.append(neighbor)
+
+    return None
+
+def _bfs_expand_level(csr, frontier, parents, other_parents):
+    """
+    Expands one BFS level of a bidirectional search over `csr`.
 
-# ===================================================================
-# DFS (Depth-First Search)
-# ===================================================================
+    Returns the next frontier and the first node already reached by the
+    other side (None if the searches have not met).
+    """
+    indptr, indices = csr.indptr, csr.indices
+    next_frontier = []
+    for v in frontier:
+        for u in indices[indptr[v]:indptr[v + 1]].tolist():
+            if u in parents:
+                continue
+            parents[u] = v
+            if u in other_parents:
+                return next_frontier, u
+            next_frontier.append(u)
+    return next_frontier, None
 
-def dfs(G, source):
+def bidirectional_bfs_path(G, source, target):
     """
-    Depth-First Search algorithm.
+    Find a minimum-hop path with a BFS from each end.
+
+    A forward search from `source` and a backward search from `target`
+    (over the reverse adjacency on directed graphs) expand one level at a
+    time, always on the side with the smaller frontier, and stop when
+    they meet. Each side only goes about half the distance, so far fewer
+    nodes are touched than by a BFS from one end.
 
     Parameters
     ----------
     G : Graph object
-        The graph to search (uses get_vizinhos method)
+        The graph to search (uses the para_csr method)
     source : node
-        Starting node for DFS
+        Starting node
+    target : node
+        Ending node
 
     Returns
     -------
-    dict
-        Dictionary with:
-        - 'visited': set of visited nodes
-        - 'parent': dict mapping node -> parent in DFS tree
-        - 'order': list of nodes in DFS traversal order
-        - 'discovery_time': dict mapping node -> discovery time
-        - 'finish_time': dict mapping node -> finish time
-        - 'has_cycle': boolean indicating if cycle was detected
-        - 'edge_classification': dict mapping edge tuple -> edge type
-          (tree_edge, back_edge, forward_edge, cross_edge)
+    list
+        Path from source to target, or None if no path exists. It has the
+        same number of hops as bfs_path(), but may be a different one
+        when several shortest paths exist.
 
     Raises
     ------
     Exception
-        If source is not in graph
+        If source or target is not in graph
     """
     if source not in G:
         raise Exception(f"Node {source} not found in graph")
+    if target not in G:
+        raise Exception(f"Node {target} not found in graph")
 
-    visited = set()
-    parent = {}
-    order = []
-    discovery_time = {}
-    finish_time = {}
-    edge_classification = {}
-    has_cycle = False
-    time = [0]  
+    if source == target:
+        return [source]
+    if _in_different_components(G, source, target):
+        return None
 
-    def dfs_visit(node):
-        nonlocal has_cycle
+    csr = G.para_csr()
+    reverse = csr.transposta() if csr.dirigido else csr
+    s, t = csr.indice[source], csr.indice[target]
 
-        visited.add(node)
-        time[0] += 1
-        discovery_time[node] = time[0]
-        order.append(node)
+    # pred[u]: previous node on the path from source; succ[u]: next node towards target
+    pred = {s: None}
+    succ = {t: None}
+    forward, backward = [s], [t]
+    meet = None
 
-        neighbors = G.get_vizinhos(node)
-        if neighbors:
-            for neighbor, weight in neighbors:
-                edge = (node, neighbor)
+    while forward and backward and meet is None:
+        if len(forward) <= len(backward):
+            forward, meet = _bfs_expand_level(csr, forward, pred, succ)
+        else:
+            backward, meet = _bfs_expand_level(reverse, backward, succ, pred)
 
-                if neighbor not in visited:
-                    # Tree edge
-                    edge_classification[edge] = 'tree_edge'
-                    parent[neighbor] = node
-                    dfs_visit(neighbor)
+    if meet is None:
+        return None
 
-                elif neighbor in discovery_time and neighbor not in finish_time:
-                    # Back edge (cycle detected)
-                    edge_classification[edge] = 'back_edge'
-                    has_cycle = True
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    node = succ[meet]
+    while node is not None:
+        path.append(node)
+        node = succ[node]
 
-                elif discovery_time[neighbor] > discovery_time[node]:
-                    # Forward edge
-                    edge_classification[edge] = 'forward_edge'
+    return [csr.nos[v] for v in path]
 
-                else:
-                    # Cross edge
-                    edge_classification[edge] = 'cross_edge'
 
-        time[0] += 1
-        finish_time[node] = time[0]
+def _bfs_layers_iter(G, source, with_parent):
+    """Generator behind :func:`bfs_layers`."""
+    directed = G.dirigido
+    layer = [source]
+    previous, current = set(), {source}
+    visited = {source} if directed else None
 
-    parent[source] = None
-    dfs_visit(source)
+    yield [(source, None)] if with_parent else [source]
 
-    return {
-        'visited': visited,
-        'parent': parent,
-        'order': order,
-        'discovery_time': discovery_time,
-        'finish_time': finish_time,
-        'has_cycle': has_cycle,
-        'edge_classification': edge_classification
-    }
+    while layer:
+        next_layer = []
+        next_set = set()
+        parents = []
+
+        for node in layer:
+            neighbors = G.get_vizinhos(node)
+            if not neighbors:
+                continue
+            for neighbor, weight in neighbors:
+                if directed:
+                    if neighbor in visited:
+                        continue
+                    visited.add(neighbor)
+                elif neighbor in next_set or neighbor in current or neighbor in previous:
+                    continue
+                next_set.add(neighbor)
+                next_layer.append(neighbor)
+                if with_parent:
+                    parents.append((neighbor, node))
 
-def dfs_full(G):
+        if not next_layer:
+            return
+
+        previous, current, layer = current, next_set, next_layer
+        yield parents if with_parent else next_layer
+
+def bfs_layers(G, source, with_parent=False):
     """
-    Complete DFS traversal of all components in graph.
+    Breadth-First Search that yields one layer (level) at a time.
+
+    Layer k holds the nodes at distance k from `source`, in the same
+    order as they appear in bfs()['order']. Nothing is kept for the
+    whole reachable set on undirected graphs: a neighbor of a node on
+    layer k can only be on layers k - 1, k or k + 1, so only those three
+    sets are held. Directed graphs still need a visited set, since an
+    edge may point back to any earlier layer.
 
     Parameters
     ----------
     G : Graph object
-        The graph to search
+        The graph to search (uses get_vizinhos method)
+    source : node
+        Starting node for BFS
+    with_parent : bool, optional (default=False)
+        Yield (node, parent) pairs instead of bare nodes; the source's
+        parent is None
 
     Returns
     -------
-    dict
-        Dictionary with same structure as dfs(), but covering all nodes
+    generator
+        Yields one list per layer, starting with [source]. Stop iterating
+        to stop the search at that depth.
+
+    Raises
+    ------
+    Exception
+        If source is not in graph
+
+    Examples
+    --------
+    >>> tamanhos = [len(layer) for layer in bfs_layers(G, 'REC')]
+    >>> for depth, layer in enumerate(bfs_layers(G, 'REC')):
+    ...     if depth == 2:
+    ...         break
     """
-    all_nodes = G.get_todos_os_nos()
-    visited_global = set()
-    parent_global = {}
-    order_global = []
-    discovery_time_global = {}
-    finish_time_global = {}
-    edge_classification_global = {}
-    has_cycle_global = False
-    time = [0]
-
-    def dfs_visit(node):
-        nonlocal has_cycle_global
-
-        visited_global.add(node)
-        time[0] += 1
-        discovery_time_global[node] = time[0]
-        order_global.append(node)
-
-        neighbors = G.get_vizinhos(node)
-        if neighbors:
-            for neighbor, weight in neighbors:
-                edge = (node, neighbor)
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
+
+    return _bfs_layers_iter(G, source, with_parent)
 
-                if neighbor not in visited_global:
-                    edge_classification_global[edge] = 'tree_edge'
-                    parent_global[neighbor] = node
-                    dfs_visit(neighbor)
+def _bfs_top_down(indptr, indices, frontier, visited, parent):
+    """Expands every edge leaving the frontier; returns the new layer (sorted)."""
+    slots, tails = _edge_slots(indptr, frontier)
+    heads = indices[slots]
+    new = ~visited[heads]
+    heads, first = np.unique(heads[new], return_index=True)
+    parent[heads] = tails[new][first]
+    return heads
 
-                elif neighbor in discovery_time_global and neighbor not in finish_time_global:
-                    edge_classification_global[edge] = 'back_edge'
-                    has_cycle_global = True
+def _bfs_bottom_up(rindptr, rindices, in_frontier, unvisited, parent, probe_rounds=4):
+    """
+    Every unvisited node looks for a parent among its in-neighbors.
+
+    The first `probe_rounds` in-edges are probed one at a time, so most
+    nodes stop at their first frontier hit (Beamer's early exit); the
+    in-edges left of the remaining nodes are then checked in one pass.
+    Returns the new layer (sorted).
+    """
+    found = []
+    candidates = unvisited
+    for k in range(probe_rounds):
+        slots = rindptr[candidates] + k
+        has_edge = slots < rindptr[candidates + 1]
+        candidates, slots = candidates[has_edge], slots[has_edge]
+        if candidates.size == 0:
+            break
+        tails = rindices[slots]
+        hit = in_frontier[tails]
+        parent[candidates[hit]] = tails[hit]
+        found.append(candidates[hit])
+        candidates = candidates[~hit]
+    else:
+        starts = rindptr[candidates] + probe_rounds
+        lengths = rindptr[candidates + 1] - starts
+        keep = lengths > 0
+        candidates, starts, lengths = candidates[keep], starts[keep], lengths[keep]
+        if candidates.size:
+            offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+            slots = offsets + np.arange(int(lengths.sum()), dtype=np.int64)
+            owners = np.repeat(candidates, lengths)
+            tails = rindices[slots]
+            hit = in_frontier[tails]
+            owners, first = np.unique(owners[hit], return_index=True)
+            parent[owners] = tails[hit][first]
+            found.append(owners)
+
+    if not found:
+        return np.empty(0, dtype=np.int64)
+    return np.sort(np.concatenate(found))
+
+def bfs_direction_optimizing(G, source, alpha=14, beta=24):
+    """
+    Direction-optimizing BFS (Beamer et al.) over the CSR view of the graph.
 
-                elif discovery_time_global[neighbor] > discovery_time_global[node]:
-                    edge_classification_global[edge] = 'forward_edge'
+    Each level is expanded either top-down (the frontier scans its
+    out-edges) or bottom-up (every unvisited node scans its in-edges for
+    a frontier node, stopping at the first hit), with frontiers kept as
+    numpy id arrays and a boolean bitmap.
 
-                else:
-                    edge_classification_global[edge] = 'cross_edge'
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search (uses the para_csr method)
+    source : node
+        Starting node for BFS
+    alpha : float, optional (default=14)
+        Switch to bottom-up when the edges out of the frontier exceed
+        (edges into unvisited nodes) / alpha
+    beta : float, optional (default=24)
+        Switch back to top-down when the frontier stops growing and has
+        fewer than (number of nodes) / beta nodes
+
+    Returns
+    -------
+    dict
+        Same as bfs(), plus:
+        - 'directions': list with 'top_down' or 'bottom_up' for each
+          level expanded
 
-        time[0] += 1
-        finish_time_global[node] = time[0]
+    Raises
+    ------
+    Exception
+        If source is not in graph
 
-    for node in all_nodes:
-        if node not in visited_global:
-            parent_global[node] = None
-            dfs_visit(node)
+    Notes
+    -----
+    Levels are identical to bfs(). Parents are valid BFS parents but may
+    differ from bfs() when a node has several parents on the previous
+    level, and 'order' lists each level by node insertion order.
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
+    csr = G.para_csr()
+    reverse = csr.transposta() if csr.dirigido else csr
+    nodes = csr.nos
+    num_nodes = len(nodes)
+    out_degree = np.diff(csr.indptr)
+    in_degree = np.diff(reverse.indptr)
+
+    visited = np.zeros(num_nodes, dtype=bool)
+    parent = np.full(num_nodes, -1, dtype=np.int64)
+    level = np.full(num_nodes, -1, dtype=np.int64)
+
+    s = csr.indice[source]
+    visited[s] = True
+    level[s] = 0
+    frontier = np.array([s], dtype=np.int64)
+    layers = [frontier]
+    directions = []
+
+    # Bottom-up cost: edges into nodes not visited yet
+    edges_unexplored = int(in_degree.sum()) - int(in_degree[s])
+    top_down = True
+    depth = 0
+
+    while frontier.size:
+        if top_down:
+            if int(out_degree[frontier].sum()) > edges_unexplored / alpha:
+                top_down = False
+        elif frontier.size < layers[-2].size and frontier.size < num_nodes / beta:
+            top_down = True
+
+        if top_down:
+            frontier = _bfs_top_down(csr.indptr, csr.indices, frontier, visited, parent)
+        else:
+            in_frontier = np.zeros(num_nodes, dtype=bool)
+            in_frontier[frontier] = True
+            frontier = _bfs_bottom_up(reverse.indptr, reverse.indices, in_frontier,
+                                      np.flatnonzero(~visited), parent)
+
+        directions.append('top_down' if top_down else 'bottom_up')
+        depth += 1
+        visited[frontier] = True
+        level[frontier] = depth
+        edges_unexplored -= int(in_degree[frontier].sum())
+        layers.append(frontier)
+
+    order = np.concatenate(layers).tolist()
     return {
-        'visited': visited_global,
-        'parent': parent_global,
-        'order': order_global,
-        'discovery_time': discovery_time_global,
-        'finish_time': finish_time_global,
-        'has_cycle': has_cycle_global,
-        'edge_classification': edge_classification_global
+        'visited': {nodes[v] for v in order},
+        'levels': {nodes[v]: int(level[v]) for v in order},
+        'parent': {nodes[v]: (nodes[parent[v]] if parent[v] >= 0 else None) for v in order},
+        'order': [nodes[v] for v in order],
+        'directions': directions
     }
-# DIJKSTRA'S ALGORITHM
 
-def _weight_function(G, weight):
-    """Returns a function that returns the weight of an edge.
 
-    The returned function is specifically suitable for input to
-    functions :func:`_dijkstra` and :func:`_bellman_ford_relaxation`.
+def _bitset_bfs_levels(pull, ids, words):
+    """
+    Levels of a bit-parallel BFS from the node ids `ids` (at most 64 * words).
+
+    `pull` is the CSR whose row v lists the nodes v is reached from (the
+    reverse graph for a forward search). Yields (level, nodes_reached,
+    unpacked) for every level >= 1, where unpacked[i, j] is 1 when
+    nodes_reached[i] is first reached from ids[j] on that level.
+    """
+    num_nodes = len(pull.indptr) - 1
+    # reduceat over the in-edge runs of nodes that have in-edges
+    has_in_edges = np.flatnonzero(np.diff(pull.indptr) > 0)
+    run_starts = pull.indptr[has_in_edges]
+    bits = np.arange(len(ids))
+
+    frontier = np.zeros((num_nodes, words), dtype='<u8')
+    np.bitwise_or.at(frontier, (ids, bits // 64),
+                     np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)))
+    seen = frontier.copy()
+    level = 0
+
+    while True:
+        reached = np.zeros_like(frontier)
+        if run_starts.size:
+            reached[has_in_edges] = np.bitwise_or.reduceat(frontier[pull.indices], run_starts, axis=0)
+        reached &= ~seen
+        nodes_reached = np.flatnonzero(reached.any(axis=1))
+        if nodes_reached.size == 0:
+            return
+        seen |= reached
+        frontier = reached
+        level += 1
+
+        # Bit j of a row (little-endian) is source j
+        unpacked = np.unpackbits(reached[nodes_reached].view(np.uint8), axis=1,
+                                 bitorder='little')[:, :len(ids)]
+        yield level, nodes_reached, unpacked
+
+
+def multi_source_bfs(G, sources=None, words=4):
+    """
+    Bit-parallel BFS from many sources at once.
+
+    Every node holds a row of `words` uint64 words, one bit per source,
+    so a batch of 64 * words sources advances together: a level is the
+    bitwise OR of the in-neighbors' frontier rows (np.bitwise_or.reduceat
+    over the reverse CSR), minus the bits already seen.
 
     Parameters
     ----------
-    G : NetworkX graph.
-
-    weight : string or function
-        If it is callable, `weight` itself is returned. If it is a string,
-        it is assumed to be the name of the edge attribute that represents
-        the weight of an edge. In that case, a function is returned that
-        gets the edge weight according to the specified edge attribute.
+    G : Graph object
+        The graph to search (uses the para_csr method)
+    sources : list of nodes, optional
+        Starting nodes (default: every node, i.e. all pairs)
+    words : int, optional (default=4)
+        uint64 words per node, i.e. 64 * words sources per batch
 
     Returns
     -------
-    function
-        This function returns a callable that accepts exactly three inputs:
-        a node, an node adjacent to the first one, and the edge attribute
-        dictionary for the eedge joining those nodes. That function returns
-        a number representing the weight of an edge.
+    dict
+        Dictionary with:
+        - 'sources': list of sources (rows of 'hops')
+        - 'nodes': list of nodes (columns of 'hops')
+        - 'hops': int32 array (len(sources), num_nodes) of hop
+          distances, -1 where the node is unreachable
+        - 'level_counts': dict mapping source -> list with the number
+          of nodes on each level (level 0 is the source)
+        - 'eccentricity': dict mapping source -> largest level reached
 
-    If `G` is a multigraph, and `weight` is not callable, the
-    minimum edge weight over all parallel edges is returned. If any edge
-    does not have an attribute with key `weight`, it is assumed to
-    have weight one.
+    Raises
+    ------
+    Exception
+        If a source is not in graph
+    """
+    csr = G.para_csr()
+    if sources is None:
+        sources = list(csr.nos)
+    for source in sources:
+        if source not in csr.indice:
+            raise Exception(f"Node {source} not found in graph")
+    if words < 1:
+        raise ValueError("words must be at least 1")
+
+    reverse = csr.transposta() if csr.dirigido else csr
+    num_nodes = len(csr.nos)
+    hops = np.full((len(sources), num_nodes), -1, dtype=np.int32)
+    level_counts = {}
+    eccentricity = {}
+    batch_size = 64 * words
+
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start:start + batch_size]
+        ids = np.array([csr.indice[s] for s in batch], dtype=np.int64)
+        hops[start + np.arange(len(batch)), ids] = 0
+        counts = [[1] for _ in batch]
+
+        for level, nodes_reached, unpacked in _bitset_bfs_levels(reverse, ids, words):
+            rows, cols = np.nonzero(unpacked)
+            hops[start + cols, nodes_reached[rows]] = level
+            per_source = unpacked.sum(axis=0)
+            for j in np.flatnonzero(per_source):
+                counts[j].append(int(per_source[j]))
+
+        for j, source in enumerate(batch):
+            level_counts[source] = counts[j]
+            eccentricity[source] = len(counts[j]) - 1
+
+    return {
+        'sources': list(sources),
+        'nodes': list(csr.nos),
+        'hops': hops,
+        'level_counts': level_counts,
+        'eccentricity': eccentricity
+    }
+
+
+# ===================================================================
+# DFS (Depth-First Search)
+# ===================================================================
 
+# Edge type for each code stored by dfs(..., edge_mode='array')
+DFS_EDGE_TYPES = ('unexamined', 'tree_edge', 'back_edge', 'forward_edge', 'cross_edge')
+
+def _dfs_iterative(G, roots, edge_mode='dict'):
     """
-    if callable(weight):
-        return weight
-    # If the weight keyword argument is not callable, we assume it is a
-    # string representing the edge attribute containing the weight of
-    # the edge.
-    if G.is_multigraph():
-        return lambda u, v, d: min(attr.get(weight, 1) for attr in d.values())
-    return lambda u, v, data: data.get(weight, 1)
+    Explicit-stack DFS over the CSR view of `G`, started from each root
+    in turn (roots already visited are skipped).
+
+    Produces exactly the same traversal as the recursive formulation: a
+    node's edges are examined in get_vizinhos order, and each edge is
+    classified when it is examined. Timestamps live in integer arrays
+    indexed by node id; the stack holds node ids and every node keeps a
+    cursor to its next unexamined CSR slot, so the depth is bounded only
+    by memory, never by the recursion limit.
+
+    `edge_mode` selects how classifications are recorded: 'dict' maps
+    (node, neighbor) -> type name, 'counts' keeps one counter per type
+    and 'array' is a bytearray with one DFS_EDGE_TYPES code per CSR slot.
+
+    Returns the CSR, the discovery/finish time arrays (0 = not yet
+    set), the parent array (-1 = root), the discovery order, the finish
+    order, the cycle flag and the recorded edge classification.
+    """
+    if edge_mode not in ('dict', 'counts', 'array'):
+        raise ValueError(f"edge_mode must be 'dict', 'counts' or 'array', got {edge_mode!r}")
+
+    csr = G.para_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    nodes = csr.nos
+    num_nodes = len(nodes)
+
+    discovery = array('q', bytes(8 * num_nodes))
+    finish = array('q', bytes(8 * num_nodes))
+    parent = array('q', [-1]) * num_nodes
+    cursor = array('q', indptr[:-1]) if num_nodes else array('q')
+    order = array('q')
+    finished = array('q')
+    has_cycle = False
+    time = 0
+
+    as_dict = edge_mode == 'dict'
+    as_array = edge_mode == 'array'
+    if as_dict:
+        edge_classification = {}
+    elif as_array:
+        edge_classification = bytearray(len(indices))
+    else:
+        edge_classification = [0] * len(DFS_EDGE_TYPES)
+
+    for root in roots:
+        r = csr.indice[root]
+        if discovery[r]:
+            continue
 
-def _dijkstra_multisource(
-    G, sources, weight, pred=None, paths=None, cutoff=None, target=None
-):
-    """Uses Dijkstra's algorithm to find shortest weighted paths
+        time += 1
+        discovery[r] = time
+        order.append(r)
+        stack = [r]
 
-    Parameters
-    ----------
-    G : NetworkX graph
+        while stack:
+            v = stack[-1]
+            slot = cursor[v]
+            if slot < indptr[v + 1]:
+                cursor[v] = slot + 1
+                u = indices[slot]
 
-    sources : non-empty iterable of nodes
-        Starting nodes for paths. If this is just an iterable containing
-        a single node, then all paths computed by this function will
-        start from that node. If there are two or more nodes in this
-        iterable, the computed paths may begin from any one of the start
-        nodes.
+                if not discovery[u]:
+                    # Tree edge
+                    code = 1
+                    parent[u] = v
+                    time += 1
+                    discovery[u] = time
+                    order.append(u)
+                    stack.append(u)
+
+                elif not finish[u]:
+                    # Back edge (cycle detected)
+                    code = 2
+                    has_cycle = True
 
-    weight: function
-        Function with (u, v, data) input that returns that edge's weight
-        or None to indicate a hidden edge
+                elif discovery[u] > discovery[v]:
+                    # Forward edge
+                    code = 3
 
-    pred: dict of lists, optional(default=None)
-        dict to store a list of predecessors keyed by that node
-        If None, predecessors are not stored.
+                else:
+                    # Cross edge
+                    code = 4
 
-    paths: dict, optional (default=None)
-        dict to store the path list from source to each node, keyed by node.
-        If None, paths are not stored.
+                if as_dict:
+                    edge_classification[(nodes[v], nodes[u])] = DFS_EDGE_TYPES[code]
+                elif as_array:
+                    edge_classification[slot] = code
+                else:
+                    edge_classification[code] += 1
+            else:
+                time += 1
+                finish[v] = time
+                finished.append(v)
+                stack.pop()
+
+    return csr, discovery, finish, parent, order, finished, has_cycle, edge_classification
+
+def _dfs_result(csr, discovery, finish, parent, order, finished, has_cycle, edge_classification,
+                edge_mode='dict'):
+    """Converts the arrays of :func:`_dfs_iterative` to the result dict of `edge_mode`."""
+    if edge_mode == 'counts':
+        return {
+            'num_visited': len(order),
+            'has_cycle': has_cycle,
+            'edge_counts': {DFS_EDGE_TYPES[code]: n for code, n in enumerate(edge_classification) if n}
+        }
+
+    nodes = csr.nos
+    return {
+        'visited': {nodes[v] for v in order},
+        'parent': {nodes[v]: (nodes[parent[v]] if parent[v] >= 0 else None) for v in order},
+        'order': [nodes[v] for v in order],
+        'discovery_time': {nodes[v]: discovery[v] for v in order},
+        'finish_time': {nodes[v]: finish[v] for v in finished},
+        'has_cycle': has_cycle,
+        'edge_classification': edge_classification
+    }
 
-    target : node label, optional
-        Ending node for path. Search is halted when target is found.
+def dfs(G, source, edge_mode='dict'):
+    """
+    Depth-First Search algorithm.
 
-    cutoff : integer or float, optional
-        Length (sum of edge weights) at which the search is stopped.
-        If cutoff is provided, only return paths with summed weight <= cutoff.
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search (uses the para_csr method)
+    source : node
+        Starting node for DFS
+    edge_mode : 'dict' | 'counts' | 'array', optional (default='dict')
+        How edge classifications are returned:
+        - 'dict': edge tuple -> edge type, as described below
+        - 'counts': only counts per edge type; see Returns
+        - 'array': bytearray with one code per slot of G.para_csr(),
+          decoded with DFS_EDGE_TYPES (0 = slot never examined)
 
     Returns
     -------
-    distance : dictionary
-        A mapping from node to shortest distance to that node from one
-        of the source nodes.
+    dict
+        Dictionary with:
+        - 'visited': set of visited nodes
+        - 'parent': dict mapping node -> parent in DFS tree
+        - 'order': list of nodes in DFS traversal order
+        - 'discovery_time': dict mapping node -> discovery time
+        - 'finish_time': dict mapping node -> finish time
+        - 'has_cycle': boolean indicating if cycle was detected
+        - 'edge_classification': dict mapping edge tuple -> edge type
+          (tree_edge, back_edge, forward_edge, cross_edge)
+
+        With edge_mode='counts' the dictionary only has 'num_visited',
+        'has_cycle' and 'edge_counts' (edge type -> number of edges), so
+        memory does not grow with the number of edges.
 
     Raises
     ------
-    NodeNotFound
-        If any of `sources` is not in `G`.
+    Exception
+        If source is not in graph
+    ValueError
+        If edge_mode is not one of the above
 
     Notes
     -----
-    The optional predecessor and path dictionaries can be accessed by
-    the caller through the original pred and paths objects passed
-    as arguments. No need to explicitly return pred or paths.
+    The traversal is iterative (see :func:`_dfs_iterative`), so paths
+    longer than Python's recursion limit are handled.
 
+    The 'counts' and 'array' modes classify every edge slot, so each of
+    several parallel edges is counted; in 'dict' mode they share one key
+    and the last classification wins.
     """
-    G_succ = G._adj  # For speed-up (and works for both directed and undirected graphs)
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-    dist = {}  # dictionary of final distances
-    seen = {}
-    # fringe is heapq with 3-tuples (distance,c,node)
-    # use the count c to avoid comparing nodes (may not be able to)
-    c = count()
-    fringe = []
-    for source in sources:
-        seen[source] = 0
-        heappush(fringe, (0, next(c), source))
-    while fringe:
-        (d, _, v) = heappop(fringe)
-        if v in dist:
-            continue  # already searched this node.
-        dist[v] = d
-        if v == target:
-            break
-        for u, e in G_succ[v].items():
-            cost = weight(v, u, e)
-            if cost is None:
+    return _dfs_result(*_dfs_iterative(G, [source], edge_mode), edge_mode=edge_mode)
+
+def dfs_full(G, edge_mode='dict'):
+    """
+    Complete DFS traversal of all components in graph.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search
+    edge_mode : 'dict' | 'counts' | 'array', optional (default='dict')
+        Same as in dfs()
+
+    Returns
+    -------
+    dict
+        Dictionary with same structure as dfs(), but covering all nodes
+    """
+    return _dfs_result(*_dfs_iterative(G, G.get_todos_os_nos(), edge_mode), edge_mode=edge_mode)
+
+
+# ===================================================================
+# SCC (Strongly Connected Components)
+# ===================================================================
+
+def strongly_connected_components(G):
+    """
+    Tarjan's strongly connected components, iterative, over the CSR view.
+
+    Same explicit-stack scheme as _dfs_iterative: every node keeps a
+    cursor to its next unexamined CSR slot, and index/lowlink values live
+    in integer arrays, so it runs in O(V + E) with no recursion.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method). On an undirected graph the
+        components are the connected components.
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'nodes': list of nodes (positions of 'component')
+        - 'component': int64 array with the component id of each node
+        - 'components': list with the nodes of each component, by id
+        - 'num_components': number of components
+        - 'condensation': directed Grafo with one node per component id
+          and an edge c1 -> c2 when some edge goes from c1 to c2; parallel
+          edges are merged keeping the smallest weight
+
+    Notes
+    -----
+    Component ids follow a topological order of the condensation DAG:
+    every condensation edge goes from a smaller id to a larger one.
+    """
+    csr = G.para_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    num_nodes = len(csr.nos)
+
+    index = array('q', [-1]) * num_nodes
+    lowlink = array('q', bytes(8 * num_nodes))
+    on_stack = bytearray(num_nodes)
+    tarjan_id = array('q', [-1]) * num_nodes
+    cursor = array('q', indptr[:-1]) if num_nodes else array('q')
+    stack = []
+    counter = 0
+    num_components = 0
+
+    for root in range(num_nodes):
+        if index[root] >= 0:
+            continue
+
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_stack = [root]
+
+        while call_stack:
+            v = call_stack[-1]
+            slot = cursor[v]
+            if slot < indptr[v + 1]:
+                cursor[v] = slot + 1
+                w = indices[slot]
+                if index[w] < 0:
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    call_stack.append(w)
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
                 continue
-            vu_dist = dist[v] + cost
-            if cutoff is not None:
-                if vu_dist > cutoff:
+
+            # v is finished: propagate its lowlink and close its component
+            call_stack.pop()
+            if call_stack:
+                u = call_stack[-1]
+                if lowlink[v] < lowlink[u]:
+                    lowlink[u] = lowlink[v]
+
+            if lowlink[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    tarjan_id[w] = num_components
+                    if w == v:
+                        break
+                num_components += 1
+
+    # Tarjan closes components in reverse topological order
+    component = (num_components - 1) - np.frombuffer(tarjan_id, dtype=np.int64) \
+        if num_nodes else np.empty(0, dtype=np.int64)
+
+    components = [[] for _ in range(num_components)]
+    for v, c in enumerate(component.tolist()):
+        components[c].append(csr.nos[v])
+
+    condensation = Grafo(dirigido=True)
+    for c in range(num_components):
+        condensation.add_node(c)
+
+    tails = component[csr.origens()]
+    heads = component[csr.indices]
+    between = tails != heads
+    tails, heads, weights = tails[between], heads[between], csr.pesos[between]
+    if tails.size:
+        order = np.lexsort((weights, heads, tails))
+        tails, heads, weights = tails[order], heads[order], weights[order]
+        first = np.ones(tails.size, dtype=bool)
+        first[1:] = (tails[1:] != tails[:-1]) | (heads[1:] != heads[:-1])
+        for c1, c2, w in zip(tails[first].tolist(), heads[first].tolist(), weights[first].tolist()):
+            condensation.add_edge(c1, c2, w)
+
+    return {
+        'nodes': list(csr.nos),
+        'component': component,
+        'components': components,
+        'num_components': num_components,
+        'condensation': condensation
+    }
+
+
+# ===================================================================
+# BRIDGES, ARTICULATION POINTS AND BICONNECTED COMPONENTS
+# ===================================================================
+
+def bridges_and_articulation_points(G):
+    """
+    Bridges, articulation points and biconnected components of an
+    undirected graph, in O(V + E) (Hopcroft-Tarjan lowpoints).
+
+    Same explicit-stack scheme as _dfs_iterative, so there is no
+    recursion. The edge to a node's DFS parent is skipped only once:
+    with parallel edges the second copy counts as a back edge, so a
+    doubled connection is never reported as a bridge.
+
+    Parameters
+    ----------
+    G : Graph object
+        An undirected graph (uses the para_csr method)
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'bridges': list of (u, v) edges whose removal disconnects the
+          graph, u being the endpoint closer to the DFS root
+        - 'articulation_points': list of nodes whose removal disconnects
+          the graph, in node insertion order
+        - 'biconnected_components': list of node lists, one per
+          biconnected component (isolated nodes and self-loops are left
+          out)
+
+    Raises
+    ------
+    ValueError
+        If G is directed
+    """
+    if G.dirigido:
+        raise ValueError("bridges_and_articulation_points requires an undirected graph")
+
+    csr = G.para_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    nodes = csr.nos
+    num_nodes = len(nodes)
+
+    discovery = array('q', bytes(8 * num_nodes))
+    low = array('q', bytes(8 * num_nodes))
+    parent = array('q', [-1]) * num_nodes
+    skipped_parent = bytearray(num_nodes)
+    is_articulation = bytearray(num_nodes)
+    cursor = array('q', indptr[:-1]) if num_nodes else array('q')
+    edge_stack = []
+    bridges = []
+    components = []
+    time = 0
+
+    for root in range(num_nodes):
+        if discovery[root]:
+            continue
+
+        time += 1
+        discovery[root] = low[root] = time
+        root_children = 0
+        stack = [root]
+
+        while stack:
+            v = stack[-1]
+            slot = cursor[v]
+            if slot < indptr[v + 1]:
+                cursor[v] = slot + 1
+                w = indices[slot]
+                if w == v:
+                    continue
+                if w == parent[v] and not skipped_parent[v]:
+                    skipped_parent[v] = 1
                     continue
-            if u in dist:
-                u_dist = dist[u]
-                if vu_dist < u_dist:
-                    raise ValueError("Contradictory paths found:", "negative weights?")
-                elif pred is not None and vu_dist == u_dist:
-                    pred[u].append(v)
-            elif u not in seen or vu_dist < seen[u]:
-                seen[u] = vu_dist
-                heappush(fringe, (vu_dist, next(c), u))
-                if paths is not None:
-                    paths[u] = paths[v] + [u]
-                if pred is not None:
-                    pred[u] = [v]
-            elif vu_dist == seen[u]:
-                if pred is not None:
-                    pred[u].append(v)
 
-    # The optional predecessor and path dictionaries can be accessed
-    # by the caller via the pred and paths objects passed as arguments.
-    return dist
+                if not discovery[w]:
+                    # Tree edge
+                    parent[w] = v
+                    if v == root:
+                        root_children += 1
+                    time += 1
+                    discovery[w] = low[w] = time
+                    edge_stack.append((v, w))
+                    stack.append(w)
+                elif discovery[w] < discovery[v]:
+                    # Back edge to an ancestor (or a parallel edge to the parent)
+                    if discovery[w] < low[v]:
+                        low[v] = discovery[w]
+                    edge_stack.append((v, w))
+                # discovery[w] > discovery[v]: seen from w already
+                continue
 
-def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None, target=None):
-    """Uses Dijkstra's algorithm to find shortest weighted paths from a
-    single source.
+            stack.pop()
+            p = parent[v]
+            if p < 0:
+                continue
+            if low[v] < low[p]:
+                low[p] = low[v]
+
+            if low[v] >= discovery[p]:
+                # p separates v's subtree: its edges form a biconnected component
+                if p != root:
+                    is_articulation[p] = 1
+                component = set()
+                while True:
+                    a, b = edge_stack.pop()
+                    component.add(a)
+                    component.add(b)
+                    if a == p and b == v:
+                        break
+                components.append([nodes[x] for x in sorted(component)])
+
+                if low[v] > discovery[p]:
+                    bridges.append((nodes[p], nodes[v]))
+
+        if root_children >= 2:
+            is_articulation[root] = 1
 
-    This is a convenience function for :func:`_dijkstra_multisource`
-    with all the arguments the same, except the keyword argument
-    `sources` set to ``[source]``.
+    return {
+        'bridges': bridges,
+        'articulation_points': [nodes[v] for v in range(num_nodes) if is_articulation[v]],
+        'biconnected_components': components
+    }
 
+
+# ===================================================================
+# K-CORE DECOMPOSITION
+# ===================================================================
+
+def core_number(G):
     """
-    return _dijkstra_multisource(
-        G, [source], weight, pred=pred, paths=paths, cutoff=cutoff, target=target
-    )
+    Core number of every node (Batagelj and Zaversnik), in O(V + E).
+
+    The k-core is the largest subgraph where every node has degree at
+    least k; the core number of a node is the largest k whose k-core
+    contains it. Nodes are kept in an array sorted by current degree with
+    the start of each degree bucket, so taking the node of smallest degree
+    and decrementing a neighbor's degree are O(1) swaps.
+
+    On directed graphs the degree is in-degree plus out-degree, as in
+    NetworkX. Parallel edges count once per edge and self-loops are
+    ignored.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+
+    Returns
+    -------
+    dict
+        Dictionary mapping node -> core number
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if num_nodes == 0:
+        return {}
+
+    views = [csr, csr.transposta()] if csr.dirigido else [csr]
+    degree = np.zeros(num_nodes, dtype=np.int64)
+    for view in views:
+        tails = view.origens()
+        degree += np.bincount(tails[tails != view.indices], minlength=num_nodes)
+    adjacency = [(view.indptr.tolist(), view.indices.tolist()) for view in views]
+
+    # vert: nodes sorted by degree; pos: index of each node in vert;
+    # bucket_start[d]: first index of the nodes of degree d
+    vert = np.argsort(degree, kind='stable').tolist()
+    pos = [0] * num_nodes
+    for i, v in enumerate(vert):
+        pos[v] = i
+    bucket_start = np.searchsorted(np.asarray(degree)[vert], np.arange(int(degree.max()) + 1)).tolist()
+    degree = degree.tolist()
+
+    for i in range(num_nodes):
+        v = vert[i]
+        for indptr, indices in adjacency:
+            for slot in range(indptr[v], indptr[v + 1]):
+                u = indices[slot]
+                du = degree[u]
+                if du > degree[v]:
+                    # Swap u with the first node of its bucket, then shrink the bucket
+                    pu, pw = pos[u], bucket_start[du]
+                    w = vert[pw]
+                    if u != w:
+                        vert[pu], vert[pw] = w, u
+                        pos[u], pos[w] = pw, pu
+                    bucket_start[du] += 1
+                    degree[u] = du - 1
+
+    return dict(zip(csr.nos, degree))
+
+
+def k_core(G, k=None, core=None):
+    """
+    The k-core of G: the subgraph induced by the nodes of core number >= k.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph
+    k : int, optional
+        Core order (default: the largest core number, the innermost core)
+    core : dict, optional
+        Core numbers already computed by core_number(G)
+
+    Returns
+    -------
+    Grafo
+        New graph, directed like G, with the nodes of the k-core and every
+        edge of G between two of them (weights kept)
+    """
+    if core is None:
+        core = core_number(G)
+    if k is None:
+        k = max(core.values(), default=0)
+
+    subgrafo = Grafo(dirigido=G.dirigido)
+    ordem = {}
+    for no in G.get_todos_os_nos():
+        if core[no] >= k:
+            ordem[no] = len(ordem)
+            subgrafo.add_node(no)
+
+    for no in ordem:
+        lacos = 0
+        for vizinho, peso in G.get_vizinhos(no):
+            if vizinho not in ordem:
+                continue
+            if G.dirigido or ordem[no] < ordem[vizinho]:
+                subgrafo.add_edge(no, vizinho, peso)
+            elif vizinho == no:
+                # Undirected self-loops are listed twice
+                lacos += 1
+                if lacos % 2 == 1:
+                    subgrafo.add_edge(no, vizinho, peso)
+    return subgrafo
+
+
+# ===================================================================
+# TRIANGLES AND EGO NETWORKS
+# ===================================================================
+
+def _simple_edge_multiplicities(csr):
+    """
+    Edges of the underlying undirected graph: arrays (a, b, multiplicity)
+    with a < b, plus the number of self-loops of each node.
+
+    Every undirected edge fills two CSR slots, and so does every directed
+    edge once the transposed slots are added.
+    """
+    num_nodes = len(csr.nos)
+    views = [csr, csr.transposta()] if csr.dirigido else [csr]
+    tails = np.concatenate([view.origens() for view in views])
+    heads = np.concatenate([view.indices for view in views])
+
+    loop = tails == heads
+    self_loops = np.bincount(tails[loop], minlength=num_nodes) // 2
+
+    low = np.minimum(tails[~loop], heads[~loop])
+    high = np.maximum(tails[~loop], heads[~loop])
+    keys, counts = np.unique(low * num_nodes + high, return_counts=True)
+    return keys // num_nodes, keys % num_nodes, counts // 2, self_loops
+
+
+def _triangle_sums_forward(num_nodes, a, b, multiplicity, degree):
+    """
+    Per node: triangles through it, and the sum of the multiplicities of
+    the edges opposite to it in those triangles.
+
+    Forward algorithm: each edge is oriented from the endpoint of smaller
+    (degree, id) to the larger one, so out-lists have O(sqrt(E)) nodes and
+    every triangle is found exactly once, at its lowest-ranked edge, by
+    intersecting two out-lists.
+    """
+    rank = np.empty(num_nodes, dtype=np.int64)
+    rank[np.lexsort((np.arange(num_nodes), degree))] = np.arange(num_nodes)
+    forward = rank[a] < rank[b]
+    lower = np.where(forward, a, b).tolist()
+    upper = np.where(forward, b, a).tolist()
+
+    out = [{} for _ in range(num_nodes)]
+    for u, w, m in zip(lower, upper, multiplicity.tolist()):
+        out[u][w] = m
+
+    triangles = [0] * num_nodes
+    opposite = [0] * num_nodes
+    for u in range(num_nodes):
+        out_u = out[u]
+        for w, m_uw in out_u.items():
+            out_w = out[w]
+            for x in out_u.keys() & out_w.keys():
+                triangles[u] += 1
+                triangles[w] += 1
+                triangles[x] += 1
+                opposite[u] += out_w[x]
+                opposite[w] += out_u[x]
+                opposite[x] += m_uw
+    return np.array(triangles, dtype=np.int64), np.array(opposite, dtype=np.int64)
+
+
+def _triangle_sums_matrix(num_nodes, a, b, multiplicity):
+    """ Same sums as _triangle_sums_forward from dense adjacency matrices: diag(B B B) / 2 and diag(B M B) / 2. """
+    # float64 products go through BLAS and stay exact for counts below 2^53
+    counts = np.zeros((num_nodes, num_nodes))
+    counts[a, b] = multiplicity
+    counts[b, a] = multiplicity
+    adjacency = (counts > 0).astype(np.float64)
+    triangles = ((adjacency @ adjacency) * adjacency).sum(axis=1) / 2
+    opposite = ((adjacency @ counts) * adjacency).sum(axis=1) / 2
+    return np.rint(triangles).astype(np.int64), np.rint(opposite).astype(np.int64)
+
+
+def ego_network_metrics(G, method='auto', matrix_threshold=200):
+    """
+    Radius-1 ego network metrics and local clustering of every node, from
+    triangle counts.
+
+    The ego network of v is v, its neighbors and every edge between them.
+    Its edges are the edges at v plus the edges between two neighbors,
+    one per triangle through v (weighted by the multiplicity of parallel
+    edges), plus self-loops on those nodes, so no ego network is ever
+    scanned. Directed graphs use the underlying undirected graph.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    method : {'auto', 'forward', 'matrix'}, optional (default='auto')
+        'forward': degree-ordered forward algorithm, O(E^1.5);
+        'matrix': dense matrix products, O(V^3) but vectorized;
+        'auto': 'matrix' up to `matrix_threshold` nodes, else 'forward'
+    matrix_threshold : int, optional (default=200)
+        Largest graph for which 'auto' picks 'matrix'
+
+    Returns
+    -------
+    dict
+        Dictionary with arrays aligned with 'nodes':
+        - 'nodes': list of nodes
+        - 'degree': number of distinct neighbors (excluding the node)
+        - 'self_loops': number of self-loops
+        - 'triangles': number of triangles through the node
+        - 'ego_order': nodes of the ego network (degree + 1)
+        - 'ego_size': edges of G inside the ego network
+        - 'ego_density': ego_size over the maximum possible, 0 for a
+          single node; (n(n-1)/2) undirected, n(n-1) directed
+        - 'clustering': triangles / (degree (degree - 1) / 2), 0 when
+          degree < 2
+
+    Raises
+    ------
+    ValueError
+        If `method` is not 'auto', 'forward' or 'matrix'
+    """
+    if method not in ('auto', 'forward', 'matrix'):
+        raise ValueError(f"method must be 'auto', 'forward' or 'matrix', got {method!r}")
+
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    a, b, multiplicity, self_loops = _simple_edge_multiplicities(csr)
+
+    degree = np.bincount(a, minlength=num_nodes) + np.bincount(b, minlength=num_nodes)
+    incident = np.bincount(a, weights=multiplicity, minlength=num_nodes) + \
+        np.bincount(b, weights=multiplicity, minlength=num_nodes)
+    neighbor_loops = np.bincount(a, weights=self_loops[b], minlength=num_nodes) + \
+        np.bincount(b, weights=self_loops[a], minlength=num_nodes)
+
+    if method == 'matrix' or (method == 'auto' and num_nodes <= matrix_threshold):
+        triangles, opposite = _triangle_sums_matrix(num_nodes, a, b, multiplicity)
+    else:
+        triangles, opposite = _triangle_sums_forward(num_nodes, a, b, multiplicity, degree)
+
+    ego_order = degree + 1
+    ego_size = (incident + self_loops + neighbor_loops).astype(np.int64) + opposite
+    pairs = ego_order * (ego_order - 1) // (1 if csr.dirigido else 2)
+    ego_density = np.divide(ego_size, pairs, out=np.zeros(num_nodes), where=pairs > 0)
+    possible = degree * (degree - 1) // 2
+    clustering = np.divide(triangles, possible, out=np.zeros(num_nodes), where=possible > 0)
+
+    return {
+        'nodes': list(csr.nos),
+        'degree': degree,
+        'self_loops': self_loops,
+        'triangles': triangles,
+        'ego_order': ego_order,
+        'ego_size': ego_size,
+        'ego_density': ego_density,
+        'clustering': clustering
+    }
+
+
+def _ego_counts(indptr, indices, weights, num_nodes, sources, radius, weighted):
+    """
+    Nodes and edge slots of the ball of `radius` around each source, by
+    truncated BFS (hops) or Dijkstra (weights).
+
+    Buffers are shared across sources: membership is a stamp per node
+    (the source position + 1, so it never needs clearing) and tentative
+    distances are reset through the list of touched nodes.
+    """
+    order = [0] * len(sources)
+    slots = [0] * len(sources)
+    stamp = [0] * num_nodes
+    dist = [float('inf')] * num_nodes
+    infinity = float('inf')
+
+    for position, s in enumerate(sources):
+        mark = position + 1
+        members = []
+        if weighted:
+            dist[s] = 0.0
+            touched = [s]
+            fringe = [(0.0, s)]
+            while fringe:
+                d, u = heappop(fringe)
+                if stamp[u] == mark:
+                    continue
+                stamp[u] = mark
+                members.append(u)
+                for slot in range(indptr[u], indptr[u + 1]):
+                    w = indices[slot]
+                    if stamp[w] == mark:
+                        continue
+                    new_dist = d + weights[slot]
+                    if new_dist <= radius and new_dist < dist[w]:
+                        if dist[w] == infinity:
+                            touched.append(w)
+                        dist[w] = new_dist
+                        heappush(fringe, (new_dist, w))
+            for v in touched:
+                dist[v] = infinity
+        else:
+            stamp[s] = mark
+            members.append(s)
+            frontier = [s]
+            for _ in range(radius):
+                next_frontier = []
+                for u in frontier:
+                    for slot in range(indptr[u], indptr[u + 1]):
+                        w = indices[slot]
+                        if stamp[w] != mark:
+                            stamp[w] = mark
+                            next_frontier.append(w)
+                if not next_frontier:
+                    break
+                members.extend(next_frontier)
+                frontier = next_frontier
+
+        inside = 0
+        for u in members:
+            for slot in range(indptr[u], indptr[u + 1]):
+                if stamp[indices[slot]] == mark:
+                    inside += 1
+        order[position] = len(members)
+        slots[position] = inside
+
+    return order, slots
+
+
+# Per-process CSR lists used by the ego network workers
+_EGO_SHARED = {}
+
+def _ego_worker_init(indptr, indices, weights, num_nodes, radius, weighted):
+    _EGO_SHARED.update(indptr=indptr, indices=indices, weights=weights,
+                       num_nodes=num_nodes, radius=radius, weighted=weighted)
+
+def _ego_worker(sources):
+    shared = _EGO_SHARED
+    return _ego_counts(shared['indptr'], shared['indices'], shared['weights'],
+                       shared['num_nodes'], sources, shared['radius'], shared['weighted'])
+
+def ego_networks(G, radius=1, weighted=False, sources=None, workers=1):
+    """
+    Ego networks of any radius: for each source, the nodes within `radius`
+    hops (or within distance `radius` when `weighted`) and every edge of
+    G between them.
+
+    One truncated BFS or Dijkstra per source, with buffers reused across
+    sources; with several workers the sources are split in contiguous
+    chunks across a process pool. On directed graphs the ball follows
+    out-edges (the nodes the source reaches) and edges keep their
+    direction. For radius 1 on undirected graphs, ego_network_metrics
+    gives the same counts from triangles, faster.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    radius : int or float, optional (default=1)
+        Maximum number of hops, or maximum distance when `weighted`
+    weighted : bool, optional (default=False)
+        Use edge weights as lengths and `radius` as a distance
+    sources : list of nodes, optional
+        Centers of the ego networks (default: every node)
+    workers : int, optional (default=1)
+        Number of processes
+
+    Returns
+    -------
+    dict
+        Dictionary with arrays aligned with 'nodes':
+        - 'nodes': list of sources
+        - 'ego_order': nodes of each ego network (the source included)
+        - 'ego_size': edges of G inside it (parallel edges and self-loops
+          included)
+        - 'ego_density': ego_size over the maximum possible, 0 for a
+          single node; (n(n-1)/2) undirected, n(n-1) directed
+
+    Raises
+    ------
+    Exception
+        If a source is not in graph
+    ValueError
+        If `radius` is negative, or `weighted` and the graph has a
+        negative weight
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if sources is None:
+        sources = list(csr.nos)
+    for source in sources:
+        if source not in csr.indice:
+            raise Exception(f"Node {source} not found in graph")
+    if radius < 0:
+        raise ValueError(f"radius must be non-negative, got {radius}")
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+    if not weighted:
+        radius = int(radius)
+
+    ids = [csr.indice[s] for s in sources]
+    args = (csr.indptr.tolist(), csr.indices.tolist(), csr.pesos.tolist(), num_nodes, radius, weighted)
+
+    if workers > 1 and len(ids) > 1:
+        chunk_size = -(-len(ids) // (workers * 4))
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        order, slots = [], []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_ego_worker_init,
+                                 initargs=args) as pool:
+            for part_order, part_slots in pool.map(_ego_worker, chunks):
+                order += part_order
+                slots += part_slots
+    else:
+        order, slots = _ego_counts(*args[:4], ids, radius, weighted)
+
+    ego_order = np.array(order, dtype=np.int64)
+    ego_size = np.array(slots, dtype=np.int64)
+    if not csr.dirigido:
+        ego_size //= 2  # every undirected edge (and self-loop) fills two slots
+    pairs = ego_order * (ego_order - 1) // (1 if csr.dirigido else 2)
+    ego_density = np.divide(ego_size, pairs, out=np.zeros(len(ids)), where=pairs > 0)
+
+    return {
+        'nodes': list(sources),
+        'ego_order': ego_order,
+        'ego_size': ego_size,
+        'ego_density': ego_density
+    }
+
+
+# ===================================================================
+# DIAMETER AND ECCENTRICITIES
+# ===================================================================
+
+def _largest_component_csr(G):
+    """
+    CSR lists of the subgraph induced by the largest connected component
+    (largest strongly connected component on directed graphs), with its
+    transpose on directed graphs (None otherwise).
+
+    Returns (members, forward, reverse): members holds the CSR ids of
+    the component's nodes, and each CSR is (indptr, indices, weights)
+    over the positions in members.
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if csr.dirigido:
+        component = strongly_connected_components(G)['component']
+    else:
+        ids = G.get_componentes()
+        component = np.array([ids[no] for no in csr.nos], dtype=np.int64)
+    largest = np.argmax(np.bincount(component))
+    members = np.flatnonzero(component == largest)
+
+    position = np.full(num_nodes, -1, dtype=np.int64)
+    position[members] = np.arange(len(members))
+    tails, heads = position[csr.origens()], position[csr.indices]
+    keep = (tails >= 0) & (heads >= 0)
+    tails, heads, weights = tails[keep], heads[keep], csr.pesos[keep]
+
+    def lists(tails, heads, weights):
+        indptr = np.zeros(len(members) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=len(members)), out=indptr[1:])
+        return indptr.tolist(), heads.tolist(), weights.tolist()
+
+    forward = lists(tails, heads, weights)  # slots stay sorted by tail
+    reverse = None
+    if csr.dirigido:
+        order = np.argsort(heads, kind='stable')
+        reverse = lists(heads[order], tails[order], weights[order])
+    return members, forward, reverse
+
+
+def _distances_from(adjacency, source, weighted):
+    """ Distances (np.inf when unreachable) and parents (-1) of a BFS or Dijkstra from `source`. """
+    indptr, indices, weights = adjacency
+    num_nodes = len(indptr) - 1
+    dist = [float('inf')] * num_nodes
+    parent = [-1] * num_nodes
+    dist[source] = 0.0
+    if weighted:
+        fringe = [(0.0, source)]
+        while fringe:
+            d, u = heappop(fringe)
+            if d > dist[u]:
+                continue
+            for slot in range(indptr[u], indptr[u + 1]):
+                w = indices[slot]
+                new_dist = d + weights[slot]
+                if new_dist < dist[w]:
+                    dist[w] = new_dist
+                    parent[w] = u
+                    heappush(fringe, (new_dist, w))
+    else:
+        frontier = [source]
+        level = 0.0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for u in frontier:
+                for slot in range(indptr[u], indptr[u + 1]):
+                    w = indices[slot]
+                    if dist[w] == float('inf'):
+                        dist[w] = level
+                        parent[w] = u
+                        next_frontier.append(w)
+            frontier = next_frontier
+    return np.array(dist), parent
+
+
+def _path_midpoint(dist, parent, end):
+    """ Node of the search-tree path to `end` at about half of its distance. """
+    half = dist[end] / 2
+    node = end
+    while parent[node] >= 0 and dist[node] > half:
+        node = parent[node]
+    return node
+
+
+def _component_result(G, members, values):
+    """ Maps positions in the component back to node names. """
+    nodes = G.para_csr().nos
+    return [nodes[members[i]] for i in values]
+
+
+def diameter(G, weighted=False):
+    """
+    Exact diameter with few searches: iFUB (Crescenzi et al.) started
+    from a 4-sweep center; its directed version on directed graphs.
+
+    With u a central node, every pair (x, y) has d(x, y) <= d(x, u) +
+    d(u, y). Nodes are processed by decreasing d(x, u) (searching forward
+    from x) and decreasing d(u, y) (searching backward to y); once the
+    best eccentricity found is at least twice the next distance, no
+    unprocessed pair can be longer. On real networks this usually stops
+    after a small fraction of the n searches of the naive method.
+
+    The diameter is taken inside the largest connected component (the
+    largest strongly connected component on directed graphs), since it
+    is infinite otherwise.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    weighted : bool, optional (default=False)
+        Use edge weights as lengths instead of hop counts
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'diameter': the diameter (hops are ints)
+        - 'endpoints': (x, y), a pair at that distance
+        - 'num_searches': BFS/Dijkstra runs used
+        - 'component_size': nodes in the component
+
+    Raises
+    ------
+    ValueError
+        If the graph is empty, or `weighted` and it has a negative weight
+    """
+    csr = G.para_csr()
+    if len(csr.nos) == 0:
+        raise ValueError("diameter is not defined for an empty graph")
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    members, forward, reverse = _largest_component_csr(G)
+    indptr = forward[0]
+    degree = np.diff(indptr)
+    searches = 0
+
+    def search(adjacency, source):
+        nonlocal searches
+        searches += 1
+        return _distances_from(adjacency, source, weighted)
+
+    start = int(np.argmax(degree))
+    best, endpoints = 0.0, (start, start)
+
+    if reverse is None:
+        # 4-sweep: two double sweeps, each restarted from the middle of the last path found
+        for _ in range(2):
+            dist, _ = search(forward, start)
+            a = int(np.argmax(dist))
+            dist, parent = search(forward, a)
+            b = int(np.argmax(dist))
+            if dist[b] > best:
+                best, endpoints = dist[b], (a, b)
+            start = _path_midpoint(dist, parent, b)
+        from_u, _ = search(forward, start)
+        to_u = from_u
+    else:
+        from_u, _ = search(forward, start)
+        to_u, _ = search(reverse, start)
+
+    if from_u.max() > best:
+        best, endpoints = from_u.max(), (start, int(np.argmax(from_u)))
+    if to_u.max() > best:
+        best, endpoints = to_u.max(), (int(np.argmax(to_u)), start)
+
+    # (distance to/from u, node, True when the node needs a forward search)
+    if reverse is None:
+        items = [(d, x, True) for x, d in enumerate(from_u.tolist())]
+    else:
+        items = [(d, x, True) for x, d in enumerate(to_u.tolist())] + \
+                [(d, y, False) for y, d in enumerate(from_u.tolist())]
+    items.sort(key=lambda item: item[0], reverse=True)
+
+    for value, x, outgoing in items:
+        if best >= 2 * value:
+            break
+        if outgoing:
+            dist, _ = search(forward, x)
+            if dist.max() > best:
+                best, endpoints = dist.max(), (x, int(np.argmax(dist)))
+        else:
+            dist, _ = search(reverse, x)
+            if dist.max() > best:
+                best, endpoints = dist.max(), (int(np.argmax(dist)), x)
+
+    return {
+        'diameter': float(best) if weighted else int(best),
+        'endpoints': tuple(_component_result(G, members, endpoints)),
+        'num_searches': searches,
+        'component_size': len(members)
+    }
+
+
+def eccentricities(G, weighted=False):
+    """
+    Exact eccentricity of every node with the bounding-eccentricities
+    algorithm (Takes and Kosters).
+
+    Every node keeps a lower and an upper bound. A search from v (and to
+    v, on directed graphs) fixes ecc(v) and tightens every other w with
+    ecc(w) >= max(d(w, v), ecc(v) - d(v, w)) and ecc(w) <= d(w, v) +
+    ecc(v). Nodes whose bounds meet are settled without a search of their
+    own. The next search alternates between the node with the largest
+    upper bound and the one with the smallest lower bound (ties go to
+    higher degree). On undirected graphs, leaves attached to the same
+    node by equal weights are pruned to one representative.
+
+    Eccentricities are taken inside the largest connected component (the
+    largest strongly connected component on directed graphs, with
+    outgoing distances).
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    weighted : bool, optional (default=False)
+        Use edge weights as lengths instead of hop counts
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'eccentricity': dict mapping node -> eccentricity, for the
+          nodes of the component
+        - 'diameter': largest eccentricity
+        - 'radius': smallest eccentricity
+        - 'center': nodes with eccentricity equal to the radius
+        - 'periphery': nodes with eccentricity equal to the diameter
+        - 'num_searches': BFS/Dijkstra runs used
+        - 'component_size': nodes in the component
+
+    Raises
+    ------
+    ValueError
+        If the graph is empty, or `weighted` and it has a negative weight
+    """
+    csr = G.para_csr()
+    if len(csr.nos) == 0:
+        raise ValueError("eccentricities are not defined for an empty graph")
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    members, forward, reverse = _largest_component_csr(G)
+    num_nodes = len(members)
+    degree = np.diff(forward[0]) + (np.diff(reverse[0]) if reverse is not None else 0)
+
+    lower = np.zeros(num_nodes)
+    upper = np.full(num_nodes, np.inf)
+    open_ = np.ones(num_nodes, dtype=bool)
+    searches = 0
+    pick_upper = True
+
+    # Pruning (undirected): leaves hanging from the same node by equal weights
+    # share one eccentricity, so only the first of each group is bounded
+    twin_of = {}
+    if reverse is None:
+        indptr, indices, weights = forward
+        representative = {}
+        for x in np.flatnonzero(degree == 1).tolist():
+            key = (indices[indptr[x]], weights[indptr[x]])
+            if key[0] != x:
+                twin_of[x] = representative.setdefault(key, x)
+        twin_of = {x: r for x, r in twin_of.items() if x != r}
+        open_[list(twin_of)] = False
+
+    while open_.any():
+        candidates = np.flatnonzero(open_)
+        bound = upper[candidates] if pick_upper else -lower[candidates]
+        best = candidates[bound == bound.max()]
+        v = int(best[np.argmax(degree[best])])
+        pick_upper = not pick_upper
+
+        from_v, _ = _distances_from(forward, v, weighted)
+        searches += 1
+        if reverse is None:
+            to_v = from_v
+        else:
+            to_v, _ = _distances_from(reverse, v, weighted)
+            searches += 1
+        ecc = from_v.max()
+
+        lower[v] = upper[v] = ecc
+        open_[v] = False
+        np.maximum(lower, np.maximum(to_v, ecc - from_v), out=lower, where=open_)
+        np.minimum(upper, to_v + ecc, out=upper, where=open_)
+        # Bounds of weighted sums can differ by rounding only
+        open_ &= upper - lower > 1e-9 * np.maximum(upper, 1.0)
+
+    for x, r in twin_of.items():
+        lower[x] = lower[r]
+    values = lower if weighted else np.rint(lower).astype(np.int64)
+    diameter_value, radius_value = values.max(), values.min()
+    as_number = float if weighted else int
+
+    nodes = _component_result(G, members, range(num_nodes))
+    return {
+        'eccentricity': {no: as_number(e) for no, e in zip(nodes, values.tolist())},
+        'diameter': as_number(diameter_value),
+        'radius': as_number(radius_value),
+        'center': [nodes[i] for i in np.flatnonzero(values == radius_value)],
+        'periphery': [nodes[i] for i in np.flatnonzero(values == diameter_value)],
+        'num_searches': searches,
+        'component_size': num_nodes
+    }
+
+# ===================================================================
+# MINIMUM SPANNING TREE
+# ===================================================================
+
+def kruskal_mst(G):
+    """
+    Minimum spanning forest with Kruskal's algorithm.
+
+    Every edge of the CSR goes into one array, sorted once by weight
+    (stable, so ties keep node order); edges are then taken in that order
+    whenever a union-find says their endpoints are still in different
+    trees. Stops as soon as n - 1 edges are taken.
+
+    Directed graphs are treated as undirected: each arc is an edge and,
+    of the two directions of a route, the cheaper one is used. Self-loops
+    are ignored. On disconnected graphs the result is a forest with one
+    tree per connected component.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'edges': list of (u, v, weight) in the order they were taken
+        - 'total_weight': sum of the edge weights
+        - 'num_trees': number of trees in the forest (connected components)
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+
+    sources = csr.origens()
+    targets = csr.indices
+    # Undirected edges are stored in both directions; keep one of them
+    keep = sources != targets if csr.dirigido else sources < targets
+    sources, targets, weights = sources[keep], targets[keep], csr.pesos[keep]
+    order = np.argsort(weights, kind='stable')
+    sources = sources[order].tolist()
+    targets = targets[order].tolist()
+    weights = weights[order].tolist()
+
+    forest = UnionFind(range(num_nodes))
+    nos = csr.nos
+    edges = []
+    total = 0
+    for a, b, w in zip(sources, targets, weights):
+        if len(edges) == num_nodes - 1:
+            break
+        if forest.union(a, b):
+            edges.append((nos[a], nos[b], w))
+            total += w
+
+    return {'edges': edges, 'total_weight': total, 'num_trees': num_nodes - len(edges)}
+
+
+def prim_mst(G, root=None, d=4):
+    """
+    Minimum spanning forest with Prim's algorithm over an indexed d-ary heap.
+
+    Each node outside the tree sits in the heap at most once, keyed by
+    its cheapest edge to the tree, and the key is lowered in place when a
+    cheaper edge shows up. When the heap empties, the next node not yet
+    in the forest starts a new tree, so disconnected graphs give one tree
+    per connected component.
+
+    Directed graphs are treated as undirected (outgoing and incoming arcs
+    are both scanned). Self-loops are ignored.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    root : node, optional
+        Node the first tree grows from (default: the first node of G)
+    d : int, optional (default=4)
+        Arity of the heap
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'edges': list of (parent, child, weight) in the order the
+          children joined the forest
+        - 'total_weight': sum of the edge weights
+        - 'num_trees': number of trees in the forest (connected components)
+
+    Raises
+    ------
+    Exception
+        If root is not in graph
+    """
+    if root is not None and root not in G:
+        raise Exception(f"Node {root} not found in graph")
+
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    sides = [csr, csr.transposta()] if csr.dirigido else [csr]
+    sides = [(c.indptr.tolist(), c.indices.tolist(), c.pesos.tolist()) for c in sides]
+
+    in_tree = [False] * num_nodes
+    parent = [-1] * num_nodes
+    heap = IndexedDaryHeap(num_nodes, d)
+    nos = csr.nos
+    edges = []
+    total = 0
+    num_trees = 0
+
+    starts = range(num_nodes)
+    if root is not None:
+        starts = [csr.indice[root]] + list(starts)
+    for start in starts:
+        if in_tree[start]:
+            continue
+        num_trees += 1
+        heap.push(start, 0)
+        while heap:
+            v, key = heap.pop()
+            in_tree[v] = True
+            if parent[v] >= 0:
+                edges.append((nos[parent[v]], nos[v], key))
+                total += key
+            for indptr, indices, weights in sides:
+                for slot in range(indptr[v], indptr[v + 1]):
+                    u = indices[slot]
+                    if not in_tree[u] and heap.push_or_decrease(u, weights[slot]):
+                        parent[u] = v
+
+    return {'edges': edges, 'total_weight': total, 'num_trees': num_trees}
+
+# DIJKSTRA'S ALGORITHM
+
+def _weight_function(G, weight):
+    """Returns a function that returns the weight of an edge.
+
+    The returned function is specifically suitable for input to
+    functions :func:`_dijkstra` and :func:`_bellman_ford_relaxation`.
+
+    Parameters
+    ----------
+    G : NetworkX graph.
+
+    weight : string or function
+        If it is callable, `weight` itself is returned. If it is a string,
+        it is assumed to be the name of the edge attribute that represents
+        the weight of an edge. In that case, a function is returned that
+        gets the edge weight according to the specified edge attribute.
+
+    Returns
+    -------
+    function
+        This function returns a callable that accepts exactly three inputs:
+        a node, an node adjacent to the first one, and the edge attribute
+        dictionary for the eedge joining those nodes. That function returns
+        a number representing the weight of an edge.
+
+    If `G` is a multigraph, and `weight` is not callable, the
+    minimum edge weight over all parallel edges is returned. If any edge
+    does not have an attribute with key `weight`, it is assumed to
+    have weight one.
+
+    """
+    if callable(weight):
+        return weight
+    # If the weight keyword argument is not callable, we assume it is a
+    # string representing the edge attribute containing the weight of
+    # the edge.
+    if G.is_multigraph():
+        return lambda u, v, d: min(attr.get(weight, 1) for attr in d.values())
+    return lambda u, v, data: data.get(weight, 1)
+
+def _dijkstra_multisource(
+    G, sources, weight, pred=None, paths=None, cutoff=None, target=None
+):
+    """Uses Dijkstra's algorithm to find shortest weighted paths
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty iterable of nodes
+        Starting nodes for paths. If this is just an iterable containing
+        a single node, then all paths computed by this function will
+        start from that node. If there are two or more nodes in this
+        iterable, the computed paths may begin from any one of the start
+        nodes.
+
+    weight: function
+        Function with (u, v, data) input that returns that edge's weight
+        or None to indicate a hidden edge
+
+    pred: dict of lists, optional(default=None)
+        dict to store a list of predecessors keyed by that node
+        If None, predecessors are not stored.
+
+    paths: dict, optional (default=None)
+        dict to store the path list from source to each node, keyed by node.
+        If None, paths are not stored.
+
+    target : node label, optional
+        Ending node for path. Search is halted when target is found.
+
+    cutoff : integer or float, optional
+        Length (sum of edge weights) at which the search is stopped.
+        If cutoff is provided, only return paths with summed weight <= cutoff.
+
+    Returns
+    -------
+    distance : dictionary
+        A mapping from node to shortest distance to that node from one
+        of the source nodes.
+
+    Raises
+    ------
+    NodeNotFound
+        If any of `sources` is not in `G`.
+
+    Notes
+    -----
+    The optional predecessor and path dictionaries can be accessed by
+    the caller through the original pred and paths objects passed
+    as arguments. No need to explicitly return pred or paths.
+
+    """
+    G_succ = G._adj  # For speed-up (and works for both directed and undirected graphs)
+
+    dist = {}  # dictionary of final distances
+    seen = {}
+    # fringe is heapq with 3-tuples (distance,c,node)
+    # use the count c to avoid comparing nodes (may not be able to)
+    c = count()
+    fringe = []
+    for source in sources:
+        seen[source] = 0
+        heappush(fringe, (0, next(c), source))
+    while fringe:
+        (d, _, v) = heappop(fringe)
+        if v in dist:
+            continue  # already searched this node.
+        dist[v] = d
+        if v == target:
+            break
+        for u, e in G_succ[v].items():
+            cost = weight(v, u, e)
+            if cost is None:
+                continue
+            vu_dist = dist[v] + cost
+            if cutoff is not None:
+                if vu_dist > cutoff:
+                    continue
+            if u in dist:
+                u_dist = dist[u]
+                if vu_dist < u_dist:
+                    raise ValueError("Contradictory paths found:", "negative weights?")
+                elif pred is not None and vu_dist == u_dist:
+                    pred[u].append(v)
+            elif u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u))
+                if paths is not None:
+                    paths[u] = paths[v] + [u]
+                if pred is not None:
+                    pred[u] = [v]
+            elif vu_dist == seen[u]:
+                if pred is not None:
+                    pred[u].append(v)
+
+    # The optional predecessor and path dictionaries can be accessed
+    # by the caller via the pred and paths objects passed as arguments.
+    return dist
+
+def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None, target=None):
+    """Uses Dijkstra's algorithm to find shortest weighted paths from a
+    single source.
+
+    This is a convenience function for :func:`_dijkstra_multisource`
+    with all the arguments the same, except the keyword argument
+    `sources` set to ``[source]``.
+
+    """
+    return _dijkstra_multisource(
+        G, [source], weight, pred=pred, paths=paths, cutoff=cutoff, target=target
+    )
+
+def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight"):
+    """Find shortest weighted paths and lengths from a given set of
+    source nodes.
+
+    Uses Dijkstra's algorithm to compute the shortest paths and lengths
+    between one of the source nodes and the given `target`, or all other
+    reachable nodes if not specified, for a weighted graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    sources : non-empty set of nodes
+        Starting nodes for paths. If this is just a set containing a
+        single node, then all paths computed by this function will start
+        from that node. If there are two or more nodes in the set, the
+        computed paths may begin from any one of the start nodes.
+
+    target : node label, optional
+        Ending node for path
+
+    cutoff : integer or float, optional
+        Length (sum of edge weights) at which the search is stopped.
+        If cutoff is provided, only return paths with summed weight <= cutoff.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to indicate a hidden edge.
+
+    Returns
+    -------
+    distance, path : pair of dictionaries, or numeric and list
+        If target is None, returns a tuple of two dictionaries keyed by node.
+        The first dictionary stores distance from one of the source nodes.
+        The second stores the path from one of the sources to that node.
+        If target is not None, returns a tuple of (distance, path) where
+        distance is the distance from source to target and path is a list
+        representing the path from source to target.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> length, path = nx.multi_source_dijkstra(G, {0, 4})
+    >>> for node in [0, 1, 2, 3, 4]:
+    ...     print(f"{node}: {length[node]}")
+    0: 0
+    1: 1
+    2: 2
+    3: 1
+    4: 0
+    >>> path[1]
+    [0, 1]
+    >>> path[3]
+    [4, 3]
+
+    >>> length, path = nx.multi_source_dijkstra(G, {0, 4}, 1)
+    >>> length
+    1
+    >>> path
+    [0, 1]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    The weight function can be used to hide edges by returning None.
+    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
+    will find the shortest red path.
+
+    Based on the Python cookbook recipe (119466) at
+    https://code.activestate.com/recipes/119466/
+
+    This algorithm is not guaranteed to work if edge weights
+    are negative or are floating point numbers
+    (overflows and roundoff errors can cause problems).
+
+    Raises
+    ------
+    ValueError
+        If `sources` is empty.
+    NodeNotFound
+        If any of `sources` is not in `G`.
+
+    See Also
+    --------
+    multi_source_dijkstra_path
+    multi_source_dijkstra_path_length
+
+    """
+    if not sources:
+        raise ValueError("sources must not be empty")
+    for s in sources:
+        if s not in G:
+            raise Exception(f"Node {s} not found in graph")
+    if target in sources:
+        return (0, [target])
+    if target is not None and all(_in_different_components(G, s, target) for s in sources):
+        raise Exception(f"No path to {target}.")
+    weight = _weight_function(G, weight)
+    paths = {source: [source] for source in sources}  # dictionary of paths
+    dist = _dijkstra_multisource(
+        G, sources, weight, paths=paths, cutoff=cutoff, target=target
+    )
+    if target is None:
+        return (dist, paths)
+    try:
+        return (dist[target], paths[target])
+    except KeyError as err:
+        raise Exception(f"No path to {target}.") from err
+    
+def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight"):
+    """Find shortest weighted paths and lengths from a source node.
+
+    Compute the shortest path length between source and all other
+    reachable nodes for a weighted graph.
+
+    Uses Dijkstra's algorithm to compute shortest paths and lengths
+    between a source and all other reachable nodes in a weighted graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node label
+        Starting node for path
+
+    target : node label, optional
+        Ending node for path
+
+    cutoff : integer or float, optional
+        Length (sum of edge weights) at which the search is stopped.
+        If cutoff is provided, only return paths with summed weight <= cutoff.
+
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to indicate a hidden edge.
+
+    Returns
+    -------
+    distance, path : pair of dictionaries, or numeric and list.
+        If target is None, paths and lengths to all nodes are computed.
+        The return value is a tuple of two dictionaries keyed by target nodes.
+        The first dictionary stores distance to each target node.
+        The second stores the path to each target node.
+        If target is not None, returns a tuple (distance, path), where
+        distance is the distance from source to target and path is a list
+        representing the path from source to target.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> length, path = nx.single_source_dijkstra(G, 0)
+    >>> length[4]
+    4
+    >>> for node in [0, 1, 2, 3, 4]:
+    ...     print(f"{node}: {length[node]}")
+    0: 0
+    1: 1
+    2: 2
+    3: 3
+    4: 4
+    >>> path[4]
+    [0, 1, 2, 3, 4]
+    >>> length, path = nx.single_source_dijkstra(G, 0, 1)
+    >>> length
+    1
+    >>> path
+    [0, 1]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    The weight function can be used to hide edges by returning None.
+    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
+    will find the shortest red path.
+
+    Based on the Python cookbook recipe (119466) at
+    https://code.activestate.com/recipes/119466/
+
+    This algorithm is not guaranteed to work if edge weights
+    are negative or are floating point numbers
+    (overflows and roundoff errors can cause problems).
+
+    See Also
+    --------
+    single_source_dijkstra_path
+    single_source_dijkstra_path_length
+    single_source_bellman_ford
+    """
+    return multi_source_dijkstra(
+        G, {source}, cutoff=cutoff, target=target, weight=weight
+    )
+
+def dijkstra_path(G, source, target, weight="weight"):
+    """Returns the shortest weighted path from source to target in G.
+
+    Uses Dijkstra's Method to compute the shortest weighted path
+    between two nodes in a graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+        Starting node
+
+    target : node
+        Ending node
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to indicate a hidden edge.
+
+    Returns
+    -------
+    path : list
+        List of nodes in a shortest path.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> print(nx.dijkstra_path(G, 0, 4))
+    [0, 1, 2, 3, 4]
+
+    Find edges of shortest path in Multigraph
+
+    >>> G = nx.MultiDiGraph()
+    >>> G.add_weighted_edges_from([(1, 2, 0.75), (1, 2, 0.5), (2, 3, 0.5), (1, 3, 1.5)])
+    >>> nodes = nx.dijkstra_path(G, 1, 3)
+    >>> edges = nx.utils.pairwise(nodes)
+    >>> list(
+    ...     (u, v, min(G[u][v], key=lambda k: G[u][v][k].get("weight", 1)))
+    ...     for u, v in edges
+    ... )
+    [(1, 2, 1), (2, 3, 0)]
+
+    Notes
+    -----
+    Edge weight attributes must be numerical.
+    Distances are calculated as sums of weighted edges traversed.
+
+    The weight function can be used to hide edges by returning None.
+    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
+    will find the shortest red path.
+
+    The weight function can be used to include node weights.
+
+    >>> def func(u, v, d):
+    ...     node_u_wt = G.nodes[u].get("node_weight", 1)
+    ...     node_v_wt = G.nodes[v].get("node_weight", 1)
+    ...     edge_wt = d.get("weight", 1)
+    ...     return node_u_wt / 2 + node_v_wt / 2 + edge_wt
+
+    In this example we take the average of start and end node
+    weights of an edge and add it to the weight of the edge.
+
+    The function :func:`single_source_dijkstra` computes both
+    path and length-of-path if you need both, use that.
+
+    See Also
+    --------
+    bidirectional_dijkstra
+    bellman_ford_path
+    single_source_dijkstra
+    """
+    (length, path) = single_source_dijkstra(G, source, target=target, weight=weight)
+    return path
 
-def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight"):
-    """Find shortest weighted paths and lengths from a given set of
-    source nodes.
+def dijkstra_path_length(G, source, target, weight="weight"):
+    """Returns the shortest weighted path length in G from source to target.
 
-    Uses Dijkstra's algorithm to compute the shortest paths and lengths
-    between one of the source nodes and the given `target`, or all other
-    reachable nodes if not specified, for a weighted graph.
+    Uses Dijkstra's Method to compute the shortest weighted path length
+    between two nodes in a graph.
 
     Parameters
     ----------
     G : NetworkX graph
 
-    sources : non-empty set of nodes
-        Starting nodes for paths. If this is just a set containing a
-        single node, then all paths computed by this function will start
-        from that node. If there are two or more nodes in the set, the
-        computed paths may begin from any one of the start nodes.
-
-    target : node label, optional
-        Ending node for path
+    source : node label
+        starting node for path
 
-    cutoff : integer or float, optional
-        Length (sum of edge weights) at which the search is stopped.
-        If cutoff is provided, only return paths with summed weight <= cutoff.
+    target : node label
+        ending node for path
 
     weight : string or function
         If this is a string, then edge weights will be accessed via the
@@ -464,35 +2411,22 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight")
 
     Returns
     -------
-    distance, path : pair of dictionaries, or numeric and list
-        If target is None, returns a tuple of two dictionaries keyed by node.
-        The first dictionary stores distance from one of the source nodes.
-        The second stores the path from one of the sources to that node.
-        If target is not None, returns a tuple of (distance, path) where
-        distance is the distance from source to target and path is a list
-        representing the path from source to target.
+    length : number
+        Shortest path length.
+
+    Raises
+    ------
+    NodeNotFound
+        If `source` is not in `G`.
+
+    NetworkXNoPath
+        If no path exists between source and target.
 
     Examples
     --------
     >>> G = nx.path_graph(5)
-    >>> length, path = nx.multi_source_dijkstra(G, {0, 4})
-    >>> for node in [0, 1, 2, 3, 4]:
-    ...     print(f"{node}: {length[node]}")
-    0: 0
-    1: 1
-    2: 2
-    3: 1
-    4: 0
-    >>> path[1]
-    [0, 1]
-    >>> path[3]
-    [4, 3]
-
-    >>> length, path = nx.multi_source_dijkstra(G, {0, 4}, 1)
-    >>> length
-    1
-    >>> path
-    [0, 1]
+    >>> nx.dijkstra_path_length(G, 0, 4)
+    4
 
     Notes
     -----
@@ -503,314 +2437,771 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight")
     So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
     will find the shortest red path.
 
-    Based on the Python cookbook recipe (119466) at
-    https://code.activestate.com/recipes/119466/
+    The function :func:`single_source_dijkstra` computes both
+    path and length-of-path if you need both, use that.
 
-    This algorithm is not guaranteed to work if edge weights
-    are negative or are floating point numbers
-    (overflows and roundoff errors can cause problems).
+    See Also
+    --------
+    bidirectional_dijkstra
+    bellman_ford_path_length
+    single_source_dijkstra
+
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
+    if source == target:
+        return 0
+    weight = _weight_function(G, weight)
+    length = _dijkstra(G, source, weight, target=target)
+    try:
+        return length[target]
+    except KeyError as err:
+        raise Exception(f"Node {target} not reachable from {source}") from err
+
+def _dijkstra_settle_iter(G, sources, budget):
+    """Yields ``(node, distance, origin)`` as Dijkstra settles each node.
+
+    Nodes are produced in non-decreasing order of distance, and only nodes
+    at distance <= `budget` are ever pushed, so the search touches only the
+    region within the budget. `origin` is the source the node's shortest
+    path starts from.
+    """
+    settled = set()
+    seen = {}
+    c = count()
+    fringe = []
+    for source in sources:
+        if source not in seen:
+            seen[source] = 0
+            heappush(fringe, (0, next(c), source, source))
+
+    while fringe:
+        (d, _, v, origin) = heappop(fringe)
+        if v in settled:
+            continue  # already settled with a smaller distance
+        settled.add(v)
+        yield v, d, origin
+
+        neighbors = G.get_vizinhos(v)
+        if not neighbors:
+            continue
+        for u, cost in neighbors:
+            if cost < 0:
+                raise ValueError("Contradictory paths found:", "negative weights?")
+            vu_dist = d + cost
+            if vu_dist > budget or u in settled:
+                continue
+            if u not in seen or vu_dist < seen[u]:
+                seen[u] = vu_dist
+                heappush(fringe, (vu_dist, next(c), u, origin))
+
+def multi_source_reachable_within_budget(G, sources, budget, weight="weight"):
+    """Stream every node reachable from any of `sources` within `budget`.
+
+    Results are yielded lazily, in increasing order of cost, as Dijkstra
+    settles each node, so callers can stop early or page through them
+    without computing the full single-source table.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search (uses get_vizinhos method)
+
+    sources : non-empty iterable of nodes
+        Starting nodes. The cost of a node is the cheapest cost from any
+        of them.
+
+    budget : integer or float
+        Largest total cost (sum of edge weights) to report.
+
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility with
+        :func:`multi_source_dijkstra`; weights come from the adjacency list.
+
+    Returns
+    -------
+    generator
+        Yields ``(node, cost, origin)`` tuples, where `origin` is the
+        source the cheapest path starts from. The sources themselves come
+        first, with cost 0.
 
     Raises
     ------
     ValueError
-        If `sources` is empty.
-    NodeNotFound
+        If `sources` is empty or a negative edge weight is reached.
+    Exception
         If any of `sources` is not in `G`.
 
-    See Also
+    Examples
     --------
-    multi_source_dijkstra_path
-    multi_source_dijkstra_path_length
+    >>> destinos = multi_source_reachable_within_budget(G, ['REC', 'NAT'], 300)
+    >>> for aeroporto, preco, origem in destinos:
+    ...     print(aeroporto, preco, origem)
 
+    See Also
+    --------
+    reachable_within_budget
+    multi_source_dijkstra
     """
+    sources = list(sources)
     if not sources:
         raise ValueError("sources must not be empty")
     for s in sources:
         if s not in G:
             raise Exception(f"Node {s} not found in graph")
-    if target in sources:
-        return (0, [target])
-    weight = _weight_function(G, weight)
-    paths = {source: [source] for source in sources}  # dictionary of paths
-    dist = _dijkstra_multisource(
-        G, sources, weight, paths=paths, cutoff=cutoff, target=target
-    )
-    if target is None:
-        return (dist, paths)
-    try:
-        return (dist[target], paths[target])
-    except KeyError as err:
-        raise Exception(f"No path to {target}.") from err
-    
-def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight"):
-    """Find shortest weighted paths and lengths from a source node.
 
-    Compute the shortest path length between source and all other
-    reachable nodes for a weighted graph.
+    return _dijkstra_settle_iter(G, sources, budget)
 
-    Uses Dijkstra's algorithm to compute shortest paths and lengths
-    between a source and all other reachable nodes in a weighted graph.
+def reachable_within_budget(G, source, budget, weight="weight"):
+    """Stream every node reachable from `source` within `budget`.
+
+    Single-source version of :func:`multi_source_reachable_within_budget`.
 
     Parameters
     ----------
-    G : NetworkX graph
-
-    source : node label
-        Starting node for path
-
-    target : node label, optional
-        Ending node for path
-
-    cutoff : integer or float, optional
-        Length (sum of edge weights) at which the search is stopped.
-        If cutoff is provided, only return paths with summed weight <= cutoff.
+    G : Graph object
+        The graph to search (uses get_vizinhos method)
 
+    source : node
+        Starting node
 
-    weight : string or function
-        If this is a string, then edge weights will be accessed via the
-        edge attribute with this key (that is, the weight of the edge
-        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
-        such edge attribute exists, the weight of the edge is assumed to
-        be one.
+    budget : integer or float
+        Largest total cost (sum of edge weights) to report.
 
-        If this is a function, the weight of an edge is the value
-        returned by the function. The function must accept exactly three
-        positional arguments: the two endpoints of an edge and the
-        dictionary of edge attributes for that edge. The function must
-        return a number or None to indicate a hidden edge.
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility.
 
     Returns
     -------
-    distance, path : pair of dictionaries, or numeric and list.
-        If target is None, paths and lengths to all nodes are computed.
-        The return value is a tuple of two dictionaries keyed by target nodes.
-        The first dictionary stores distance to each target node.
-        The second stores the path to each target node.
-        If target is not None, returns a tuple (distance, path), where
-        distance is the distance from source to target and path is a list
-        representing the path from source to target.
+    generator
+        Yields ``(node, cost)`` tuples in increasing order of cost,
+        starting with ``(source, 0)``.
 
     Raises
     ------
-    NodeNotFound
+    Exception
         If `source` is not in `G`.
 
     Examples
     --------
-    >>> G = nx.path_graph(5)
-    >>> length, path = nx.single_source_dijkstra(G, 0)
-    >>> length[4]
-    4
-    >>> for node in [0, 1, 2, 3, 4]:
-    ...     print(f"{node}: {length[node]}")
-    0: 0
-    1: 1
-    2: 2
-    3: 3
-    4: 4
-    >>> path[4]
-    [0, 1, 2, 3, 4]
-    >>> length, path = nx.single_source_dijkstra(G, 0, 1)
-    >>> length
-    1
-    >>> path
-    [0, 1]
+    >>> from itertools import islice
+    >>> primeira_pagina = list(islice(reachable_within_budget(G, 'REC', 500), 20))
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-    Notes
-    -----
-    Edge weight attributes must be numerical.
-    Distances are calculated as sums of weighted edges traversed.
+    return ((node, cost) for node, cost, _ in _dijkstra_settle_iter(G, [source], budget))
 
-    The weight function can be used to hide edges by returning None.
-    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
-    will find the shortest red path.
+def _integer_weights(csr, scale):
+    """Returns the CSR weights times `scale` as Python ints, or None.
 
-    Based on the Python cookbook recipe (119466) at
-    https://code.activestate.com/recipes/119466/
+    None means some scaled weight is negative or not integral (within a
+    relative tolerance of 1e-9, so ``0.29 * 100`` still counts as 29).
+    """
+    scaled = csr.pesos * scale
+    rounded = np.round(scaled)
+    if scaled.size and (rounded.min() < 0 or
+                        np.any(np.abs(scaled - rounded) > 1e-9 * np.maximum(1.0, np.abs(scaled)))):
+        return None
+    return rounded.astype(np.int64).tolist()
 
-    This algorithm is not guaranteed to work if edge weights
-    are negative or are floating point numbers
-    (overflows and roundoff errors can cause problems).
+def _dijkstra_dial(indptr, indices, int_weights, source, max_weight):
+    """Dial's algorithm: a circular array of ``max_weight + 1`` buckets.
 
-    See Also
+    Every tentative distance lies within ``max_weight`` of the bucket being
+    scanned, so ``distance % (max_weight + 1)`` identifies its bucket.
+    Stale entries are skipped when popped.
+    """
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    dist = {source: 0}
+    pred = {source: -1}
+    done = set()
+    buckets[0].append(source)
+    pending = 1
+    current = 0
+
+    while pending:
+        bucket = buckets[current % num_buckets]
+        while bucket:
+            v = bucket.pop()
+            pending -= 1
+            if v in done or dist[v] != current:
+                continue  # stale entry
+            done.add(v)
+            for slot in range(indptr[v], indptr[v + 1]):
+                u = indices[slot]
+                if u in done:
+                    continue
+                new_dist = current + int_weights[slot]
+                if new_dist < dist.get(u, new_dist + 1):
+                    dist[u] = new_dist
+                    pred[u] = v
+                    buckets[new_dist % num_buckets].append(u)
+                    pending += 1
+        current += 1
+
+    return dist, pred
+
+class _RadixHeap:
+    """Monotone priority queue for non-negative integer keys.
+
+    An item with key k lives in bucket ``(k ^ last).bit_length()``, where
+    `last` is the last key popped. Keys never go below `last`, so each item
+    moves to a lower bucket at most once per bit of the largest key.
+    """
+
+    def __init__(self):
+        self.last = 0
+        self.size = 0
+        self.buckets = [[]]
+
+    def push(self, key, value):
+        index = (key ^ self.last).bit_length()
+        while index >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[index].append((key, value))
+        self.size += 1
+
+    def pop(self):
+        if not self.buckets[0]:
+            index = 1
+            while not self.buckets[index]:
+                index += 1
+            items = self.buckets[index]
+            self.buckets[index] = []
+            self.last = min(key for key, _ in items)
+            for key, value in items:
+                self.buckets[(key ^ self.last).bit_length()].append((key, value))
+        self.size -= 1
+        return self.buckets[0].pop()
+
+def _dijkstra_radix(indptr, indices, int_weights, source):
+    """Dijkstra over a :class:`_RadixHeap`, with lazy deletion."""
+    dist = {source: 0}
+    pred = {source: -1}
+    done = set()
+    heap = _RadixHeap()
+    heap.push(0, source)
+
+    while heap.size:
+        d, v = heap.pop()
+        if v in done or dist[v] != d:
+            continue  # stale entry
+        done.add(v)
+        for slot in range(indptr[v], indptr[v + 1]):
+            u = indices[slot]
+            if u in done:
+                continue
+            new_dist = d + int_weights[slot]
+            if new_dist < dist.get(u, new_dist + 1):
+                dist[u] = new_dist
+                pred[u] = v
+                heap.push(new_dist, u)
+
+    return dist, pred
+
+def single_source_dijkstra_auto(G, source, scale=1, dial_max_weight=1024, weight="weight"):
+    """Dijkstra from `source` with a priority queue chosen from the weights.
+
+    Integer keys avoid the O(log n) push/pop of a binary heap:
+
+    - ``'dial'``: every weight times `scale` is a non-negative integer and
+      the largest one is at most `dial_max_weight`; uses Dial's buckets.
+    - ``'radix'``: scaled weights are non-negative integers but larger;
+      uses a radix heap over the monotone integer distances.
+    - ``'binary_heap'``: anything else; runs
+      :func:`single_source_dijkstra_indexed` with ``d=2``.
+
+    All engines scan the same CSR slots, so parallel edges count with
+    their cheapest weight whichever engine runs.
+
+    Parameters
+    ----------
+    G : Grafo
+        The graph to search (uses the para_csr method)
+
+    source : node
+        Starting node
+
+    scale : integer, optional (default=1)
+        Factor applied to the weights before the integrality check, e.g.
+        100 to quantize prices to cents. Distances are returned in the
+        original unit.
+
+    dial_max_weight : integer, optional (default=1024)
+        Largest scaled weight for which Dial's buckets are used.
+
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility; weights
+        come from the adjacency list.
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'distances': dict mapping reachable node -> distance from source
+        - 'predecessors': dict mapping reachable node -> predecessor in the
+          shortest path tree (None for the source)
+        - 'engine': name of the engine that ran ('dial', 'radix' or
+          'binary_heap')
+
+    Raises
+    ------
+    Exception
+        If source is not in graph
+    ValueError
+        If a negative edge weight is found
+
+    Examples
     --------
-    single_source_dijkstra_path
-    single_source_dijkstra_path_length
-    single_source_bellman_ford
+    >>> result = single_source_dijkstra_auto(G, 'boa viagem')
+    >>> result['engine']
+    'dial'
     """
-    return multi_source_dijkstra(
-        G, {source}, cutoff=cutoff, target=target, weight=weight
-    )
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-def dijkstra_path(G, source, target, weight="weight"):
-    """Returns the shortest weighted path from source to target in G.
+    csr = G.para_csr()
+    int_weights = _integer_weights(csr, scale)
+
+    if int_weights is None:
+        result = single_source_dijkstra_indexed(G, source, d=2, weight=weight)
+        result['engine'] = 'binary_heap'
+        return result
+
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    max_weight = max(int_weights, default=0)
+    if max_weight <= dial_max_weight:
+        engine = 'dial'
+        dist, pred = _dijkstra_dial(indptr, indices, int_weights, csr.indice[source], max_weight)
+    else:
+        engine = 'radix'
+        dist, pred = _dijkstra_radix(indptr, indices, int_weights, csr.indice[source])
+
+    nodes = csr.nos
+    return {
+        'distances': {nodes[v]: d / scale for v, d in dist.items()},
+        'predecessors': {nodes[v]: (nodes[p] if p >= 0 else None) for v, p in pred.items()},
+        'engine': engine
+    }
 
-    Uses Dijkstra's Method to compute the shortest weighted path
-    between two nodes in a graph.
+def single_source_dijkstra_indexed(G, source, d=4, weight="weight"):
+    """Dijkstra from `source` over an indexed d-ary heap with decrease-key.
+
+    :func:`_dijkstra_multisource` uses lazy deletion: every improvement
+    pushes a new ``(dist, count, node)`` tuple and stale entries are
+    discarded on pop, so the heap can grow to O(E) entries. Here each node
+    id sits in an :class:`IndexedDaryHeap` at most once and improvements
+    lower its key in place, so the heap never holds more than |V| items
+    and no tuple is allocated per relaxation.
 
     Parameters
     ----------
-    G : NetworkX graph
+    G : Grafo
+        The graph to search (uses the para_csr method)
 
     source : node
         Starting node
 
-    target : node
-        Ending node
-
-    weight : string or function
-        If this is a string, then edge weights will be accessed via the
-        edge attribute with this key (that is, the weight of the edge
-        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
-        such edge attribute exists, the weight of the edge is assumed to
-        be one.
+    d : integer, optional (default=4)
+        Arity of the heap.
 
-        If this is a function, the weight of an edge is the value
-        returned by the function. The function must accept exactly three
-        positional arguments: the two endpoints of an edge and the
-        dictionary of edge attributes for that edge. The function must
-        return a number or None to indicate a hidden edge.
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility; weights
+        come from the adjacency list.
 
     Returns
     -------
-    path : list
-        List of nodes in a shortest path.
+    dict
+        Dictionary with:
+        - 'distances': dict mapping reachable node -> distance from source
+        - 'predecessors': dict mapping reachable node -> predecessor in the
+          shortest path tree (None for the source)
 
     Raises
     ------
-    NodeNotFound
-        If `source` is not in `G`.
+    Exception
+        If source is not in graph
+    ValueError
+        If a negative edge weight is found
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-    NetworkXNoPath
-        If no path exists between source and target.
+    csr = G.para_csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    weights = csr.pesos.tolist()
+    num_nodes = len(csr.nos)
+
+    dist = [None] * num_nodes
+    pred = [-1] * num_nodes
+    done = [False] * num_nodes
+    heap = IndexedDaryHeap(num_nodes, d)
+    start = csr.indice[source]
+    heap.push(start, 0)
+
+    while heap:
+        v, dist_v = heap.pop()
+        dist[v] = dist_v
+        done[v] = True
+        for slot in range(indptr[v], indptr[v + 1]):
+            u = indices[slot]
+            cost = weights[slot]
+            if cost < 0:
+                raise ValueError("Contradictory paths found:", "negative weights?")
+            if done[u]:
+                continue
+            if heap.push_or_decrease(u, dist_v + cost):
+                pred[u] = v
 
-    Examples
-    --------
-    >>> G = nx.path_graph(5)
-    >>> print(nx.dijkstra_path(G, 0, 4))
-    [0, 1, 2, 3, 4]
+    nodes = csr.nos
+    return {
+        'distances': {nodes[v]: dist[v] for v in range(num_nodes) if done[v]},
+        'predecessors': {nodes[v]: (nodes[pred[v]] if pred[v] >= 0 else None)
+                         for v in range(num_nodes) if done[v]}
+    }
 
-    Find edges of shortest path in Multigraph
+def _edge_slots(indptr, nodes):
+    """Returns the CSR slots of every edge leaving `nodes`, and their tails."""
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return offsets + np.arange(total, dtype=np.int64), np.repeat(nodes, lengths)
+
+def _delta_candidates(indptr, indices, weights, dist, nodes, delta, light):
+    """Candidate relaxations of the light (w <= delta) or heavy edges of `nodes`.
+
+    Returns ``(targets, candidates, tails)`` for the edges whose candidate
+    distance beats the current one.
+    """
+    slots, tails = _edge_slots(indptr, nodes)
+    w = weights[slots]
+    keep = (w <= delta) if light else (w > delta)
+    slots, tails, w = slots[keep], tails[keep], w[keep]
+    targets = indices[slots]
+    candidates = dist[tails] + w
+    better = candidates < dist[targets]
+    return targets[better], candidates[better], tails[better]
+
+# Per-process views of the shared arrays used by the delta-stepping workers
+_DELTA_SHARED = {}
+
+def _delta_worker_init(specs):
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _DELTA_SHARED[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+def _delta_worker_relax(nodes, delta, light):
+    arrays = {name: array for name, (_, array) in _DELTA_SHARED.items()}
+    return _delta_candidates(arrays['indptr'], arrays['indices'], arrays['weights'],
+                             arrays['dist'], nodes, delta, light)
+
+def delta_stepping(G, source, delta=None, workers=1, parallel_threshold=50000):
+    """Single-source shortest paths with the delta-stepping algorithm.
+
+    Nodes are kept in buckets of width `delta` by tentative distance. The
+    lowest non-empty bucket is emptied by relaxing the light edges
+    (weight <= delta) of all its nodes as one vectorized batch, repeatedly,
+    since light edges can refill it; the heavy edges of every node removed
+    from the bucket are then relaxed once. Each batch gathers the CSR edge
+    slots of its nodes and scatters the minima with ``np.minimum.at``.
 
-    >>> G = nx.MultiDiGraph()
-    >>> G.add_weighted_edges_from([(1, 2, 0.75), (1, 2, 0.5), (2, 3, 0.5), (1, 3, 1.5)])
-    >>> nodes = nx.dijkstra_path(G, 1, 3)
-    >>> edges = nx.utils.pairwise(nodes)
-    >>> list(
-    ...     (u, v, min(G[u][v], key=lambda k: G[u][v][k].get("weight", 1)))
-    ...     for u, v in edges
-    ... )
-    [(1, 2, 1), (2, 3, 0)]
+    Parameters
+    ----------
+    G : Grafo
+        The graph to search (uses the para_csr method)
 
-    Notes
-    -----
-    Edge weight attributes must be numerical.
-    Distances are calculated as sums of weighted edges traversed.
+    source : node
+        Starting node
 
-    The weight function can be used to hide edges by returning None.
-    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
-    will find the shortest red path.
+    delta : float, optional
+        Bucket width. Defaults to the largest weight divided by the average
+        out-degree. Small values approach Dijkstra (many buckets, little
+        re-relaxation); large ones approach Bellman-Ford.
 
-    The weight function can be used to include node weights.
+    workers : integer, optional (default=1)
+        Number of worker processes. With more than one, the CSR arrays and
+        the distance array are placed in shared memory and batches with at
+        least `parallel_threshold` nodes are split across a process pool;
+        the parent merges the candidates.
 
-    >>> def func(u, v, d):
-    ...     node_u_wt = G.nodes[u].get("node_weight", 1)
-    ...     node_v_wt = G.nodes[v].get("node_weight", 1)
-    ...     edge_wt = d.get("weight", 1)
-    ...     return node_u_wt / 2 + node_v_wt / 2 + edge_wt
+    parallel_threshold : integer, optional (default=50000)
+        Smallest batch (in nodes) sent to the pool. Smaller batches are
+        relaxed in-process, where they are cheaper than the IPC round trip.
 
-    In this example we take the average of start and end node
-    weights of an edge and add it to the weight of the edge.
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'distances': dict mapping reachable node -> distance from source
+        - 'predecessors': dict mapping reachable node -> predecessor in the
+          shortest path tree (None for the source)
+        - 'delta': bucket width used
+        - 'num_buckets': number of buckets processed
 
-    The function :func:`single_source_dijkstra` computes both
-    path and length-of-path if you need both, use that.
+    Raises
+    ------
+    Exception
+        If source is not in graph
+    ValueError
+        If a negative edge weight is found, or delta is not positive
 
     See Also
     --------
-    bidirectional_dijkstra
-    bellman_ford_path
     single_source_dijkstra
     """
-    (length, path) = single_source_dijkstra(G, source, target=target, weight=weight)
-    return path
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-def dijkstra_path_length(G, source, target, weight="weight"):
-    """Returns the shortest weighted path length in G from source to target.
+    csr = G.para_csr()
+    indptr, indices, weights = csr.indptr, csr.indices, csr.pesos
+    num_nodes = len(csr.nos)
+    if weights.size and weights.min() < 0:
+        raise ValueError("Contradictory paths found:", "negative weights?")
+
+    if delta is None:
+        avg_degree = max(1.0, weights.size / max(1, num_nodes))
+        delta = float(weights.max()) / avg_degree if weights.size else 1.0
+        if delta <= 0:
+            delta = 1.0
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+
+    pool = None
+    segments = []
+    try:
+        if workers > 1:
+            specs = {}
+            shared = {}
+            for name, array in (('indptr', indptr), ('indices', indices),
+                                ('weights', weights), ('dist', np.empty(num_nodes))):
+                shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+                segments.append(shm)
+                view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+                view[:] = array
+                shared[name] = view
+                specs[name] = (shm.name, array.shape, array.dtype.str)
+            dist = shared['dist']
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_delta_worker_init,
+                                       initargs=(specs,))
+        else:
+            dist = np.empty(num_nodes)
+
+        dist[:] = np.inf
+        pred = np.full(num_nodes, -1, dtype=np.int64)
+        active = np.zeros(num_nodes, dtype=bool)
+        start = csr.indice[source]
+        dist[start] = 0.0
+        active[start] = True
+        pending = np.array([start], dtype=np.int64)
+
+        def relax(nodes, light):
+            if pool is not None and nodes.size >= parallel_threshold:
+                chunks = np.array_split(nodes, workers)
+                parts = list(pool.map(_delta_worker_relax, chunks,
+                                      [delta] * workers, [light] * workers))
+                targets = np.concatenate([p[0] for p in parts])
+                candidates = np.concatenate([p[1] for p in parts])
+                tails = np.concatenate([p[2] for p in parts])
+            else:
+                targets, candidates, tails = _delta_candidates(
+                    indptr, indices, weights, dist, nodes, delta, light)
+            if targets.size == 0:
+                return targets
+            np.minimum.at(dist, targets, candidates)
+            won = candidates == dist[targets]
+            pred[targets[won]] = tails[won]
+            improved = np.unique(targets)
+            active[improved] = True
+            return improved
+
+        num_buckets = 0
+        while True:
+            pending = np.unique(pending[active[pending]])
+            if pending.size == 0:
+                break
+            bucket = np.floor(dist[pending].min() / delta)
+            num_buckets += 1
+
+            removed = []
+            while True:
+                current = pending[active[pending] & (np.floor(dist[pending] / delta) == bucket)]
+                if current.size == 0:
+                    break
+                active[current] = False
+                removed.append(current)
+                improved = relax(current, light=True)
+                pending = np.concatenate((pending[active[pending]], improved))
+
+            improved = relax(np.unique(np.concatenate(removed)), light=False)
+            pending = np.concatenate((pending, improved))
+
+        reached = np.flatnonzero(np.isfinite(dist))
+        nodes = csr.nos
+        return {
+            'distances': {nodes[v]: float(dist[v]) for v in reached},
+            'predecessors': {nodes[v]: (nodes[pred[v]] if pred[v] >= 0 else None) for v in reached},
+            'delta': delta,
+            'num_buckets': num_buckets
+        }
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+class _AdjacencySnapshot:
+    """Holds a built ``G._adj`` so repeated searches do not rebuild it.
+
+    :func:`_dijkstra_multisource` only reads the ``_adj`` attribute of its
+    graph argument, so a snapshot can be passed in place of `G`.
+    """
 
-    Uses Dijkstra's Method to compute the shortest weighted path length
-    between two nodes in a graph.
+    def __init__(self, G):
+        self._adj = G._adj
+
+def k_shortest_paths(G, source, target, k, weight="weight"):
+    """Find the `k` shortest loopless paths from source to target.
+
+    Uses Yen's algorithm on top of :func:`_dijkstra_multisource`. The spur
+    searches share state: the adjacency dict is built once for all of them,
+    the cost of each root path is read from the prefix sums of the path it
+    deviates from, a spur search is skipped when the same root with the
+    same set of removed edges was already searched, and candidates go
+    through a single heap that drops duplicate paths.
 
     Parameters
     ----------
     G : NetworkX graph
 
-    source : node label
-        starting node for path
+    source : node
+        Starting node
 
-    target : node label
-        ending node for path
+    target : node
+        Ending node
+
+    k : int
+        Number of paths to find
 
     weight : string or function
         If this is a string, then edge weights will be accessed via the
-        edge attribute with this key (that is, the weight of the edge
-        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
-        such edge attribute exists, the weight of the edge is assumed to
-        be one.
-
-        If this is a function, the weight of an edge is the value
-        returned by the function. The function must accept exactly three
-        positional arguments: the two endpoints of an edge and the
-        dictionary of edge attributes for that edge. The function must
-        return a number or None to indicate a hidden edge.
+        edge attribute with this key. If this is a function, the weight of
+        an edge is the value returned by the function, as in
+        :func:`single_source_dijkstra`.
 
     Returns
     -------
-    length : number
-        Shortest path length.
+    dict
+        Dictionary with:
+        - 'paths': list of up to `k` paths (lists of nodes), in increasing
+          order of length
+        - 'lengths': list with the length of each path
+        - 'num_searches': number of Dijkstra searches performed
 
     Raises
     ------
-    NodeNotFound
-        If `source` is not in `G`.
-
-    NetworkXNoPath
-        If no path exists between source and target.
+    Exception
+        If source or target is not in graph, or if `k` is not positive
 
     Examples
     --------
-    >>> G = nx.path_graph(5)
-    >>> nx.dijkstra_path_length(G, 0, 4)
-    4
+    >>> result = k_shortest_paths(G, 'nova descoberta', 'setubal', 3)
+    >>> for length, path in zip(result['lengths'], result['paths']):
+    ...     print(length, path)
 
     Notes
     -----
-    Edge weight attributes must be numerical.
-    Distances are calculated as sums of weighted edges traversed.
-
-    The weight function can be used to hide edges by returning None.
-    So ``weight = lambda u, v, d: 1 if d['color']=="red" else None``
-    will find the shortest red path.
-
-    The function :func:`single_source_dijkstra` computes both
-    path and length-of-path if you need both, use that.
+    Fewer than `k` paths are returned when the graph has fewer loopless
+    paths from source to target. Edge weights must be non-negative.
 
     See Also
     --------
-    bidirectional_dijkstra
-    bellman_ford_path_length
     single_source_dijkstra
-
     """
     if source not in G:
         raise Exception(f"Node {source} not found in graph")
+    if target not in G:
+        raise Exception(f"Node {target} not found in graph")
+    if k <= 0:
+        raise Exception("k must be a positive integer")
+
     if source == target:
-        return 0
+        return {'paths': [[source]], 'lengths': [0], 'num_searches': 0}
+
     weight = _weight_function(G, weight)
-    length = _dijkstra(G, source, weight, target=target)
-    try:
-        return length[target]
-    except KeyError as err:
-        raise Exception(f"Node {target} not reachable from {source}") from err
+    snapshot = _AdjacencySnapshot(G)
+    G_succ = snapshot._adj
+
+    paths = {source: [source]}
+    dist = _dijkstra_multisource(snapshot, [source], weight, paths=paths, target=target)
+    num_searches = 1
+    if target not in dist:
+        return {'paths': [], 'lengths': [], 'num_searches': num_searches}
+
+    found = [(dist[target], paths[target])]
+    seen_paths = {tuple(paths[target])}
+    searched = set()
+    c = count()
+    candidates = []
+
+    while len(found) < k:
+        _, last_path = found[-1]
+
+        # prefix[i] is the cost of last_path[:i + 1]
+        prefix = [0]
+        for u, v in zip(last_path[:-1], last_path[1:]):
+            prefix.append(prefix[-1] + weight(u, v, G_succ[u][v]))
+
+        for i in range(len(last_path) - 1):
+            root = last_path[:i + 1]
+            spur = root[-1]
+            removed_edges = frozenset(
+                (path[i], path[i + 1]) for _, path in found
+                if len(path) > i + 1 and path[:i + 1] == root
+            )
+            key = (tuple(root), removed_edges)
+            if key in searched:
+                continue
+            searched.add(key)
+            removed_nodes = set(root[:-1])
+
+            def spur_weight(u, v, d):
+                if v in removed_nodes or (u, v) in removed_edges:
+                    return None
+                return weight(u, v, d)
+
+            spur_paths = {spur: [spur]}
+            spur_dist = _dijkstra_multisource(
+                snapshot, [spur], spur_weight, paths=spur_paths, target=target
+            )
+            num_searches += 1
+            if target not in spur_dist:
+                continue
+
+            candidate = root[:-1] + spur_paths[target]
+            if tuple(candidate) in seen_paths:
+                continue
+            seen_paths.add(tuple(candidate))
+            heappush(candidates, (prefix[i] + spur_dist[target], next(c), candidate))
+
+        if not candidates:
+            break
+        length, _, path = heappop(candidates)
+        found.append((length, path))
+
+    return {
+        'paths': [path for _, path in found],
+        'lengths': [length for length, _ in found],
+        'num_searches': num_searches
+    }
 
 # Bellmman Ford
 
@@ -891,62 +3282,451 @@ def bellman_ford(G, source, weight="weight"):
             break
 
 
-    has_negative_cycle = False
-    negative_cycle = []
+    has_negative_cycle = False
+    negative_cycle = []
+
+    for u in all_nodes:
+        if distances[u] == float('inf'):
+            continue
+
+        neighbors = G.get_vizinhos(u)
+        if neighbors:
+            for v, edge_weight in neighbors:
+                if distances[u] + edge_weight < distances[v]:
+
+                    has_negative_cycle = True
+
+
+                    cycle_node = v
+                    visited_in_trace = set()
+
+
+                    for _ in range(num_nodes):
+                        cycle_node = predecessors[cycle_node]
+                        if cycle_node is None:
+                            break
+
+
+                    if cycle_node is not None:
+                        current = cycle_node
+                        cycle_path = []
+                        while True:
+                            if current in visited_in_trace:
+
+                                cycle_start_idx = cycle_path.index(current)
+                                negative_cycle = cycle_path[cycle_start_idx:]
+                                break
+                            visited_in_trace.add(current)
+                            cycle_path.append(current)
+                            current = predecessors[current]
+                            if current is None:
+                                break
+
+                    break
+
+        if has_negative_cycle:
+            break
+
+    return {
+        'distances': distances,
+        'predecessors': predecessors,
+        'has_negative_cycle': has_negative_cycle,
+        'negative_cycle': negative_cycle
+    }
+
+def _find_predecessor_cycle(predecessors):
+    """Returns a cycle of the predecessor graph, or an empty list.
+
+    Each node is walked back through `predecessors` at most once, so the
+    check costs O(V). The cycle is listed in predecessor order, starting
+    from the first node of the cycle reached by the walk, the same layout
+    used by :func:`bellman_ford` for `negative_cycle`.
+    """
+    walk_of = {}
+    for walk_id, start in enumerate(predecessors):
+        node = start
+        while node is not None and node not in walk_of:
+            walk_of[node] = walk_id
+            node = predecessors[node]
+
+        if node is not None and walk_of[node] == walk_id:
+            cycle = [node]
+            current = predecessors[node]
+            while current != node:
+                cycle.append(current)
+                current = predecessors[current]
+            return cycle
+
+    return []
+
+def _find_pred_array_cycle(pred, starts, stamp, walk_id):
+    """Returns (cycle, next walk id): a cycle of the int predecessor array
+    `pred` (-1 for none) met by walking back from `starts`, or an empty list.
+
+    `stamp` keeps the id of the last walk that visited each node and is
+    never reset, so a call only costs the nodes it walks. A walk stops at
+    a node stamped by an earlier walk of the same call (nothing new behind
+    it) and has closed a cycle when it meets its own stamp. The cycle is
+    laid out like :func:`_find_predecessor_cycle`.
+    """
+    first = walk_id
+    for start in starts:
+        node = start
+        while node >= 0 and stamp[node] < first:
+            stamp[node] = walk_id
+            node = int(pred[node])
+
+        if node >= 0 and stamp[node] == walk_id:
+            cycle = [node]
+            current = int(pred[node])
+            while current != node:
+                cycle.append(current)
+                current = int(pred[current])
+            return cycle, walk_id + 1
+        walk_id += 1
+
+    return [], walk_id
+
+def bellman_ford_spfa(G, source, weight="weight"):
+    """
+    Queue-based Bellman-Ford (SPFA) with early negative-cycle detection.
+
+    Only edges leaving nodes whose distance changed are relaxed. The queue
+    is ordered with the Small Label First (SLF) and Large Label Last (LLL)
+    heuristics, so on graphs with mostly positive weights the scan order is
+    close to Dijkstra's.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search (uses get_todos_os_nos and get_vizinhos methods)
+    source : node
+        Starting node for paths
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility with
+        :func:`bellman_ford`; weights come from the adjacency list.
+
+    Returns
+    -------
+    dict
+        Same structure as :func:`bellman_ford`:
+        - 'distances': dict mapping node -> shortest distance from source
+        - 'predecessors': dict mapping node -> predecessor in shortest path tree
+        - 'has_negative_cycle': boolean indicating if negative cycle was detected
+        - 'negative_cycle': list of nodes forming the negative cycle (if detected)
+
+    Raises
+    ------
+    Exception
+        If source is not in graph
+
+    Notes
+    -----
+    Negative cycles are found by walking the predecessor graph after every
+    |V| successful relaxations. Any cycle in the predecessor graph is a
+    negative cycle, and when one is reachable from the source such a cycle
+    always appears after finitely many relaxations. The walk costs O(V),
+    so the check adds O(1) amortized work per relaxation and the search
+    stops long before the |V|-1 full rounds of :func:`bellman_ford`.
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
+
+    all_nodes = G.get_todos_os_nos()
+    distances = {node: float('inf') for node in all_nodes}
+    predecessors = {node: None for node in all_nodes}
+    distances[source] = 0
+
+    num_nodes = len(all_nodes)
+    queue = deque([source])
+    in_queue = {source}
+    queue_sum = 0  # sum of queued labels, used by LLL
+    relaxations = 0
 
-    for u in all_nodes:
-        if distances[u] == float('inf'):
-            continue
+    while queue:
+        # LLL: labels above the queue mean go to the back
+        mean = queue_sum / len(queue)
+        u = queue.popleft()
+        rotations = 0
+        while distances[u] > mean and rotations < len(queue):
+            queue.append(u)
+            u = queue.popleft()
+            rotations += 1
+
+        in_queue.discard(u)
+        queue_sum -= distances[u]
+        dist_u = distances[u]
 
         neighbors = G.get_vizinhos(u)
-        if neighbors:
-            for v, edge_weight in neighbors:
-                if distances[u] + edge_weight < distances[v]:
+        if not neighbors:
+            continue
 
-                    has_negative_cycle = True
+        for v, edge_weight in neighbors:
+            new_dist = dist_u + edge_weight
+            if new_dist >= distances[v]:
+                continue
 
+            if v in in_queue:
+                queue_sum += new_dist - distances[v]
+            distances[v] = new_dist
+            predecessors[v] = u
+
+            if v not in in_queue:
+                in_queue.add(v)
+                queue_sum += new_dist
+                # SLF: a label smaller than the front one goes first
+                if queue and new_dist < distances[queue[0]]:
+                    queue.appendleft(v)
+                else:
+                    queue.append(v)
+
+            relaxations += 1
+            if relaxations % num_nodes == 0:
+                negative_cycle = _find_predecessor_cycle(predecessors)
+                if negative_cycle:
+                    return {
+                        'distances': distances,
+                        'predecessors': predecessors,
+                        'has_negative_cycle': True,
+                        'negative_cycle': negative_cycle
+                    }
 
-                    cycle_node = v
-                    visited_in_trace = set()
+    return {
+        'distances': distances,
+        'predecessors': predecessors,
+        'has_negative_cycle': False,
+        'negative_cycle': []
+    }
 
+def bellman_ford_numpy(G, source, weight="weight"):
+    """
+    Vectorized Bellman-Ford over the edge arrays of the graph.
 
-                    for _ in range(num_nodes):
-                        cycle_node = predecessors[cycle_node]
-                        if cycle_node is None:
-                            break
+    The edges are held as `src`, `dst` and `w` arrays (see
+    :meth:`Grafo.para_csr`) and each relaxation round is a handful of array
+    operations: gather ``dist[src] + w`` and scatter the minimum into
+    ``dist`` with ``np.minimum.at``. Only edges leaving nodes that improved
+    in the previous round take part in the next one.
 
+    Parameters
+    ----------
+    G : Grafo
+        The graph to search (uses the para_csr method)
+    source : node
+        Starting node for paths
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility with
+        :func:`bellman_ford`; weights come from the adjacency list.
 
-                    if cycle_node is not None:
-                        current = cycle_node
-                        cycle_path = []
-                        while True:
-                            if current in visited_in_trace:
+    Returns
+    -------
+    dict
+        Same structure as :func:`bellman_ford`, keyed by node.
 
-                                cycle_start_idx = cycle_path.index(current)
-                                negative_cycle = cycle_path[cycle_start_idx:]
-                                break
-                            visited_in_trace.add(current)
-                            cycle_path.append(current)
-                            current = predecessors[current]
-                            if current is None:
-                                break
+    Raises
+    ------
+    Exception
+        If source is not in graph
 
-                    break
+    Notes
+    -----
+    Rounds are Jacobi-style: every candidate in a round is computed from the
+    distances of the previous round, so at most |V|-1 rounds are needed when
+    there is no negative cycle. If the edges can still be relaxed after that,
+    the kernel keeps relaxing until the predecessor graph closes a cycle
+    (at most |V| more rounds) and reports it as the negative cycle. Each
+    check walks the int predecessor array, only from the nodes whose
+    predecessor changed in that round.
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
 
-        if has_negative_cycle:
+    csr = G.para_csr()
+    nodes = csr.nos
+    num_nodes = len(nodes)
+    src = csr.origens()
+    dst = csr.indices
+    w = csr.pesos
+
+    dist = np.full(num_nodes, np.inf)
+    pred = np.full(num_nodes, -1, dtype=np.int64)
+    dist[csr.indice[source]] = 0.0
+    changed = np.zeros(num_nodes, dtype=bool)
+    changed[csr.indice[source]] = True
+
+    def relax_round():
+        # Relax only the edges whose tail improved in the last round
+        active = np.flatnonzero(changed[src])
+        if active.size == 0:
+            return False
+        a_src, a_dst = src[active], dst[active]
+        cand = dist[a_src] + w[active]
+
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, a_dst, cand)
+        improved = new_dist < dist
+        if not improved.any():
+            changed[:] = False
+            return False
+
+        # Any edge that reached the new minimum is a valid predecessor
+        hit = improved[a_dst] & (cand == new_dist[a_dst])
+        pred[a_dst[hit]] = a_src[hit]
+        dist[:] = new_dist
+        changed[:] = improved
+        return True
+
+    converged = False
+    for _ in range(num_nodes - 1):
+        if not relax_round():
+            converged = True
             break
 
+    if not converged:
+        converged = not (dist[src] + w < dist[dst]).any()
+
+    negative_cycle = []
+    if not converged:
+        stamp = np.full(num_nodes, -1, dtype=np.int64)
+        walk_id = 0
+        starts = None
+        for _ in range(num_nodes):
+            before = pred.copy()
+            relax_round()
+            # The first check walks from every node; after that a new cycle
+            # must go through a node whose predecessor just changed
+            if starts is None:
+                starts = range(num_nodes)
+            else:
+                starts = np.flatnonzero(pred != before).tolist()
+            cycle, walk_id = _find_pred_array_cycle(pred, starts, stamp, walk_id)
+            if cycle:
+                negative_cycle = [nodes[i] for i in cycle]
+                break
+
     return {
-        'distances': distances,
-        'predecessors': predecessors,
-        'has_negative_cycle': has_negative_cycle,
+        'distances': {node: float(d) for node, d in zip(nodes, dist)},
+        'predecessors': {node: (nodes[p] if p >= 0 else None) for node, p in zip(nodes, pred)},
+        'has_negative_cycle': not converged,
         'negative_cycle': negative_cycle
     }
 
+def bellman_ford_hop_limited(G, source, target, max_stops, weight="weight"):
+    """
+    Cheapest paths from source to target using at most k stops, for every
+    k from 0 to `max_stops`, in a single round-bounded Bellman-Ford run.
+
+    A path with k stops has k + 1 edges. Round h relaxes only the edges
+    leaving nodes whose cost improved in round h - 1, using the costs of
+    round h - 1, so after round h every cost is the cheapest one over
+    paths of at most h edges. Each node keeps the list of rounds in which
+    it improved, which is enough to rebuild the best path for any hop
+    limit without repeating the search.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph to search (uses get_vizinhos method), e.g. the directed
+        Grafo built by ``construir_grafo_parte2``
+    source : node
+        Starting node
+    target : node
+        Ending node
+    max_stops : int
+        Largest number of intermediate stops to report
+    weight : string, optional (default="weight")
+        Edge weight attribute name. Kept for API compatibility with
+        :func:`bellman_ford`; weights come from the adjacency list.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping each number of stops k (0..max_stops) to either
+        None, if target cannot be reached with at most k stops, or a dict
+        with:
+        - 'cost': cost of the cheapest path with at most k stops
+        - 'path': list of nodes of that path
+
+    Raises
+    ------
+    Exception
+        If source or target is not in graph, or if max_stops is negative
+
+    Notes
+    -----
+    Runs in O(max_stops * E) time in the worst case. Negative weights are
+    allowed: the hop limit bounds every path, so negative cycles cannot
+    make the costs diverge.
+
+    Examples
+    --------
+    >>> opcoes = bellman_ford_hop_limited(G, 'REC', 'LIS', 2)
+    >>> for paradas, opcao in opcoes.items():
+    ...     if opcao is not None:
+    ...         print(paradas, opcao['cost'], opcao['path'])
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
+    if target not in G:
+        raise Exception(f"Node {target} not found in graph")
+    if max_stops < 0:
+        raise Exception("max_stops must be non-negative")
+
+    distances = {source: 0}
+    # history[v] lists the rounds where v improved; parents[h][v] is the
+    # predecessor of v on the path found in round h
+    history = {source: [0]}
+    parents = [{}]
+    frontier = [source]
+
+    def rebuild(node, round_num):
+        path = [node]
+        while round_num > 0:
+            node = parents[round_num][node]
+            rounds = history[node]
+            round_num = rounds[bisect_right(rounds, round_num - 1) - 1]
+            path.append(node)
+        path.reverse()
+        return path
+
+    results = {}
+    for hops in range(1, max_stops + 2):
+        improved = {}
+        round_parents = {}
+        for u in frontier:
+            dist_u = distances[u]
+            neighbors = G.get_vizinhos(u)
+            if not neighbors:
+                continue
+            for v, edge_weight in neighbors:
+                new_dist = dist_u + edge_weight
+                if new_dist < improved.get(v, distances.get(v, float('inf'))):
+                    improved[v] = new_dist
+                    round_parents[v] = u
+
+        for v, new_dist in improved.items():
+            distances[v] = new_dist
+            history.setdefault(v, []).append(hops)
+        parents.append(round_parents)
+        frontier = list(improved)
+
+        if target in distances:
+            rounds = history[target]
+            results[hops - 1] = {
+                'cost': distances[target],
+                'path': rebuild(target, rounds[-1])
+            }
+        else:
+            results[hops - 1] = None
+
+    return results
+
 def bellman_ford_path(G, source, target, weight="weight"):
     """
     Returns the shortest path from source to target using Bellman-Ford.
 
+    Runs the queue-based variant :func:`bellman_ford_spfa`.
+
     Parameters
     ----------
     G : Graph object
@@ -976,7 +3756,7 @@ def bellman_ford_path(G, source, target, weight="weight"):
     if source == target:
         return [source]
 
-    result = bellman_ford(G, source, weight)
+    result = bellman_ford_spfa(G, source, weight)
 
     if result['has_negative_cycle']:
         raise Exception(f"Negative cycle detected: {result['negative_cycle']}")
@@ -998,6 +3778,8 @@ def bellman_ford_path_length(G, source, target, weight="weight"):
     """
     Returns the shortest path length from source to target using Bellman-Ford.
 
+    Runs the queue-based variant :func:`bellman_ford_spfa`.
+
     Parameters
     ----------
     G : Graph object
@@ -1027,10 +3809,700 @@ def bellman_ford_path_length(G, source, target, weight="weight"):
     if source == target:
         return 0
 
-    result = bellman_ford(G, source, weight)
+    result = bellman_ford_spfa(G, source, weight)
 
     if result['has_negative_cycle']:
         raise Exception(f"Negative cycle detected: {result['negative_cycle']}")
 
     return result['distances'][target]
 
+
+
+# ===================================================================
+# CENTRALITY
+# ===================================================================
+
+def _brandes_accumulate(indptr, indices, weights, tails, num_nodes, sources, weighted,
+                        squares=False):
+    """
+    Brandes dependency accumulation from each of `sources`, on CSR lists.
+
+    The buffers (dist, sigma, delta) are allocated once and only the
+    entries touched by a source are reset. Instead of predecessor lists,
+    every edge slot scanned during the search is recorded; walking them
+    backwards and keeping the slots that lie on a shortest path
+    (dist[w] == dist[v] + w(v, w)) accumulates dependencies in the right
+    order, since the tail of such an edge is settled before its head.
+
+    Returns per-node dependency sums, per-node sums of squares (only when
+    `squares`, for sampling error estimates) and per-slot edge sums.
+    """
+    node_sums = [0.0] * num_nodes
+    node_squares = [0.0] * num_nodes if squares else None
+    edge_sums = [0.0] * len(indices)
+
+    dist = [-1.0] * num_nodes
+    sigma = [0] * num_nodes
+    delta = [0.0] * num_nodes
+    settled = bytearray(num_nodes)
+
+    for s in sources:
+        order = []
+        scanned = []
+        dist[s] = 0.0
+        sigma[s] = 1
+
+        if weighted:
+            c = count()
+            fringe = [(0.0, next(c), s)]
+            while fringe:
+                d, _, v = heappop(fringe)
+                if settled[v]:
+                    continue
+                settled[v] = 1
+                order.append(v)
+                sigma_v = sigma[v]
+                for slot in range(indptr[v], indptr[v + 1]):
+                    w = indices[slot]
+                    if settled[w]:
+                        continue
+                    vw_dist = d + weights[slot]
+                    if dist[w] < 0 or vw_dist < dist[w]:
+                        dist[w] = vw_dist
+                        sigma[w] = sigma_v
+                        heappush(fringe, (vw_dist, next(c), w))
+                        scanned.append(slot)
+                    elif vw_dist == dist[w]:
+                        sigma[w] += sigma_v
+                        scanned.append(slot)
+        else:
+            queue = deque([s])
+            settled[s] = 1
+            while queue:
+                v = queue.popleft()
+                order.append(v)
+                sigma_v = sigma[v]
+                vw_dist = dist[v] + 1.0
+                for slot in range(indptr[v], indptr[v + 1]):
+                    w = indices[slot]
+                    if not settled[w]:
+                        settled[w] = 1
+                        dist[w] = vw_dist
+                        sigma[w] = sigma_v
+                        queue.append(w)
+                        scanned.append(slot)
+                    elif dist[w] == vw_dist:
+                        sigma[w] += sigma_v
+                        scanned.append(slot)
+
+        for slot in reversed(scanned):
+            v, w = tails[slot], indices[slot]
+            if dist[w] == dist[v] + (weights[slot] if weighted else 1.0):
+                contribution = sigma[v] / sigma[w] * (1.0 + delta[w])
+                delta[v] += contribution
+                edge_sums[slot] += contribution
+
+        for v in order:
+            if v != s:
+                node_sums[v] += delta[v]
+                if squares:
+                    node_squares[v] += delta[v] * delta[v]
+            dist[v] = -1.0
+            sigma[v] = 0
+            delta[v] = 0.0
+            settled[v] = 0
+
+    return node_sums, node_squares, edge_sums
+
+# Per-process CSR lists used by the betweenness workers
+_BRANDES_SHARED = {}
+
+def _brandes_worker_init(indptr, indices, weights, tails, num_nodes, weighted, squares):
+    _BRANDES_SHARED.update(indptr=indptr, indices=indices, weights=weights, tails=tails,
+                           num_nodes=num_nodes, weighted=weighted, squares=squares)
+
+def _brandes_worker(sources):
+    shared = _BRANDES_SHARED
+    return _brandes_accumulate(shared['indptr'], shared['indices'], shared['weights'],
+                               shared['tails'], shared['num_nodes'], sources,
+                               shared['weighted'], shared['squares'])
+
+def betweenness_centrality(G, weighted=False, normalized=True, k=None, seed=None, workers=1):
+    """
+    Node and edge betweenness centrality with Brandes' algorithm.
+
+    One BFS (or Dijkstra, when `weighted`) per source over the CSR view,
+    followed by the backward dependency accumulation; O(VE) unweighted
+    and O(VE + V^2 log V) weighted. Scaling follows NetworkX.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    weighted : bool, optional (default=False)
+        Use edge weights as path lengths instead of hop counts
+    normalized : bool, optional (default=True)
+        Divide node scores by (n-1)(n-2) and edge scores by n(n-1);
+        otherwise undirected scores are halved, since every path is
+        counted from both ends
+    k : int, optional
+        Number of random pivot sources for the sampled approximation
+        (default: every node, exact)
+    seed : int, optional
+        Seed of the pivot sampling
+    workers : int, optional (default=1)
+        With more than one, sources are split across a process pool and
+        the partial dependency sums are added up
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'nodes': dict mapping node -> betweenness
+        - 'edges': dict mapping (u, v) -> edge betweenness; on undirected
+          graphs u is the endpoint inserted first and parallel edges share
+          one key
+        - 'num_sources': number of sources used
+        - 'std_error': dict mapping node -> standard error of the sampled
+          estimate (same scale as 'nodes'), or None when exact
+
+    Raises
+    ------
+    ValueError
+        If `k` is not between 1 and the number of nodes, or a weighted
+        search reaches a negative weight
+
+    Notes
+    -----
+    With pivots the score of each node is n / k times the sum of its
+    dependencies on the k sources, an unbiased estimate of the exact
+    value; the standard error comes from the variance of those
+    dependencies across pivots, with the finite-population correction
+    for sampling without replacement.
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    if k is None:
+        sources = list(range(num_nodes))
+    else:
+        if not 1 <= k <= num_nodes:
+            raise ValueError(f"k must be between 1 and {num_nodes}, got {k}")
+        sources = sorted(random.Random(seed).sample(range(num_nodes), k))
+    sampled = k is not None and k < num_nodes
+
+    args = (csr.indptr.tolist(), csr.indices.tolist(), csr.pesos.tolist(),
+            csr.origens().tolist(), num_nodes, weighted, sampled)
+
+    if workers > 1 and len(sources) > 1:
+        chunks = [sources[i::workers * 4] for i in range(min(len(sources), workers * 4))]
+        node_sums = np.zeros(num_nodes)
+        node_squares = np.zeros(num_nodes)
+        edge_sums = np.zeros(len(csr.indices))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_brandes_worker_init,
+                                 initargs=args) as pool:
+            for part_nodes, part_squares, part_edges in pool.map(_brandes_worker, chunks):
+                node_sums += part_nodes
+                edge_sums += part_edges
+                if sampled:
+                    node_squares += part_squares
+    else:
+        node_sums, node_squares, edge_sums = _brandes_accumulate(*args[:5], sources, weighted, sampled)
+        node_sums, edge_sums = np.asarray(node_sums), np.asarray(edge_sums)
+        node_squares = np.asarray(node_squares) if sampled else None
+
+    # Same scaling as NetworkX's _rescale / _rescale_e
+    n = num_nodes
+    if normalized:
+        node_scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+        edge_scale = 1 / (n * (n - 1)) if n > 1 else 1.0
+    else:
+        node_scale = edge_scale = 1.0 if csr.dirigido else 0.5
+    if sampled:
+        node_scale *= n / k
+        edge_scale *= n / k
+
+    nodes = csr.nos
+    result_nodes = dict(zip(nodes, (node_sums * node_scale).tolist()))
+
+    result_edges = {}
+    tails = csr.origens().tolist()
+    for slot, score in enumerate((edge_sums * edge_scale).tolist()):
+        u, v = tails[slot], int(csr.indices[slot])
+        if not csr.dirigido and v < u:
+            u, v = v, u
+        key = (nodes[u], nodes[v])
+        result_edges[key] = result_edges.get(key, 0.0) + score
+
+    std_error = None
+    if sampled:
+        # node_scale already holds n / k; the dependencies are averaged over the k pivots
+        mean = node_sums / k
+        variance = np.maximum(node_squares / k - mean * mean, 0.0) * k / max(k - 1, 1)
+        correction = (n - k) / (n - 1) if n > 1 else 0.0
+        errors = node_scale * k * np.sqrt(variance / k * correction)
+        std_error = dict(zip(nodes, errors.tolist()))
+
+    return {
+        'nodes': result_nodes,
+        'edges': result_edges,
+        'num_sources': len(sources),
+        'std_error': std_error
+    }
+
+
+def _dijkstra_distance_sums(indptr, indices, weights, num_nodes, sources, by_target=False):
+    """
+    Distance sums of one Dijkstra per source, sharing the distance and
+    settled buffers across sources (only the touched entries are reset).
+
+    Returns three lists (sum of distances, nodes settled, sum of inverse
+    distances): indexed by source position, or by node when `by_target`
+    (each settled node adds its distance from every source).
+    """
+    size = num_nodes if by_target else len(sources)
+    totals, reached, inverse = [0.0] * size, [0] * size, [0.0] * size
+    dist = [-1.0] * num_nodes
+    settled = bytearray(num_nodes)
+
+    for position, s in enumerate(sources):
+        touched = [s]
+        dist[s] = 0.0
+        fringe = [(0.0, s)]
+        while fringe:
+            d, v = heappop(fringe)
+            if settled[v]:
+                continue
+            settled[v] = 1
+            i = v if by_target else position
+            totals[i] += d
+            reached[i] += 1
+            if d > 0:
+                inverse[i] += 1 / d
+            for slot in range(indptr[v], indptr[v + 1]):
+                w = indices[slot]
+                if settled[w]:
+                    continue
+                new_dist = d + weights[slot]
+                if dist[w] < 0:
+                    touched.append(w)
+                elif new_dist >= dist[w]:
+                    continue
+                dist[w] = new_dist
+                heappush(fringe, (new_dist, w))
+        for v in touched:
+            dist[v] = -1.0
+            settled[v] = 0
+
+    return totals, reached, inverse
+
+
+def _bfs_distance_sums(pull, num_nodes, sources, words, by_target=False):
+    """
+    Same sums as _dijkstra_distance_sums with hop distances, from batches
+    of bit-parallel BFS (see _bitset_bfs_levels).
+    """
+    size = num_nodes if by_target else len(sources)
+    totals, reached, inverse = np.zeros(size), np.zeros(size), np.zeros(size)
+    batch_size = 64 * words
+
+    for start in range(0, len(sources), batch_size):
+        ids = np.asarray(sources[start:start + batch_size], dtype=np.int64)
+        if by_target:
+            reached[ids] += 1
+        else:
+            reached[start:start + len(ids)] += 1
+        for level, nodes_reached, unpacked in _bitset_bfs_levels(pull, ids, words):
+            if by_target:
+                index, count = nodes_reached, unpacked.sum(axis=1)
+            else:
+                index, count = np.arange(start, start + len(ids)), unpacked.sum(axis=0)
+            totals[index] += level * count
+            reached[index] += count
+            inverse[index] += count / level
+
+    return totals, reached, inverse
+
+
+def _incoming_distance_sums(csr, weighted, targets, words=4):
+    """
+    For each node id in `targets`, the sums over the nodes v that reach it
+    of d(v, u), of 1 and of 1 / d(v, u) (the node itself included with
+    distance 0): one search per target on the reverse graph.
+    """
+    if weighted:
+        reverse = csr.transposta() if csr.dirigido else csr
+        sums = _dijkstra_distance_sums(reverse.indptr.tolist(), reverse.indices.tolist(),
+                                       reverse.pesos.tolist(), len(csr.nos), targets)
+    else:
+        # Pulling along the forward CSR is a search on the reverse graph
+        sums = _bfs_distance_sums(csr, len(csr.nos), targets, words)
+    return tuple(np.asarray(values, dtype=float) for values in sums)
+
+
+def _closeness_scores(totals, reached, num_nodes, wf_improved):
+    """ Closeness from distance sums, with NetworkX's Wasserman-Faust scaling. """
+    totals = np.asarray(totals, dtype=float)
+    others = np.asarray(reached, dtype=float) - 1
+    scores = np.divide(others, totals, out=np.zeros_like(totals), where=totals > 0)
+    if wf_improved and num_nodes > 1:
+        scores *= others / (num_nodes - 1)
+    return scores
+
+
+def closeness_centrality(G, weighted=False, wf_improved=True, words=4):
+    """
+    Closeness centrality of every node.
+
+    The closeness of u is (r - 1) / sum of d(v, u) over the r nodes that
+    reach u (u included), times (r - 1) / (n - 1) when `wf_improved`;
+    distances are incoming, as in NetworkX. Unweighted searches run as
+    bit-parallel BFS batches (64 * words targets at a time) and weighted
+    ones as Dijkstra runs sharing one set of buffers, so no per-source
+    dicts are built.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    weighted : bool, optional (default=False)
+        Use edge weights as path lengths instead of hop counts
+    wf_improved : bool, optional (default=True)
+        Scale by the fraction of nodes that reach u (Wasserman and Faust),
+        so nodes of small components are not rated as central
+    words : int, optional (default=4)
+        uint64 words per node in the unweighted BFS batches
+
+    Returns
+    -------
+    dict
+        Dictionary mapping node -> closeness (0 for nodes no one reaches)
+
+    Raises
+    ------
+    ValueError
+        If `weighted` and the graph has a negative weight
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    totals, reached, _ = _incoming_distance_sums(csr, weighted, list(range(num_nodes)), words)
+    scores = _closeness_scores(totals, reached, num_nodes, wf_improved)
+    return dict(zip(csr.nos, scores.tolist()))
+
+
+def harmonic_centrality(G, weighted=False, words=4):
+    """
+    Harmonic centrality of every node: the sum of 1 / d(v, u) over the
+    nodes v that reach u at a positive distance (unreachable nodes add 0).
+    Computed like closeness_centrality.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    weighted : bool, optional (default=False)
+        Use edge weights as path lengths instead of hop counts
+    words : int, optional (default=4)
+        uint64 words per node in the unweighted BFS batches
+
+    Returns
+    -------
+    dict
+        Dictionary mapping node -> harmonic centrality
+
+    Raises
+    ------
+    ValueError
+        If `weighted` and the graph has a negative weight
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    _, _, inverse = _incoming_distance_sums(csr, weighted, list(range(num_nodes)), words)
+    return dict(zip(csr.nos, inverse.tolist()))
+
+
+def top_k_closeness(G, k, weighted=False, harmonic=False, wf_improved=True,
+                    num_pivots=None, num_candidates=None, seed=None, words=4):
+    """
+    The k nodes of highest closeness (or harmonic) centrality without a
+    search from every node.
+
+    Random pivots run one forward search each; every node's incoming
+    distance sums are estimated from its distances to the pivots, scaled
+    by n / num_pivots (Eppstein and Wang; Okamoto, Chen and Li). The
+    `num_candidates` best estimates then get an exact search each and
+    the k best exact scores are returned.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    k : int
+        Number of nodes to return
+    weighted : bool, optional (default=False)
+        Use edge weights as path lengths instead of hop counts
+    harmonic : bool, optional (default=False)
+        Rank by harmonic centrality instead of closeness
+    wf_improved : bool, optional (default=True)
+        Wasserman-Faust scaling of closeness (see closeness_centrality)
+    num_pivots : int, optional
+        Number of sampled pivots (default: n^(2/3), at most n)
+    num_candidates : int, optional
+        Nodes refined exactly (default: max(2k, k + sqrt(n)), at most n)
+    seed : int, optional
+        Seed of the pivot sampling
+    words : int, optional (default=4)
+        uint64 words per node in the unweighted BFS batches
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'top': list of (node, score) pairs, best first, with exact scores
+        - 'num_pivots': number of pivot searches
+        - 'num_exact': number of exact searches on candidates
+
+    Raises
+    ------
+    ValueError
+        If `k` is not between 1 and the number of nodes, or `weighted`
+        and the graph has a negative weight
+
+    Notes
+    -----
+    The scores in 'top' are exact, but a node whose estimate falls
+    outside the candidates is missed; more pivots or candidates make
+    that less likely. With num_pivots = n the estimates are exact.
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if not 1 <= k <= num_nodes:
+        raise ValueError(f"k must be between 1 and {num_nodes}, got {k}")
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    if num_pivots is None:
+        num_pivots = int(np.ceil(num_nodes ** (2 / 3)))
+    num_pivots = max(1, min(num_pivots, num_nodes))
+    if num_candidates is None:
+        num_candidates = max(2 * k, k + int(np.ceil(np.sqrt(num_nodes))))
+    num_candidates = max(k, min(num_candidates, num_nodes))
+
+    def scores(totals, reached, inverse):
+        if harmonic:
+            return np.asarray(inverse, dtype=float)
+        return _closeness_scores(totals, reached, num_nodes, wf_improved)
+
+    # Estimates: forward searches from the pivots, summed at each reached node
+    pivots = sorted(random.Random(seed).sample(range(num_nodes), num_pivots))
+    if weighted:
+        sums = _dijkstra_distance_sums(csr.indptr.tolist(), csr.indices.tolist(),
+                                       csr.pesos.tolist(), num_nodes, pivots, by_target=True)
+    else:
+        pull = csr.transposta() if csr.dirigido else csr
+        sums = _bfs_distance_sums(pull, num_nodes, pivots, words, by_target=True)
+    scale = num_nodes / num_pivots
+    totals, reached, inverse = (np.asarray(values, dtype=float) * scale for values in sums)
+    # Reach is at least the node itself, so estimates stay comparable for nodes no pivot reached
+    estimates = scores(totals, np.maximum(reached, 1), inverse)
+
+    candidates = np.argsort(-estimates, kind='stable')[:num_candidates].tolist()
+    exact = scores(*_incoming_distance_sums(csr, weighted, candidates, words))
+    best = np.argsort(-exact, kind='stable')[:k]
+
+    return {
+        'top': [(csr.nos[candidates[i]], float(exact[i])) for i in best],
+        'num_pivots': num_pivots,
+        'num_exact': len(candidates)
+    }
+
+
+def _node_distribution(csr, values, name):
+    """ Array aligned with csr.nos from a {node: weight} dict, normalized to sum 1. """
+    vector = np.zeros(len(csr.nos))
+    for node, value in values.items():
+        if node not in csr.indice:
+            raise Exception(f"Node {node} not found in graph")
+        vector[csr.indice[node]] = value
+    if (vector < 0).any() or vector.sum() <= 0:
+        raise ValueError(f"{name} must have non-negative values with a positive sum")
+    return vector / vector.sum()
+
+
+def pagerank(G, alpha=0.85, personalization=None, dangling=None, start=None,
+             tol=1e-6, max_iter=100, weighted=False):
+    """
+    PageRank by power iteration on the CSR arrays.
+
+    Each iteration is one np.bincount over the edge slots: every node
+    sends alpha times its score along its out-edges (split evenly, or in
+    proportion to the weights when `weighted`), the score of dangling
+    nodes (no out-edges, or zero total weight) is spread over `dangling`,
+    and 1 - alpha teleports over `personalization`. Undirected edges
+    count in both directions.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses the para_csr method)
+    alpha : float, optional (default=0.85)
+        Damping factor: probability of following an edge
+    personalization : dict, optional
+        node -> teleport weight (default: uniform); missing nodes get 0
+    dangling : dict, optional
+        node -> weight for the mass of dangling nodes (default: the
+        personalization distribution)
+    start : dict, optional
+        node -> initial score, e.g. the 'scores' of a previous run on the
+        graph before a small edit (warm start); missing nodes start at 0
+        and the vector is normalized (default: uniform)
+    tol : float, optional (default=1e-6)
+        Stop when the L1 change of an iteration is below n * tol
+    max_iter : int, optional (default=100)
+        Maximum number of iterations
+    weighted : bool, optional (default=False)
+        Use edge weights as transition weights
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'scores': dict mapping node -> PageRank (summing to 1)
+        - 'iterations': number of iterations run
+
+    Raises
+    ------
+    Exception
+        If a node of `personalization`, `dangling` or `start` is not in
+        graph, or the iteration does not converge in `max_iter` steps
+    ValueError
+        If a distribution has negative values or sums to zero, or
+        `weighted` and the graph has a negative weight
+    """
+    csr = G.para_csr()
+    num_nodes = len(csr.nos)
+    if num_nodes == 0:
+        return {'scores': {}, 'iterations': 0}
+    if weighted and (csr.pesos < 0).any():
+        raise ValueError("weighted=True requires non-negative edge weights")
+
+    tails = csr.origens()
+    slot_weights = csr.pesos if weighted else np.ones(len(csr.indices))
+    out_weight = np.bincount(tails, weights=slot_weights, minlength=num_nodes)
+    is_dangling = out_weight == 0
+    inverse = np.divide(1.0, out_weight, out=np.zeros(num_nodes), where=~is_dangling)
+    slot_probability = slot_weights * inverse[tails]
+
+    uniform = np.full(num_nodes, 1.0 / num_nodes)
+    teleport = uniform if personalization is None else \
+        _node_distribution(csr, personalization, "personalization")
+    dangling_weights = teleport if dangling is None else \
+        _node_distribution(csr, dangling, "dangling")
+    x = uniform if start is None else _node_distribution(csr, start, "start")
+
+    for iteration in range(1, max_iter + 1):
+        x_last = x
+        spread = np.bincount(csr.indices, weights=x_last[tails] * slot_probability,
+                             minlength=num_nodes)
+        x = alpha * (spread + x_last[is_dangling].sum() * dangling_weights) + (1 - alpha) * teleport
+        if np.abs(x - x_last).sum() < num_nodes * tol:
+            return {'scores': dict(zip(csr.nos, x.tolist())), 'iterations': iteration}
+
+    raise Exception(f"PageRank failed to converge in {max_iter} iterations.")
+
+
+def personalized_pagerank(G, source, alpha=0.85, epsilon=1e-7, weighted=False):
+    """
+    PageRank personalized to `source`, by local push (Andersen, Chung and Lang).
+
+    Keeps an estimate p and a residual r (initially all mass on the
+    source). Pushing a node u with r[u] > epsilon * outdeg(u) moves
+    (1 - alpha) * r[u] into p[u] and alpha * r[u] to the residuals of its
+    out-neighbors (back to the source when u is dangling). Only nodes that
+    receive enough residual are ever visited, so the cost depends on
+    epsilon and not on the size of the graph.
+
+    Parameters
+    ----------
+    G : Graph object
+        The graph (uses its adjacency lists; no CSR is built)
+    source : node
+        Node every teleport returns to
+    alpha : float, optional (default=0.85)
+        Damping factor: probability of following an edge
+    epsilon : float, optional (default=1e-7)
+        Residual per out-edge below which a node is not pushed
+    weighted : bool, optional (default=False)
+        Use edge weights as transition weights
+
+    Returns
+    -------
+    dict
+        Dictionary with:
+        - 'scores': dict mapping node -> estimate, for the nodes reached
+          (the others are below the error bound)
+        - 'residual': residual mass left, an upper bound on the L1 error
+          against pagerank(G, personalization={source: 1})
+        - 'pushes': number of push operations
+
+    Raises
+    ------
+    Exception
+        If source is not in graph
+    ValueError
+        If `weighted` and a visited node has a negative weight
+    """
+    if source not in G:
+        raise Exception(f"Node {source} not found in graph")
+
+    adj = G.adj
+    estimate = {}
+    residual = {source: 1.0}
+    queue = deque([source])
+    queued = {source}
+    pushes = 0
+
+    def threshold(node):
+        return epsilon * max(len(adj[node]), 1)
+
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        mass = residual[u]
+        if mass <= threshold(u):
+            continue
+        residual[u] = 0.0
+        estimate[u] = estimate.get(u, 0.0) + (1 - alpha) * mass
+        pushes += 1
+
+        neighbors = adj[u]
+        if weighted:
+            if any(w < 0 for _, w in neighbors):
+                raise ValueError("weighted=True requires non-negative edge weights")
+            total = sum(w for _, w in neighbors)
+            shares = [(v, w / total) for v, w in neighbors] if total > 0 else []
+        else:
+            shares = [(v, 1 / len(neighbors)) for v, _ in neighbors]
+        if not shares:
+            shares = [(source, 1.0)]  # dangling: the walk restarts at the source
+
+        for v, share in shares:
+            value = residual.get(v, 0.0) + alpha * mass * share
+            residual[v] = value
+            if v not in queued and value > threshold(v):
+                queue.append(v)
+                queued.add(v)
+
+    return {
+        'scores': estimate,
+        'residual': sum(residual.values()),
+        'pushes': pushes
+    }
@@ -1,14 +1,65 @@
 # Em: src/graphs/graph.py
 
+import numpy as np
+
+from .union_find import UnionFind
+
+
+class GrafoCSR:
+    """
+    Representação compacta (CSR) de um Grafo, com os nós indexados de 0 a n-1.
+
+    Os vizinhos do nó i ficam em indices[indptr[i]:indptr[i + 1]], com os pesos
+    nas mesmas posições de `pesos`, na mesma ordem de Grafo.get_vizinhos.
+    """
+
+    def __init__(self, nos, indptr, indices, pesos, dirigido):
+        self.nos = nos
+        self.indice = {no: i for i, no in enumerate(nos)}
+        self.indptr = indptr
+        self.indices = indices
+        self.pesos = pesos
+        self.dirigido = dirigido
+        self._transposta = None
+
+    def get_numero_de_nos(self):
+        """ Retorna o número de nós (vértices) no grafo. """
+        return len(self.nos)
+
+    def get_numero_de_posicoes(self):
+        """ Retorna o número de posições de aresta (2x as arestas em grafos não-dirigidos). """
+        return len(self.indices)
+
+    def origens(self):
+        """ Retorna o array com o nó de origem de cada posição de aresta. """
+        return np.repeat(np.arange(len(self.nos), dtype=np.int64), np.diff(self.indptr))
+
+    def transposta(self):
+        """ Retorna a CSR com todas as arestas invertidas (vizinhos de entrada), guardada em cache. """
+        if self._transposta is None:
+            n = len(self.nos)
+            origens = self.origens()
+            ordem = np.argsort(self.indices, kind='stable')
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=n), out=indptr[1:])
+            self._transposta = GrafoCSR(self.nos, indptr, origens[ordem], self.pesos[ordem], self.dirigido)
+            self._transposta._transposta = self
+        return self._transposta
+
+
 class Grafo: 
     def __init__(self, dirigido=False):
         self.adj = {}
         self.num_arestas = 0  # Correto!
         self.dirigido = dirigido
+        self._csr = None
+        self.componentes = UnionFind()  # componentes (fracamente) conexas, atualizadas a cada aresta
     
     def add_node(self, no):
         if no not in self.adj:
             self.adj[no] = []
+            self.componentes.add(no)
+            self._csr = None
 
     def add_edge(self, origem, destino, peso):
         
@@ -21,6 +72,8 @@ class Grafo:
             self.adj[destino].append((origem, peso))
 
         self.num_arestas += 1
+        self.componentes.union(origem, destino)
+        self._csr = None
 
     def get_numero_de_nos(self):
         """ Retorna o número de nós (vértices) no grafo. """
@@ -41,6 +94,30 @@ class Grafo:
         else:
             return []
         
+    # ----------------------------------------------------
+    # Componentes conexas (union-find incremental)
+    # ----------------------------------------------------
+
+    def mesmo_componente(self, u, v):
+        """ Retorna True se u e v estão na mesma componente (fracamente conexa, se dirigido). """
+        return self.componentes.same_component(u, v)
+
+    def get_componente(self, no):
+        """ Retorna o representante da componente de um nó. """
+        return self.componentes.find(no)
+
+    def get_tamanho_componente(self, no):
+        """ Retorna o número de nós da componente de um nó. """
+        return self.componentes.size(no)
+
+    def get_numero_de_componentes(self):
+        """ Retorna o número de componentes conexas. """
+        return self.componentes.num_componentes
+
+    def get_componentes(self):
+        """ Retorna {nó: id da componente}, com ids de 0 a n-1. """
+        return self.componentes.component_ids()
+
     # ----------------------------------------------------
     # Métodos necessários para usar Dijkstra
     # ----------------------------------------------------
@@ -59,4 +136,25 @@ class Grafo:
         adj_dict = {}
         for origem, vizinhos in self.adj.items():
             adj_dict[origem] = {destino: {'weight': peso} for destino, peso in vizinhos}
-        return adj_dict
\ No newline at end of file
+        return adj_dict
+
+    # ----------------------------------------------------
+    # Representação em arrays (CSR)
+    # ----------------------------------------------------
+
+    def para_csr(self):
+        """ Retorna a representação CSR do grafo, guardada em cache até a próxima alteração. """
+        if self._csr is None:
+            nos = list(self.adj.keys())
+            indice = {no: i for i, no in enumerate(nos)}
+
+            indptr = np.zeros(len(nos) + 1, dtype=np.int64)
+            np.cumsum([len(self.adj[no]) for no in nos], out=indptr[1:])
+
+            indices = np.fromiter((indice[v] for no in nos for v, _ in self.adj[no]),
+                                  dtype=np.int64, count=int(indptr[-1]))
+            pesos = np.fromiter((peso for no in nos for _, peso in self.adj[no]),
+                                dtype=np.float64, count=int(indptr[-1]))
+
+            self._csr = GrafoCSR(nos, indptr, indices, pesos, self.dirigido)
+        return self._csr
@@ -0,0 +1,116 @@
+# Em: src/graphs/heap.py
+
+class IndexedDaryHeap:
+    """
+    Heap d-ário de mínimo indexado por id inteiro (0 a capacidade - 1), com decrease-key.
+
+    Cada id aparece no máximo uma vez: em vez de empilhar uma nova tupla a cada
+    melhoria (deleção preguiçosa), a chave do id é diminuída no lugar. O heap
+    nunca passa de `capacidade` itens e não aloca nada por relaxamento, o que
+    serve a Dijkstra, A* e Prim.
+    """
+
+    def __init__(self, capacidade, d=4):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        self.d = d
+        self.heap = []                      # ids em ordem de heap
+        self.chaves = [None] * capacidade   # chave de cada id
+        self.pos = [-1] * capacidade        # posição de cada id em self.heap (-1 = fora)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, id_):
+        return self.pos[id_] >= 0
+
+    def chave(self, id_):
+        """ Retorna a chave atual de um id que está no heap. """
+        return self.chaves[id_]
+
+    def push(self, id_, chave):
+        """ Insere um id que não está no heap. """
+        if self.pos[id_] >= 0:
+            raise ValueError(f"id {id_} is already in the heap")
+        self.chaves[id_] = chave
+        self.pos[id_] = len(self.heap)
+        self.heap.append(id_)
+        self._subir(len(self.heap) - 1)
+
+    def decrease_key(self, id_, chave):
+        """ Diminui a chave de um id que está no heap. """
+        if self.pos[id_] < 0:
+            raise ValueError(f"id {id_} is not in the heap")
+        if chave > self.chaves[id_]:
+            raise ValueError("new key is greater than the current key")
+        self.chaves[id_] = chave
+        self._subir(self.pos[id_])
+
+    def push_or_decrease(self, id_, chave):
+        """
+        Insere o id, ou diminui sua chave se a nova for menor.
+        Retorna True se o heap mudou.
+        """
+        if self.pos[id_] < 0:
+            self.push(id_, chave)
+            return True
+        if chave < self.chaves[id_]:
+            self.chaves[id_] = chave
+            self._subir(self.pos[id_])
+            return True
+        return False
+
+    def peek(self):
+        """ Retorna (id, chave) do mínimo sem removê-lo. """
+        id_ = self.heap[0]
+        return id_, self.chaves[id_]
+
+    def pop(self):
+        """ Remove e retorna (id, chave) do mínimo. """
+        heap = self.heap
+        topo = heap[0]
+        ultimo = heap.pop()
+        if heap:
+            heap[0] = ultimo
+            self.pos[ultimo] = 0
+            self._descer(0)
+        self.pos[topo] = -1
+        return topo, self.chaves[topo]
+
+    def _subir(self, i):
+        heap, chaves, pos, d = self.heap, self.chaves, self.pos, self.d
+        id_ = heap[i]
+        chave = chaves[id_]
+        while i > 0:
+            pai = (i - 1) // d
+            id_pai = heap[pai]
+            if chaves[id_pai] <= chave:
+                break
+            heap[i] = id_pai
+            pos[id_pai] = i
+            i = pai
+        heap[i] = id_
+        pos[id_] = i
+
+    def _descer(self, i):
+        heap, chaves, pos, d = self.heap, self.chaves, self.pos, self.d
+        n = len(heap)
+        id_ = heap[i]
+        chave = chaves[id_]
+        while True:
+            primeiro = d * i + 1
+            if primeiro >= n:
+                break
+            menor = primeiro
+            chave_menor = chaves[heap[primeiro]]
+            for filho in range(primeiro + 1, min(primeiro + d, n)):
+                chave_filho = chaves[heap[filho]]
+                if chave_filho < chave_menor:
+                    menor, chave_menor = filho, chave_filho
+            if chave_menor >= chave:
+                break
+            heap[i] = heap[menor]
+            pos[heap[i]] = i
+            i = menor
+        heap[i] = id_
+        pos[id_] = i
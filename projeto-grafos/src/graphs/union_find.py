@@ -0,0 +1,93 @@
+# Em: src/graphs/union_find.py
+
+class UnionFind:
+    """
+    Conjuntos disjuntos (union-find) com compressão de caminho e união por rank.
+
+    Guarda as componentes conexas de um grafo enquanto as arestas chegam: cada
+    aresta é uma união e a pergunta "u e v estão na mesma componente?" custa
+    tempo quase constante (inversa de Ackermann), sem nenhuma busca no grafo.
+    Não suporta remoção de arestas.
+    """
+
+    def __init__(self, elementos=()):
+        self.pai = {}            # pai de cada elemento (raiz aponta para si mesma)
+        self.rank = {}           # limite superior da altura da árvore de cada raiz
+        self.tamanho = {}        # tamanho do conjunto de cada raiz
+        self.num_componentes = 0
+        for x in elementos:
+            self.add(x)
+
+    def __len__(self):
+        return len(self.pai)
+
+    def __contains__(self, x):
+        return x in self.pai
+
+    def add(self, x):
+        """ Cria o conjunto unitário {x}, se x ainda não existir. """
+        if x not in self.pai:
+            self.pai[x] = x
+            self.rank[x] = 0
+            self.tamanho[x] = 1
+            self.num_componentes += 1
+
+    def find(self, x):
+        """ Retorna o representante do conjunto de x, comprimindo o caminho até ele. """
+        pai = self.pai
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    def union(self, a, b):
+        """
+        Une os conjuntos de a e b (criando-os se preciso).
+        Retorna True se eram conjuntos diferentes.
+        """
+        self.add(a)
+        self.add(b)
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.pai[rb] = ra
+        self.tamanho[ra] += self.tamanho.pop(rb)
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        del self.rank[rb]
+        self.num_componentes -= 1
+        return True
+
+    def same_component(self, a, b):
+        """ Retorna True se a e b existem e estão no mesmo conjunto. """
+        return a in self.pai and b in self.pai and self.find(a) == self.find(b)
+
+    def size(self, x):
+        """ Retorna o tamanho do conjunto de x. """
+        return self.tamanho[self.find(x)]
+
+    def component_ids(self):
+        """ Retorna {elemento: id}, com ids de 0 a num_componentes - 1 na ordem de inserção. """
+        ids = {}
+        resultado = {}
+        for x in self.pai:
+            raiz = self.find(x)
+            if raiz not in ids:
+                ids[raiz] = len(ids)
+            resultado[x] = ids[raiz]
+        return resultado
+
+    def component_sizes(self):
+        """ Retorna a lista de tamanhos, indexada pelos ids de component_ids(). """
+        tamanhos = []
+        vistos = set()
+        for x in self.pai:
+            raiz = self.find(x)
+            if raiz not in vistos:
+                vistos.add(raiz)
+                tamanhos.append(self.tamanho[raiz])
+        return tamanhos
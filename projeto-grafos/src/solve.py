@@ -5,9 +5,14 @@ import time
 
 from .graphs.graph import Grafo 
 from .graphs.io import carregar_dados_principais, carregar_dataset_parte2
-from .graphs.algorithms import dijkstra_path, dijkstra_path_length  
+from .graphs.algorithms import (dijkstra_path, dijkstra_path_length, betweenness_centrality,
+                               closeness_centrality, harmonic_centrality, top_k_closeness,
+                               pagerank, personalized_pagerank, core_number, k_core,
+                               ego_network_metrics, ego_networks, diameter, eccentricities,
+                               kruskal_mst, prim_mst)
 
 from .viz import (exportar_arvore_percurso_png, exportar_arvore_percurso_destacada,
+                  exportar_arvore_geradora_minima,
                   mapa_cores_por_grau, histograma_graus, ranking_densidade_por_microrregiao,
                   gerar_grafo_interativo, histograma_graus_parte2,
                   grafo_interativo_parte2_amostra, top_aeroportos_parte2)
@@ -21,11 +26,19 @@ FILE_OUT_GRAUS = os.path.join(OUTPUT_DIR, 'graus.csv')
 FILE_IN_ENDERECOS = os.path.join('data', 'enderecos.csv')          
 FILE_OUT_DIST = os.path.join(OUTPUT_DIR, 'distancias_enderecos.csv')
 FILE_OUT_JSON = os.path.join(OUTPUT_DIR, 'percurso_nova_descoberta_setubal.json')     
+FILE_OUT_ARESTAS_CRITICAS = os.path.join(OUTPUT_DIR, 'arestas_criticas.csv')
+FILE_OUT_BAIRROS_CRITICOS = os.path.join(OUTPUT_DIR, 'bairros_criticos.csv')
+FILE_OUT_BICONEXAS = os.path.join(OUTPUT_DIR, 'componentes_biconexas.json')
+FILE_OUT_MST = os.path.join(OUTPUT_DIR, 'arvore_geradora_minima.csv')
 
 FILE_IN_PARES_PARTE2 = os.path.join('data\dataset_parte2', 'pares_parte2.csv')
 FILE_OUT_PARTE2_DIJKSTRA_CSV = os.path.join(OUTPUT_DIR, 'parte2_dijkstra.csv')
 FILE_OUT_PARTE2_DIJKSTRA_JSON = os.path.join(OUTPUT_DIR, 'parte2_dijkstra.json')
 FILE_OUT_PARTE2_REPORT = os.path.join(OUTPUT_DIR, 'parte2_report.json')
+FILE_OUT_PARTE2_CLOSENESS = os.path.join(OUTPUT_DIR, 'parte2_closeness.csv')
+FILE_OUT_PARTE2_GRAUS = os.path.join(OUTPUT_DIR, 'parte2_graus.csv')
+FILE_OUT_PARTE2_EGO = os.path.join(OUTPUT_DIR, 'parte2_ego.csv')
+FILE_OUT_PARTE2_MST = os.path.join(OUTPUT_DIR, 'parte2_mst.csv')
 
 # ===================================================================
 # PARTE 1: CONSTRUÇÃO DO GRAFO
@@ -98,7 +111,23 @@ def analisar_grafo_completo(grafo_principal: Grafo):
     """
     metricas = _calcular_metricas_basicas(grafo_principal)
     
-    if metricas:       
+    if metricas:
+        # diâmetro (iFUB) e excentricidades (Takes-Kosters) na maior componente conexa
+        try:
+            for sufixo, ponderado in [('', False), ('_ponderado', True)]:
+                diam = diameter(grafo_principal, weighted=ponderado)
+                ecc = eccentricities(grafo_principal, weighted=ponderado)
+                metricas[f'diametro{sufixo}'] = diam['diameter']
+                metricas[f'raio{sufixo}'] = ecc['radius']
+                metricas[f'par_diametral{sufixo}'] = list(diam['endpoints'])
+                metricas[f'centro{sufixo}'] = ecc['center']
+                metricas[f'periferia{sufixo}'] = ecc['periphery']
+            metricas['componente_diametro'] = diam['component_size']
+            print(f"Diâmetro: {metricas['diametro']} saltos, {metricas['diametro_ponderado']} ponderado "
+                  f"(raio {metricas['raio']} / {metricas['raio_ponderado']})")
+        except Exception as e:
+            print(f"Erro ao calcular diâmetro e excentricidades: {e}")
+
         try:
             with open(FILE_OUT_GLOBAL, 'w', encoding='utf-8') as f:
                 json.dump(metricas, f, indent=4, ensure_ascii=False)
@@ -155,53 +184,30 @@ def analisar_microrregioes(df_bairros: pd.DataFrame, df_adjacencias: pd.DataFram
 
     return resultados_rpa
 
-def analisar_ego_redes(grafo_principal: Grafo, df_adjacencias: pd.DataFrame):
+def analisar_ego_redes(grafo_principal: Grafo, df_adjacencias: pd.DataFrame = None):
     """
     Ponto 3 da entrega: Calcula métricas da ego-rede para cada bairro
     e salva em 'out/ego_bairro.csv'.
+
+    As arestas da ego-rede de v são as arestas de v mais uma por triângulo
+    que passa por v, então tudo sai de uma contagem de triângulos no grafo
+    (ego_network_metrics), sem percorrer as adjacências para cada bairro.
+    df_adjacencias não é mais necessário (o grafo já tem todas as arestas).
     """
     print("Ponto 3: Ego-Redes por Bairro")
     print("-" * 80)
-    resultados_ego = []
 
-    if not hasattr(grafo_principal, 'get_todos_os_nos') or not hasattr(grafo_principal, 'get_vizinhos'):
-        print("Erro: A classe 'Grafo' precisa dos métodos 'get_todos_os_nos()' e 'get_vizinhos(nome_no)'.")
-        return None
+    metricas = ego_network_metrics(grafo_principal)
 
-    for bairro_v in grafo_principal.get_todos_os_nos():
-        try:
-            vizinhos = set()
-            vizinhos_com_peso = grafo_principal.get_vizinhos(bairro_v)
-            if vizinhos_com_peso:
-                 for vizinho, peso in vizinhos_com_peso:
-                    vizinhos.add(vizinho)
-
-            grau = len(vizinhos)
-            nos_da_ego_rede = set(vizinhos)
-            nos_da_ego_rede.add(bairro_v) 
-
-            ordem_ego = len(nos_da_ego_rede) 
-
-            tamanho_ego = 0
-            for index, linha in df_adjacencias.iterrows():
-                u, v = linha['bairro_origem'], linha['bairro_destino']
-                if u in nos_da_ego_rede and v in nos_da_ego_rede:
-                    tamanho_ego += 1
-                    
-            if ordem_ego > 1:
-                densidade_ego = (2 * tamanho_ego) / (ordem_ego * (ordem_ego - 1))
-            else:
-                densidade_ego = 0.0
-
-            resultados_ego.append({
-                'bairro': bairro_v, 'grau': grau,
-                'ordem_ego': ordem_ego, 'tamanho_ego': tamanho_ego,
-                'densidade_ego': densidade_ego
-            })
-        
-        except Exception as e:
-            print(f"Erro ao processar ego-rede de '{bairro_v}': {e}")
-            continue
+    # grau = vizinhos distintos, contando o próprio bairro se houver laço
+    resultados_ego = {
+        'bairro': metricas['nodes'],
+        'grau': metricas['degree'] + (metricas['self_loops'] > 0),
+        'ordem_ego': metricas['ego_order'],
+        'tamanho_ego': metricas['ego_size'],
+        'densidade_ego': metricas['ego_density'],
+        'clustering': metricas['clustering']
+    }
 
     df_ego_final = pd.DataFrame(resultados_ego)
     
@@ -240,6 +246,19 @@ def analisar_graus_e_rankings(grafo_principal: Grafo):
     
     df_graus = pd.DataFrame(lista_graus)
 
+    # betweenness (Brandes, pesos como comprimento): quanto o bairro intermedeia caminhos mínimos
+    betweenness = betweenness_centrality(grafo_principal, weighted=True)['nodes']
+    df_graus['betweenness'] = df_graus['bairro'].map(betweenness)
+
+    # closeness e harmônica (pesos como comprimento): quão perto o bairro está de todos os outros
+    closeness = closeness_centrality(grafo_principal, weighted=True)
+    harmonica = harmonic_centrality(grafo_principal, weighted=True)
+    df_graus['closeness'] = df_graus['bairro'].map(closeness)
+    df_graus['harmonica'] = df_graus['bairro'].map(harmonica)
+
+    # core (k-core): maior k tal que o bairro está num subgrafo onde todos têm grau >= k
+    core = core_number(grafo_principal)
+    df_graus['core'] = df_graus['bairro'].map(core)
 
     # salvar
     try:
@@ -258,6 +277,27 @@ def analisar_graus_e_rankings(grafo_principal: Grafo):
     except Exception as e:
         print(f"  ! Erro ao encontrar maior grau: {e}")
 
+    try:
+        idx_max_bet = df_graus['betweenness'].idxmax()
+        print(f"  ✓ Bairro com maior betweenness: {df_graus.loc[idx_max_bet, 'bairro'].title()} "
+              f"({df_graus.loc[idx_max_bet, 'betweenness']:.4f})")
+    except Exception as e:
+        print(f"  ! Erro ao encontrar maior betweenness: {e}")
+
+    try:
+        idx_max_clo = df_graus['closeness'].idxmax()
+        print(f"  ✓ Bairro com maior closeness: {df_graus.loc[idx_max_clo, 'bairro'].title()} "
+              f"({df_graus.loc[idx_max_clo, 'closeness']:.4f})")
+    except Exception as e:
+        print(f"  ! Erro ao encontrar maior closeness: {e}")
+
+    try:
+        nucleo = k_core(grafo_principal, core=core)
+        print(f"  ✓ Núcleo mais denso ({max(core.values())}-core): {nucleo.get_numero_de_nos()} bairros, "
+              f"{nucleo.get_numero_de_arestas()} adjacências")
+    except Exception as e:
+        print(f"  ! Erro ao calcular o k-core: {e}")
+
     # calcular e printar mais denso
     try:
         df_ego = pd.read_csv(FILE_OUT_EGO)
@@ -370,6 +410,102 @@ def gerar_arvore_percurso(grafo):
     print("  ✓ out/arvore_percurso.png")
     print("  ✓ out/arvore_percurso_destacada.png\n")
 
+# --- árvore geradora mínima: a malha mais barata que liga todos os bairros ---
+
+def gerar_arvore_geradora_minima(grafo):
+    """
+    Calcula a árvore geradora mínima do grafo dos bairros (Kruskal, conferida
+    com Prim) e a desenha com o layout da árvore do percurso, destacando o
+    caminho de Nova Descoberta a Setúbal dentro da árvore.
+
+    Salva em out/arvore_geradora_minima.csv e out/arvore_geradora_minima.png
+    """
+    print("Árvore Geradora Mínima")
+    print("-" * 80)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    resultado = kruskal_mst(grafo)
+    prim = prim_mst(grafo, root="nova descoberta")
+    if abs(prim['total_weight'] - resultado['total_weight']) > 1e-9:
+        print("Atenção: Kruskal e Prim com pesos totais diferentes.")
+
+    try:
+        pd.DataFrame(resultado['edges'], columns=["bairro_origem", "bairro_destino", "peso"]).to_csv(
+            FILE_OUT_MST, index=False)
+    except Exception as e:
+        print(f"Erro ao salvar '{FILE_OUT_MST}': {e}")
+        return resultado
+
+    exportar_arvore_geradora_minima(
+        grafo,
+        resultado['edges'],
+        raiz="nova descoberta",
+        destino="setubal",
+        out_png=os.path.join(OUTPUT_DIR, "arvore_geradora_minima.png")
+    )
+
+    print(f"  ✓ Arestas: {len(resultado['edges'])} de {grafo.get_numero_de_arestas()}")
+    print(f"  ✓ Peso total: {resultado['total_weight']:.2f} (árvores: {resultado['num_trees']})")
+    print("  ✓ out/arvore_geradora_minima.csv")
+    print("  ✓ out/arvore_geradora_minima.png\n")
+
+    return resultado
+
+# --- pontes e articulações: ligações e bairros cuja remoção divide a cidade ---
+
+def analisar_pontes_e_articulacoes(grafo):
+    """
+    Encontra as arestas críticas (pontes) e os bairros críticos (pontos de
+    articulação) do grafo, além das componentes biconexas.
+
+    Salva em out/arestas_criticas.csv, out/bairros_criticos.csv e
+    out/componentes_biconexas.json
+    """
+    from .graphs.algorithms import bridges_and_articulation_points
+
+    print("Pontes e Articulações")
+    print("-" * 80)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    resultado = bridges_and_articulation_points(grafo)
+    componentes = resultado['biconnected_components']
+
+    arestas = []
+    for origem, destino in resultado['bridges']:
+        peso = next(p for v, p in grafo.get_vizinhos(origem) if v == destino)
+        arestas.append({"bairro_origem": origem, "bairro_destino": destino, "peso": peso})
+
+    # remover um ponto de articulação separa a sua componente em um pedaço por bloco que o contém
+    bairros = []
+    for bairro in resultado['articulation_points']:
+        num_blocos = sum(1 for c in componentes if bairro in c)
+        bairros.append({"bairro": bairro, "componentes_apos_remocao": num_blocos})
+
+    try:
+        pd.DataFrame(arestas, columns=["bairro_origem", "bairro_destino", "peso"]).to_csv(
+            FILE_OUT_ARESTAS_CRITICAS, index=False)
+        pd.DataFrame(bairros, columns=["bairro", "componentes_apos_remocao"]).to_csv(
+            FILE_OUT_BAIRROS_CRITICOS, index=False)
+        with open(FILE_OUT_BICONEXAS, 'w', encoding='utf-8') as f:
+            json.dump([{"id": i, "tamanho": len(c), "bairros": c} for i, c in enumerate(componentes)],
+                      f, ensure_ascii=False, indent=4)
+    except Exception as e:
+        print(f"Erro ao salvar pontes e articulações: {e}")
+        return resultado
+
+    print(f"  ✓ Arestas críticas: {len(arestas)}")
+    for a in arestas:
+        print(f"    - {a['bairro_origem'].title()} — {a['bairro_destino'].title()}")
+    print(f"  ✓ Bairros críticos: {', '.join(b['bairro'].title() for b in bairros) or 'nenhum'}")
+    print(f"  ✓ Componentes biconexas: {len(componentes)}")
+    print("  ✓ out/arestas_criticas.csv")
+    print("  ✓ out/bairros_criticos.csv")
+    print("  ✓ out/componentes_biconexas.json\n")
+
+    return resultado
+
 def exploracoes_visuais(df_graus, grafo):
 
     print("Ponto 8: Explorações e Visualizações Analíticas")
@@ -579,7 +715,7 @@ def executar_bfs_parte2(num_sources=3):
     - Run BFS from at least 3 different sources
     - Report order (number of nodes visited) and layers/levels
     """
-    from .graphs.algorithms import bfs
+    from .graphs.algorithms import bfs_layers
 
     print("\n--- Executando BFS (Parte 2) ---")
 
@@ -608,15 +744,13 @@ def executar_bfs_parte2(num_sources=3):
 
         try:
             t0 = time.perf_counter()
-            result = bfs(grafo, source)
+            niveis_count = {}
+            for level, layer in enumerate(bfs_layers(grafo, source)):
+                niveis_count[level] = len(layer)
             elapsed = time.perf_counter() - t0
 
-            num_visitados = len(result['visited'])
-            num_niveis = max(result['levels'].values()) if result['levels'] else 0
-
-            niveis_count = {}
-            for node, level in result['levels'].items():
-                niveis_count[level] = niveis_count.get(level, 0) + 1
+            num_visitados = sum(niveis_count.values())
+            num_niveis = len(niveis_count) - 1
 
             print(f"  Nós visitados: {num_visitados}")
             print(f"  Níveis/camadas: {num_niveis + 1}")
@@ -693,15 +827,12 @@ def executar_dfs_parte2(num_sources=3):
 
         try:
             t0 = time.perf_counter()
-            result = dfs(grafo, source)
+            result = dfs(grafo, source, edge_mode='counts')
             elapsed = time.perf_counter() - t0
 
-            num_visitados = len(result['visited'])
+            num_visitados = result['num_visited']
             has_cycle = result['has_cycle']
-
-            edge_types_count = {}
-            for edge, edge_type in result['edge_classification'].items():
-                edge_types_count[edge_type] = edge_types_count.get(edge_type, 0) + 1
+            edge_types_count = result['edge_counts']
 
             print(f"  Nós visitados: {num_visitados}")
             print(f"  Ciclo detectado: {has_cycle}")
@@ -742,6 +873,415 @@ def executar_dfs_parte2(num_sources=3):
     return resultados
 
 
+def executar_scc_parte2():
+    """
+    Strongly connected components of the Part 2 directed graph.
+
+    Reports how many groups of mutually reachable airports exist, the
+    largest ones and the size of the condensation DAG.
+    """
+    from .graphs.algorithms import strongly_connected_components
+
+    print("\n--- Executando SCC (Parte 2) ---")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    t0 = time.perf_counter()
+    result = strongly_connected_components(grafo)
+    elapsed = time.perf_counter() - t0
+
+    componentes = result['components']
+    ordem = sorted(range(len(componentes)), key=lambda c: len(componentes[c]), reverse=True)
+    condensacao = result['condensation']
+
+    resultado = {
+        "algoritmo": "SCC (Tarjan)",
+        "num_componentes": result['num_components'],
+        "tamanho_maior_componente": len(componentes[ordem[0]]) if ordem else 0,
+        "componentes_unitarios": sum(1 for c in componentes if len(c) == 1),
+        "maiores_componentes": [
+            {"id": c, "tamanho": len(componentes[c]), "nos": sorted(map(str, componentes[c]))}
+            for c in ordem[:5]
+        ],
+        "condensacao_nos": condensacao.get_numero_de_nos(),
+        "condensacao_arestas": condensacao.get_numero_de_arestas(),
+        "tempo_segundos": elapsed
+    }
+
+    print(f"  Componentes fortemente conexas: {resultado['num_componentes']}")
+    print(f"  Maior componente: {resultado['tamanho_maior_componente']} nós")
+    print(f"  Condensação (DAG): {resultado['condensacao_nos']} nós, {resultado['condensacao_arestas']} arestas")
+    print(f"  Tempo: {elapsed:.6f}s")
+
+    try:
+        output_file = os.path.join(OUTPUT_DIR, 'parte2_scc.json')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=4)
+        print(f"\nResultados SCC salvos em '{output_file}'")
+    except Exception as e:
+        print(f"Erro ao salvar resultados SCC: {e}")
+
+    return resultado
+
+
+def executar_kcore_parte2():
+    """
+    k-core decomposition of the Part 2 airports.
+
+    Saves in/out degree and core number of every airport to
+    out/parte2_graus.csv and reports the innermost core (the dense
+    backbone of the network) and how many airports have each core number.
+    """
+    print("\n--- Executando k-core (Parte 2) ---")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    t0 = time.perf_counter()
+    core = core_number(grafo)
+    elapsed = time.perf_counter() - t0
+
+    grau_entrada = {no: 0 for no in grafo.get_todos_os_nos()}
+    for no in grafo.get_todos_os_nos():
+        for vizinho, _ in grafo.get_vizinhos(no):
+            grau_entrada[vizinho] += 1
+
+    df_graus = pd.DataFrame({
+        'no': list(core),
+        'grau_saida': [len(grafo.get_vizinhos(no)) for no in core],
+        'grau_entrada': [grau_entrada[no] for no in core],
+        'core': list(core.values())
+    }).sort_values(['core', 'grau_saida'], ascending=False, kind='stable')
+
+    core_max = max(core.values(), default=0)
+    nucleo = k_core(grafo, core_max, core=core)
+    distribuicao = df_graus['core'].value_counts().sort_index()
+
+    resultado = {
+        "algoritmo": "k-core (Batagelj-Zaversnik)",
+        "core_max": core_max,
+        "nucleo_nos": nucleo.get_numero_de_nos(),
+        "nucleo_arestas": nucleo.get_numero_de_arestas(),
+        "nucleo": sorted(map(str, nucleo.get_todos_os_nos())),
+        "distribuicao": {str(k): int(v) for k, v in distribuicao.items()},
+        "tempo_segundos": elapsed
+    }
+
+    print(f"  Core máximo: {core_max} ({resultado['nucleo_nos']} aeroportos, "
+          f"{resultado['nucleo_arestas']} rotas entre eles)")
+    print(f"  Tempo: {elapsed:.6f}s")
+
+    try:
+        df_graus.to_csv(FILE_OUT_PARTE2_GRAUS, index=False)
+        print(f"\nGraus e cores salvos em '{FILE_OUT_PARTE2_GRAUS}'")
+    except Exception as e:
+        print(f"Erro ao salvar '{FILE_OUT_PARTE2_GRAUS}': {e}")
+
+    return resultado
+
+
+def executar_ego_redes_parte2(raios=(1, 2), raio_peso=None):
+    """
+    Ego networks of the Part 2 airports.
+
+    For each hop radius in `raios` (and, if given, for the weighted
+    distance `raio_peso`), counts the airports reachable within that
+    radius and the routes between them, splitting the airports across all
+    CPU cores. Saves one row per airport to out/parte2_ego.csv.
+    """
+    print("\n--- Executando Ego-Redes (Parte 2) ---")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    execucoes = [(str(raio), raio, False) for raio in raios]
+    if raio_peso is not None:
+        execucoes.append(("peso", raio_peso, True))
+
+    df_ego = pd.DataFrame({'no': grafo.get_todos_os_nos()})
+    resumo = {}
+    for sufixo, raio, ponderado in execucoes:
+        t0 = time.perf_counter()
+        r = ego_networks(grafo, raio, weighted=ponderado, workers=os.cpu_count() or 1)
+        elapsed = time.perf_counter() - t0
+
+        df_ego[f'ordem_ego_{sufixo}'] = r['ego_order']
+        df_ego[f'tamanho_ego_{sufixo}'] = r['ego_size']
+        df_ego[f'densidade_ego_{sufixo}'] = r['ego_density']
+
+        resumo[sufixo] = {
+            "raio": raio,
+            "ponderado": ponderado,
+            "ordem_media": float(r['ego_order'].mean()) if len(r['nodes']) else 0.0,
+            "ordem_max": int(r['ego_order'].max()) if len(r['nodes']) else 0,
+            "densidade_media": float(r['ego_density'].mean()) if len(r['nodes']) else 0.0,
+            "tempo_segundos": elapsed
+        }
+        print(f"  Raio {raio}{' (peso)' if ponderado else ' (saltos)'}: ordem média "
+              f"{resumo[sufixo]['ordem_media']:.1f}, densidade média {resumo[sufixo]['densidade_media']:.4f} "
+              f"({elapsed:.4f}s)")
+
+    try:
+        df_ego.to_csv(FILE_OUT_PARTE2_EGO, index=False)
+        print(f"\nEgo-redes salvas em '{FILE_OUT_PARTE2_EGO}'")
+    except Exception as e:
+        print(f"Erro ao salvar '{FILE_OUT_PARTE2_EGO}': {e}")
+
+    return resumo
+
+
+def executar_diametro_parte2():
+    """
+    Diameter, radius and eccentricities of the Part 2 airports, inside the
+    largest strongly connected component (the diameter is infinite on the
+    whole directed graph).
+
+    The diameter comes from iFUB and all eccentricities from the
+    bounding-eccentricities algorithm, in number of flights and weighted;
+    the number of searches each one needed is reported next to the n
+    searches of the naive method.
+    """
+    print("\n--- Executando Diâmetro e Excentricidades (Parte 2) ---")
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    resultado = {"componente": "maior componente fortemente conexa"}
+    for chave, ponderado in [("voos", False), ("ponderado", True)]:
+        t0 = time.perf_counter()
+        diam = diameter(grafo, weighted=ponderado)
+        t_diam = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ecc = eccentricities(grafo, weighted=ponderado)
+        t_ecc = time.perf_counter() - t0
+
+        resultado["tamanho_componente"] = diam['component_size']
+        resultado[chave] = {
+            "diametro": diam['diameter'],
+            "par_diametral": [str(no) for no in diam['endpoints']],
+            "buscas_ifub": diam['num_searches'],
+            "tempo_diametro_segundos": t_diam,
+            "raio": ecc['radius'],
+            "centro": sorted(map(str, ecc['center'])),
+            "periferia": sorted(map(str, ecc['periphery'])),
+            "buscas_excentricidades": ecc['num_searches'],
+            "tempo_excentricidades_segundos": t_ecc
+        }
+
+        print(f"  {chave.capitalize()}: diâmetro {diam['diameter']} ({diam['num_searches']} buscas, {t_diam:.4f}s), "
+              f"raio {ecc['radius']} ({ecc['num_searches']} buscas, {t_ecc:.4f}s)")
+    print(f"  Componente: {resultado['tamanho_componente']} de {grafo.get_numero_de_nos()} aeroportos")
+
+    return resultado
+
+
+def executar_mst_parte2():
+    """
+    Minimum spanning forest of the Part 2 airports, with the routes taken
+    as undirected (the cheaper direction of each pair).
+
+    Kruskal and Prim are both timed and must agree on the total weight;
+    the forest edges are saved to out/parte2_mst.csv.
+    """
+    print("\n--- Executando Árvore Geradora Mínima (Parte 2) ---")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    grafo.para_csr().transposta()  # CSR e transposta ficam em cache; não entram na medição
+
+    t0 = time.perf_counter()
+    kruskal = kruskal_mst(grafo)
+    t_kruskal = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    prim = prim_mst(grafo)
+    t_prim = time.perf_counter() - t0
+
+    resultado = {
+        "algoritmo": "Kruskal / Prim (rotas como arestas não-dirigidas)",
+        "peso_total": kruskal['total_weight'],
+        "num_arestas": len(kruskal['edges']),
+        "num_arvores": kruskal['num_trees'],
+        "pesos_iguais": abs(kruskal['total_weight'] - prim['total_weight']) <= 1e-9 * max(1.0, abs(kruskal['total_weight'])),
+        "tempo_kruskal_segundos": t_kruskal,
+        "tempo_prim_segundos": t_prim
+    }
+
+    print(f"  Peso total: {resultado['peso_total']:.2f} ({resultado['num_arestas']} rotas, "
+          f"{resultado['num_arvores']} árvores)")
+    print(f"  Kruskal: {t_kruskal:.6f}s | Prim: {t_prim:.6f}s | pesos iguais: {resultado['pesos_iguais']}")
+
+    try:
+        pd.DataFrame([(str(u), str(v), w) for u, v, w in kruskal['edges']],
+                     columns=['origem', 'destino', 'peso']).to_csv(FILE_OUT_PARTE2_MST, index=False)
+        print(f"\nÁrvore geradora mínima salva em '{FILE_OUT_PARTE2_MST}'")
+    except Exception as e:
+        print(f"Erro ao salvar '{FILE_OUT_PARTE2_MST}': {e}")
+
+    return resultado
+
+
+def executar_centralidades_parte2(num_pivos=256, top=20, origens=None):
+    """
+    Centralities of the Part 2 airports.
+
+    Betweenness is estimated from `num_pivos` random sources (Brandes,
+    weighted), split across all CPU cores, with the standard error of
+    each estimate. Closeness and harmonic centrality in number of flights
+    are computed for every airport (bit-parallel BFS batches) and saved
+    to out/parte2_closeness.csv; the `top` airports by weighted closeness
+    come from top_k_closeness, without a Dijkstra from every airport.
+    PageRank (by routes) ranks every airport, and PageRank personalized to
+    each of `origens` (default: the origins of pares_parte2.csv, or the
+    top PageRank airport) comes from a local push around that origin.
+    """
+    print("\n--- Executando Centralidades (Parte 2) ---")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    grafo, df_rotas = construir_grafo_parte2()
+    if grafo is None:
+        print("Não foi possível construir o grafo da Parte 2.")
+        return None
+
+    num_nos = grafo.get_numero_de_nos()
+    num_pivos = min(num_pivos, num_nos)
+    top = min(top, num_nos)
+
+    t0 = time.perf_counter()
+    bet = betweenness_centrality(grafo, weighted=True, k=num_pivos, seed=0,
+                                 workers=os.cpu_count() or 1)
+    elapsed = time.perf_counter() - t0
+
+    ranking = sorted(bet['nodes'].items(), key=lambda item: item[1], reverse=True)[:top]
+    erros = bet['std_error'] or {}
+
+    t0 = time.perf_counter()
+    closeness = closeness_centrality(grafo)
+    harmonica = harmonic_centrality(grafo)
+    elapsed_closeness = time.perf_counter() - t0
+
+    df_closeness = pd.DataFrame({
+        'no': list(closeness),
+        'closeness': list(closeness.values()),
+        'harmonica': [harmonica[no] for no in closeness]
+    }).sort_values('closeness', ascending=False, kind='stable')
+
+    t0 = time.perf_counter()
+    topo = top_k_closeness(grafo, top, weighted=True, seed=0)
+    elapsed_topo = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    pr = pagerank(grafo)
+    elapsed_pr = time.perf_counter() - t0
+    ranking_pr = sorted(pr['scores'].items(), key=lambda item: item[1], reverse=True)[:top]
+
+    if origens is None:
+        origens = list(dict.fromkeys(origem for origem, _ in carregar_pares_parte2()))
+        if not origens and ranking_pr:
+            origens = [ranking_pr[0][0]]
+    personalizados = []
+    for origem in origens:
+        if origem not in grafo:
+            print(f"  ! Origem {origem} não está no grafo, pulando PageRank personalizado.")
+            continue
+        ppr = personalized_pagerank(grafo, origem)
+        ranking_ppr = sorted(ppr['scores'].items(), key=lambda item: item[1], reverse=True)[:top]
+        personalizados.append({
+            "origem": origem,
+            "nos_tocados": len(ppr['scores']),
+            "residuo": ppr['residual'],
+            "top": [{"no": no, "pagerank": valor} for no, valor in ranking_ppr]
+        })
+
+    resultados = {
+        "betweenness": {
+            "num_pivos": bet['num_sources'],
+            "tempo_segundos": elapsed,
+            "top": [
+                {"no": no, "betweenness": valor, "erro_padrao": erros.get(no, 0.0)}
+                for no, valor in ranking
+            ]
+        },
+        "closeness_voos": {
+            "tempo_segundos": elapsed_closeness,
+            "top": df_closeness.head(top).to_dict(orient='records')
+        },
+        "closeness_ponderada_top_k": {
+            "num_pivos": topo['num_pivots'],
+            "buscas_exatas": topo['num_exact'],
+            "tempo_segundos": elapsed_topo,
+            "top": [{"no": no, "closeness": valor} for no, valor in topo['top']]
+        },
+        "pagerank": {
+            "iteracoes": pr['iterations'],
+            "tempo_segundos": elapsed_pr,
+            "top": [
+                {"no": no, "pagerank": valor, "grau_saida": len(grafo.get_vizinhos(no))}
+                for no, valor in ranking_pr
+            ]
+        },
+        "pagerank_personalizado": personalizados
+    }
+
+    print(f"  Betweenness ({bet['num_sources']} pivôs, {elapsed:.4f}s):")
+    for item in resultados["betweenness"]["top"][:5]:
+        print(f"    {item['no']}: {item['betweenness']:.4f} ± {item['erro_padrao']:.4f}")
+
+    print(f"  Closeness em voos (todos os {num_nos} aeroportos, {elapsed_closeness:.4f}s):")
+    for item in resultados["closeness_voos"]["top"][:5]:
+        print(f"    {item['no']}: {item['closeness']:.4f} (harmônica {item['harmonica']:.2f})")
+
+    print(f"  Closeness ponderada, top {top} ({topo['num_pivots']} pivôs + "
+          f"{topo['num_exact']} buscas exatas, {elapsed_topo:.4f}s):")
+    for no, valor in topo['top'][:5]:
+        print(f"    {no}: {valor:.6f}")
+
+    print(f"  PageRank ({pr['iterations']} iterações, {elapsed_pr:.4f}s):")
+    for item in resultados["pagerank"]["top"][:5]:
+        print(f"    {item['no']}: {item['pagerank']:.5f} (grau de saída {item['grau_saida']})")
+    for item in personalizados:
+        print(f"  PageRank personalizado de {item['origem']} ({item['nos_tocados']} nós tocados): "
+              + ", ".join(str(p['no']) for p in item['top'][:5]))
+
+    try:
+        df_closeness.to_csv(FILE_OUT_PARTE2_CLOSENESS, index=False)
+        print(f"\nCloseness salva em '{FILE_OUT_PARTE2_CLOSENESS}'")
+    except Exception as e:
+        print(f"Erro ao salvar closeness: {e}")
+
+    try:
+        output_file = os.path.join(OUTPUT_DIR, 'parte2_centralidades.json')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=4)
+        print(f"\nCentralidades salvas em '{output_file}'")
+    except Exception as e:
+        print(f"Erro ao salvar centralidades: {e}")
+
+    return resultados
+
+
 def executar_bellman_ford_parte2(pares=None):
     """
     Execute Bellman-Ford on Part 2 dataset.
@@ -931,6 +1471,12 @@ def executar_parte2_completa():
     print("Executando algoritmos...")
     resultados_bfs = executar_bfs_parte2()
     resultados_dfs = executar_dfs_parte2()
+    resultados_scc = executar_scc_parte2()
+    resultados_kcore = executar_kcore_parte2()
+    resultados_ego = executar_ego_redes_parte2()
+    resultados_diametro = executar_diametro_parte2()
+    resultados_mst = executar_mst_parte2()
+    resultados_centralidades = executar_centralidades_parte2()
     resultados_dijkstra = executar_dijkstra_parte2()
     resultados_bf = executar_bellman_ford_parte2()
 
@@ -947,6 +1493,12 @@ def executar_parte2_completa():
         # Add BFS, DFS, and Bellman-Ford results
         report['bfs'] = resultados_bfs if resultados_bfs else []
         report['dfs'] = resultados_dfs if resultados_dfs else []
+        report['scc'] = resultados_scc if resultados_scc else {}
+        report['kcore'] = resultados_kcore if resultados_kcore else {}
+        report['ego_redes'] = resultados_ego if resultados_ego else {}
+        report['diametro'] = resultados_diametro if resultados_diametro else {}
+        report['arvore_geradora_minima'] = resultados_mst if resultados_mst else {}
+        report['centralidades'] = resultados_centralidades if resultados_centralidades else {}
         report['bellman_ford'] = resultados_bf if resultados_bf else []
 
         # Salvar report atualizado
@@ -961,6 +1513,12 @@ def executar_parte2_completa():
         print("\n  ✓ Algoritmos executados")
     print("  ✓ out/parte2_bfs.json")
     print("  ✓ out/parte2_dfs.json")
+    print("  ✓ out/parte2_scc.json")
+    print("  ✓ out/parte2_centralidades.json")
+    print("  ✓ out/parte2_closeness.csv")
+    print("  ✓ out/parte2_graus.csv")
+    print("  ✓ out/parte2_ego.csv")
+    print("  ✓ out/parte2_mst.csv")
     print("  ✓ out/parte2_dijkstra.csv")
     print("  ✓ out/parte2_dijkstra.json")
     print("  ✓ out/parte2_bellman_ford.json")
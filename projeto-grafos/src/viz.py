@@ -88,6 +88,77 @@ def exportar_arvore_percurso_destacada(grafo, path, raiz="nova descoberta",
             level[v] = max_lvl
             parent[v] = None  # sem pai (componente separado)
 
+    _desenhar_arvore_em_niveis(nos, parent, level, path, out_png)
+    print(f"Árvore do percurso destacada salva em {out_png}")
+
+def exportar_arvore_geradora_minima(grafo, arestas, raiz=None, destino=None,
+                                    out_png="out/arvore_geradora_minima.png"):
+    """
+    Desenha a árvore (ou floresta) geradora mínima dada por `arestas`
+    ((u, v, peso), como em kruskal_mst / prim_mst) com o mesmo layout de
+    exportar_arvore_percurso_destacada: cada árvore cresce a partir da sua
+    raiz, um nível por coluna, e as árvores seguintes começam depois da
+    última coluna. Se `destino` for dado, destaca o caminho de `raiz` até
+    ele dentro da árvore.
+    """
+    os.makedirs(os.path.dirname(out_png) or ".", exist_ok=True)
+
+    nos = grafo.get_todos_os_nos()
+    if not nos:
+        print("Grafo vazio.")
+        return
+
+    vizinhos = defaultdict(list)
+    for u, v, _peso in arestas:
+        vizinhos[u].append(v)
+        vizinhos[v].append(u)
+
+    raizes = list(nos)
+    if raiz is not None:
+        raiz = str(raiz).strip().lower()
+        if raiz in nos:
+            raizes.insert(0, raiz)
+        else:
+            print(f"Atenção: raiz '{raiz}' não encontrada. Usando primeiro nó do grafo.")
+
+    level, parent = {}, {}
+    inicio = 0
+    for r in raizes:
+        if r in level:
+            continue
+        level[r] = inicio
+        parent[r] = None
+        q = deque([r])
+        while q:
+            u = q.popleft()
+            for v in vizinhos[u]:
+                if v not in level:
+                    level[v] = level[u] + 1
+                    parent[v] = u
+                    q.append(v)
+        inicio = max(level.values()) + 1  # próxima árvore da floresta
+
+    path = []
+    if destino is not None:
+        destino = str(destino).strip().lower()
+        if destino in level:
+            v = destino
+            while v is not None:
+                path.append(v)
+                v = parent[v]
+            path.reverse()
+        if not path or path[0] != raizes[0]:
+            path = []  # destino fora da árvore da raiz
+
+    _desenhar_arvore_em_niveis(nos, parent, level, path, out_png)
+    print(f"Árvore geradora mínima salva em {out_png}")
+
+def _desenhar_arvore_em_niveis(nos, parent, level, path, out_png):
+    """
+    Desenha uma árvore (ou floresta) com um nível por coluna: `parent` dá o
+    pai de cada nó (None nas raízes) e `level` a coluna. Se `path` tiver
+    dois ou mais nós, o caminho é destacado (início em azul, fim em vermelho).
+    """
     niveis = defaultdict(list)
     for v in nos:
         niveis[level[v]].append(v)
@@ -144,7 +215,6 @@ def exportar_arvore_percurso_destacada(grafo, path, raiz="nova descoberta",
     plt.tight_layout()
     plt.savefig(out_png, dpi=240, bbox_inches="tight")
     plt.close()
-    print(f"Árvore do percurso destacada salva em {out_png}")
 
 def mapa_cores_por_grau(df_graus, out_png="out/mapa_cores_grau.png"):
 
@@ -12,7 +12,8 @@ os.chdir(project_root)
 sys.path.insert(0, project_root)
 
 from src.graphs.graph import Grafo
-from src.graphs.algorithms import bellman_ford, bellman_ford_path, bellman_ford_path_length
+from src.graphs.algorithms import bellman_ford, bellman_ford_path, bellman_ford_path_length, bellman_ford_spfa, bellman_ford_numpy
+from src.graphs.algorithms import bellman_ford_hop_limited
 from src.graphs.io import carregar_dados_principais, carregar_dataset_parte2
 
 
@@ -302,6 +303,161 @@ def test_bellman_ford_vs_dijkstra_positive_weights():
     print("PASSOU test_bellman_ford_vs_dijkstra_positive_weights")
 
 
+def test_bellman_ford_spfa_matches_bellman_ford_recife():
+    """Testa que o SPFA encontra as mesmas distâncias do Bellman-Ford clássico."""
+    print("\n--- Teste: SPFA vs Bellman-Ford no Grafo de Recife ---")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    for source in ['boa viagem', 'nova descoberta', 'recife']:
+        esperado = bellman_ford(G, source)
+        result = bellman_ford_spfa(G, source)
+
+        assert result['has_negative_cycle'] == False, "Grafo de Recife tem apenas pesos positivos"
+        assert result['distances'] == esperado['distances'], \
+            f"SPFA deve concordar com Bellman-Ford a partir de {source}"
+
+        # A árvore de predecessores deve ser consistente com as distâncias
+        for node, pred in result['predecessors'].items():
+            if pred is None:
+                continue
+            pesos = [w for v, w in G.get_vizinhos(pred) if v == node]
+            assert result['distances'][pred] + min(pesos) == result['distances'][node], \
+                f"Predecessor de {node} inconsistente"
+
+    print("  -> SPFA e Bellman-Ford concordam em 3 origens")
+    print("PASSOU test_bellman_ford_spfa_matches_bellman_ford_recife")
+
+
+def test_bellman_ford_spfa_negative_weights_and_cycle():
+    """Testa o SPFA com pesos negativos, com e sem ciclo negativo."""
+    print("\n--- Teste: SPFA com Pesos Negativos ---")
+
+    G = Grafo(dirigido=True)
+    G.add_edge('A', 'B', 10.0)
+    G.add_edge('A', 'C', 5.0)
+    G.add_edge('B', 'D', -8.0)
+    G.add_edge('C', 'D', -3.0)
+    G.add_edge('D', 'E', 2.0)
+
+    result = bellman_ford_spfa(G, 'A')
+    assert result['has_negative_cycle'] == False, "Não há ciclo negativo"
+    assert result['distances']['E'] == 4.0, "A -> B -> D -> E custa 4"
+    assert result['negative_cycle'] == [], "Sem ciclo, lista deve ser vazia"
+
+    G_ciclo = Grafo(dirigido=True)
+    G_ciclo.add_edge('S', 'X', 1.0)
+    G_ciclo.add_edge('X', 'Y', 1.0)
+    G_ciclo.add_edge('Y', 'Z', 1.0)
+    G_ciclo.add_edge('Z', 'X', -5.0)
+    G_ciclo.add_edge('Z', 'W', 1.0)
+
+    result = bellman_ford_spfa(G_ciclo, 'S')
+    assert result['has_negative_cycle'] == True, "Deve detectar ciclo negativo"
+    assert sorted(result['negative_cycle']) == ['X', 'Y', 'Z'], \
+        f"Ciclo deve ser X, Y, Z e não {result['negative_cycle']}"
+
+    # O ciclo retornado segue os predecessores
+    ciclo = result['negative_cycle']
+    for i, node in enumerate(ciclo):
+        assert result['predecessors'][node] == ciclo[(i + 1) % len(ciclo)], \
+            "Ciclo deve seguir a ordem dos predecessores"
+
+    print(f"  -> Ciclo negativo detectado: {result['negative_cycle']}")
+    print("PASSOU test_bellman_ford_spfa_negative_weights_and_cycle")
+
+
+def test_bellman_ford_numpy_kernel():
+    """Testa o kernel vetorizado contra o Bellman-Ford clássico."""
+    print("\n--- Teste: Bellman-Ford Vetorizado (NumPy) ---")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'boa viagem'
+    esperado = bellman_ford(G, source)
+    result = bellman_ford_numpy(G, source)
+
+    assert result['has_negative_cycle'] == False, "Grafo de Recife tem apenas pesos positivos"
+    assert result['distances'] == esperado['distances'], "Kernel NumPy deve concordar com Bellman-Ford"
+    assert result['predecessors'][source] is None, f"{source} não deve ter predecessor"
+
+    G_neg = Grafo(dirigido=True)
+    G_neg.add_edge('A', 'B', 10.0)
+    G_neg.add_edge('A', 'C', 5.0)
+    G_neg.add_edge('B', 'D', -8.0)
+    G_neg.add_edge('C', 'D', -3.0)
+    G_neg.add_edge('D', 'E', 2.0)
+    G_neg.add_node('F')
+
+    result = bellman_ford_numpy(G_neg, 'A')
+    assert result['distances']['E'] == 4.0, "A -> B -> D -> E custa 4"
+    assert result['distances']['F'] == float('inf'), "F é inalcançável"
+    assert result['predecessors']['D'] in ('B', 'C'), "B e C alcançam D com custo 2"
+
+    G_ciclo = Grafo(dirigido=True)
+    G_ciclo.add_edge('X', 'Y', 1.0)
+    G_ciclo.add_edge('Y', 'Z', 1.0)
+    G_ciclo.add_edge('Z', 'X', -5.0)
+
+    result = bellman_ford_numpy(G_ciclo, 'X')
+    assert result['has_negative_cycle'] == True, "Deve detectar ciclo negativo"
+    assert sorted(result['negative_cycle']) == ['X', 'Y', 'Z'], "Ciclo deve ser X, Y, Z"
+
+    print(f"  -> Distâncias de '{source}' idênticas às do Bellman-Ford clássico")
+    print(f"  -> Ciclo negativo detectado: {result['negative_cycle']}")
+    print("PASSOU test_bellman_ford_numpy_kernel")
+
+
+def test_bellman_ford_hop_limited_stops():
+    """Testa a rota mais barata com no máximo k escalas."""
+    print("\n--- Teste: Rota Mais Barata com Limite de Escalas ---")
+
+    G = Grafo(dirigido=True)
+    G.add_edge('REC', 'LIS', 900.0)   # voo direto caro
+    G.add_edge('REC', 'FOR', 200.0)
+    G.add_edge('FOR', 'LIS', 500.0)   # 1 escala
+    G.add_edge('FOR', 'NAT', 50.0)
+    G.add_edge('NAT', 'SAL', 50.0)
+    G.add_edge('SAL', 'LIS', 100.0)   # 3 escalas, a mais barata
+    G.add_node('MAD')
+
+    opcoes = bellman_ford_hop_limited(G, 'REC', 'LIS', 3)
+
+    assert opcoes[0] == {'cost': 900.0, 'path': ['REC', 'LIS']}, "Voo direto"
+    assert opcoes[1] == {'cost': 700.0, 'path': ['REC', 'FOR', 'LIS']}, "Uma escala"
+    assert opcoes[2] == opcoes[1], "Com 2 escalas ainda não há opção melhor"
+    assert opcoes[3] == {'cost': 400.0, 'path': ['REC', 'FOR', 'NAT', 'SAL', 'LIS']}, "Três escalas"
+
+    sem_rota = bellman_ford_hop_limited(G, 'REC', 'MAD', 2)
+    assert all(opcao is None for opcao in sem_rota.values()), "MAD é inalcançável"
+
+    for paradas, opcao in opcoes.items():
+        print(f"  -> {paradas} escala(s): custo={opcao['cost']}, caminho={' -> '.join(opcao['path'])}")
+    print("PASSOU test_bellman_ford_hop_limited_stops")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("Executando Testes do Bellman-Ford")
@@ -317,6 +473,10 @@ if __name__ == "__main__":
     test_bellman_ford_same_source_target()
     test_bellman_ford_source_not_in_graph()
     test_bellman_ford_vs_dijkstra_positive_weights()
+    test_bellman_ford_spfa_matches_bellman_ford_recife()
+    test_bellman_ford_spfa_negative_weights_and_cycle()
+    test_bellman_ford_numpy_kernel()
+    test_bellman_ford_hop_limited_stops()
 
     print("\n" + "="*60)
     print("Todos os Testes do Bellman-Ford Passaram!")
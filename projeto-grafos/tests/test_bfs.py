@@ -12,7 +12,8 @@ os.chdir(project_root)
 sys.path.insert(0, project_root)
 
 from src.graphs.graph import Grafo
-from src.graphs.algorithms import bfs, bfs_path
+from src.graphs.algorithms import (bfs, bfs_path, bfs_layers, bfs_direction_optimizing,
+                                   multi_source_bfs, bidirectional_bfs_path)
 from src.graphs.io import carregar_dados_principais, carregar_dataset_parte2
 
 
@@ -166,6 +167,195 @@ def test_bfs_source_not_in_graph():
     print("PASSOU test_bfs_source_not_in_graph")
 
 
+def test_bfs_direction_optimizing():
+    print("\nBFS direction-optimizing: mesmos níveis do BFS")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    G_dir = Grafo(dirigido=True)
+    for i in range(30):
+        G_dir.add_edge(i, (i * 7 + 3) % 30, 1)
+        G_dir.add_edge(i, (i * 11 + 5) % 30, 1)
+
+    casos = [(G, 'boa viagem'), (G, 'recife'), (G_dir, 0), (G_dir, 17)]
+    for grafo, source in casos:
+        esperado = bfs(grafo, source)
+        # alpha alto força o passo bottom-up logo no primeiro nível
+        for alpha in (14, 1e9):
+            result = bfs_direction_optimizing(grafo, source, alpha=alpha)
+
+            assert result['levels'] == esperado['levels'], f"Níveis devem ser iguais aos do BFS a partir de {source}"
+            assert result['visited'] == esperado['visited'], "Mesmo conjunto de visitados"
+            assert result['parent'][source] is None, "Origem não deve ter pai"
+
+            for node, pai in result['parent'].items():
+                if pai is None:
+                    continue
+                vizinhos = [v for v, _ in grafo.get_vizinhos(pai)]
+                assert node in vizinhos, f"{pai} -> {node} deve ser uma aresta"
+                assert result['levels'][pai] == result['levels'][node] - 1, "Pai deve estar no nível anterior"
+
+    result = bfs_direction_optimizing(G, 'boa viagem', alpha=1e9)
+    assert 'bottom_up' in result['directions'], "alpha alto deve usar o passo bottom-up"
+
+    print(f"  -> Direções por nível: {result['directions']}")
+    print("PASSOU test_bfs_direction_optimizing")
+
+
+def test_multi_source_bfs_all_pairs():
+    print("\nBFS bit-paralelo de todas as origens")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    # words=1 força mais de uma passada de 64 origens
+    result = multi_source_bfs(G, words=1)
+    nos = result['nodes']
+
+    assert result['hops'].shape == (len(nos), len(nos)), "Matriz deve ser n x n"
+    assert (result['hops'] == result['hops'].T).all(), "Grafo não-dirigido: matriz simétrica"
+
+    for i, source in enumerate(result['sources']):
+        levels = bfs(G, source)['levels']
+        assert result['hops'][i].tolist() == [levels.get(no, -1) for no in nos], \
+            f"Saltos devem bater com o BFS a partir de {source}"
+        assert sum(result['level_counts'][source]) == len(levels), "Histograma deve somar os alcançados"
+        assert result['eccentricity'][source] == max(levels.values()), "Excentricidade = maior nível"
+
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'C', 1)
+    G_dir.add_edge('D', 'A', 1)
+    result = multi_source_bfs(G_dir, ['A', 'D'])
+    hops = dict(zip(result['nodes'], result['hops'][0].tolist()))
+    assert hops == {'A': 0, 'B': 1, 'C': 2, 'D': -1}, "Arestas dirigidas devem ser respeitadas"
+    assert result['level_counts']['D'] == [1, 1, 1, 1], "D alcança um nó por nível"
+
+    print(f"  -> Excentricidade máxima em Recife: {max(multi_source_bfs(G)['eccentricity'].values())}")
+    print("PASSOU test_multi_source_bfs_all_pairs")
+
+
+def test_bfs_layers_generator():
+    print("\nBFS por camadas (gerador)")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'boa viagem'
+    esperado = bfs(G, source)
+
+    camadas = list(bfs_layers(G, source))
+    assert camadas[0] == [source], "Primeira camada deve ser só a origem"
+    assert [no for camada in camadas for no in camada] == esperado['order'], "Mesma ordem do BFS"
+    for nivel, camada in enumerate(camadas):
+        for no in camada:
+            assert esperado['levels'][no] == nivel, f"{no} deve estar no nível {esperado['levels'][no]}"
+
+    for camada in bfs_layers(G, source, with_parent=True):
+        for no, pai in camada:
+            assert esperado['parent'][no] == pai, f"Pai de {no} deve ser o mesmo do BFS"
+
+    # Parar cedo: só as duas primeiras camadas são calculadas
+    gerador = bfs_layers(G, source)
+    primeiras = [next(gerador), next(gerador)]
+    assert primeiras == camadas[:2], "Primeiras camadas devem bater"
+
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'C', 1)
+    G_dir.add_edge('C', 'A', 1)
+    G_dir.add_edge('C', 'D', 1)
+    assert list(bfs_layers(G_dir, 'A')) == [['A'], ['B'], ['C'], ['D']], "Aresta C -> A não deve revisitar A"
+
+    try:
+        bfs_layers(G, 'bairro_inexistente_xyz')
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "not found in graph" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Tamanho das camadas: {[len(camada) for camada in camadas]}")
+    print("PASSOU test_bfs_layers_generator")
+
+
+def test_bidirectional_bfs_path():
+    print("\nBFS bidirecional: caminhos com o mesmo número de saltos")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    for origem in ['boa viagem', 'nova descoberta', 'recife']:
+        levels = bfs(G, origem)['levels']
+        for destino in G.get_todos_os_nos():
+            caminho = bfs_path(G, origem, destino)
+            caminho_bi = bidirectional_bfs_path(G, origem, destino)
+
+            assert len(caminho) - 1 == levels[destino], "bfs_path deve ter o número mínimo de saltos"
+            assert len(caminho_bi) == len(caminho), f"Mesmo número de saltos de {origem} a {destino}"
+            assert caminho_bi[0] == origem and caminho_bi[-1] == destino, "Extremos corretos"
+            for u, v in zip(caminho_bi, caminho_bi[1:]):
+                assert v in [vizinho for vizinho, _ in G.get_vizinhos(u)], f"{u} -> {v} deve ser uma aresta"
+
+    # Dirigido: a busca de trás usa as arestas invertidas
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'C', 1)
+    G_dir.add_edge('C', 'D', 1)
+    G_dir.add_edge('A', 'E', 1)
+    G_dir.add_edge('E', 'D', 1)
+    G_dir.add_node('F')
+
+    assert bidirectional_bfs_path(G_dir, 'A', 'D') == ['A', 'E', 'D'], "Caminho mais curto é A -> E -> D"
+    assert bidirectional_bfs_path(G_dir, 'D', 'A') is None, "Não há caminho contra as arestas"
+    assert bidirectional_bfs_path(G_dir, 'A', 'F') is None, "Nó isolado é inalcançável"
+    assert bidirectional_bfs_path(G_dir, 'C', 'C') == ['C'], "Origem igual ao destino"
+    assert bfs_path(G_dir, 'A', 'D') == ['A', 'E', 'D'], "bfs_path com parada antecipada"
+
+    print("  -> Caminhos bidirecionais válidos e mínimos")
+    print("PASSOU test_bidirectional_bfs_path")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("Executando Testes do BFS")
@@ -176,6 +366,10 @@ if __name__ == "__main__":
     test_bfs_levels_consistency()
     test_bfs_europe_air_routes()
     test_bfs_source_not_in_graph()
+    test_multi_source_bfs_all_pairs()
+    test_bfs_direction_optimizing()
+    test_bidirectional_bfs_path()
+    test_bfs_layers_generator()
 
     print("\n" + "="*60)
     print("Todos os Testes do BFS Passaram!")
@@ -0,0 +1,287 @@
+"""
+- Betweenness (Brandes): valores conhecidos, somas por distância, modo paralelo e amostrado
+- Closeness e harmônica: valores conhecidos, distâncias de chegada e top-k amostrado
+- PageRank: nós sem saída, pesos, partida a quente e push local personalizado
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.algorithms import (betweenness_centrality, multi_source_bfs, closeness_centrality,
+                                  harmonic_centrality, top_k_closeness, pagerank,
+                                  personalized_pagerank)
+from src.graphs.io import carregar_dados_principais
+
+
+def _grafo_recife():
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+    return G
+
+
+def test_betweenness_small_graphs():
+    print("\nBetweenness em grafos pequenos")
+
+    # Caminho A - B - C - D: B e C intermedeiam 2 pares cada
+    G = Grafo()
+    G.add_edge('A', 'B', 1)
+    G.add_edge('B', 'C', 1)
+    G.add_edge('C', 'D', 1)
+    result = betweenness_centrality(G, normalized=False)
+    assert result['nodes'] == {'A': 0.0, 'B': 2.0, 'C': 2.0, 'D': 0.0}, "Valores do caminho"
+    assert result['edges'][('B', 'C')] == 4.0, "B - C está nos caminhos de 4 pares"
+    assert result['edges'][('A', 'B')] == 3.0, "A - B está nos caminhos de 3 pares"
+
+    # Dois caminhos mínimos de A a D dividem o crédito; com pesos só um é mínimo
+    G = Grafo(dirigido=True)
+    G.add_edge('A', 'B', 1)
+    G.add_edge('A', 'C', 5)
+    G.add_edge('B', 'D', 1)
+    G.add_edge('C', 'D', 1)
+    sem_peso = betweenness_centrality(G, normalized=False)
+    com_peso = betweenness_centrality(G, weighted=True, normalized=False)
+    assert sem_peso['nodes']['B'] == 0.5 and sem_peso['nodes']['C'] == 0.5, "Crédito dividido"
+    assert com_peso['nodes']['B'] == 1.0 and com_peso['nodes']['C'] == 0.0, "Só A -> B -> D é mínimo"
+
+    G_neg = Grafo(dirigido=True)
+    G_neg.add_edge('A', 'B', -1)
+    try:
+        betweenness_centrality(G_neg, weighted=True)
+        assert False, "Deveria ter lançado exceção para peso negativo"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_betweenness_small_graphs")
+
+
+def test_betweenness_recife_exact_parallel_sampled():
+    print("\nBetweenness no Grafo de Recife: exato, paralelo e amostrado")
+
+    G = _grafo_recife()
+    n = G.get_numero_de_nos()
+
+    # Sem pesos e sem normalizar: soma dos nós = soma de (d - 1) e soma das arestas = soma de d,
+    # sobre os pares não ordenados alcançáveis
+    exato = betweenness_centrality(G, normalized=False)
+    hops = multi_source_bfs(G)['hops']
+    pares = hops[hops > 0]
+    assert abs(sum(exato['nodes'].values()) - (pares - 1).sum() / 2) < 1e-6, "Soma dos nós"
+    assert abs(sum(exato['edges'].values()) - pares.sum() / 2) < 1e-6, "Soma das arestas"
+    assert len(exato['edges']) == G.get_numero_de_arestas(), "Uma entrada por aresta"
+
+    ponderado = betweenness_centrality(G, weighted=True)
+    paralelo = betweenness_centrality(G, weighted=True, workers=2)
+    for no, valor in ponderado['nodes'].items():
+        assert abs(paralelo['nodes'][no] - valor) < 1e-12, f"Modo paralelo deve bater em {no}"
+    assert ponderado['std_error'] is None, "Exato não tem erro estimado"
+
+    todos = betweenness_centrality(G, weighted=True, k=n)
+    assert todos['nodes'] == ponderado['nodes'], "k = n é o cálculo exato"
+
+    amostra = betweenness_centrality(G, weighted=True, k=40, seed=1)
+    assert amostra['num_sources'] == 40, "40 pivôs"
+    assert all(erro >= 0 for erro in amostra['std_error'].values()), "Erros não-negativos"
+    topo_exato = max(ponderado['nodes'], key=ponderado['nodes'].get)
+    assert abs(amostra['nodes'][topo_exato] - ponderado['nodes'][topo_exato]) \
+        <= 4 * amostra['std_error'][topo_exato], "Estimativa dentro do erro estimado"
+
+    try:
+        betweenness_centrality(G, k=0)
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Maior betweenness: {topo_exato} ({ponderado['nodes'][topo_exato]:.4f})")
+    print("PASSOU test_betweenness_recife_exact_parallel_sampled")
+
+
+def test_closeness_harmonic_small_graphs():
+    print("\nCloseness e harmônica em grafos pequenos")
+
+    # Caminho A - B - C - D
+    G = Grafo()
+    G.add_edge('A', 'B', 1)
+    G.add_edge('B', 'C', 2)
+    G.add_edge('C', 'D', 1)
+    closeness = closeness_centrality(G)
+    harmonica = harmonic_centrality(G)
+    assert closeness['A'] == 3 / 6 and closeness['B'] == 3 / 4, "Closeness em saltos"
+    assert harmonica['A'] == 1 + 1 / 2 + 1 / 3, "Harmônica de A"
+    assert harmonica['B'] == 1 + 1 + 1 / 2, "Harmônica de B"
+    ponderada = closeness_centrality(G, weighted=True)
+    assert ponderada['A'] == 3 / (1 + 3 + 4), "Closeness com pesos"
+
+    # Dirigido: distâncias de chegada; D não alcança ninguém e só C chega nele
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'C', 1)
+    G_dir.add_node('D')
+    closeness = closeness_centrality(G_dir)
+    assert closeness['A'] == 0.0, "Ninguém chega em A"
+    assert closeness['C'] == 2 / 3 * 2 / 3, "A e B chegam em C (escala de Wasserman-Faust)"
+    assert closeness_centrality(G_dir, wf_improved=False)['C'] == 2 / 3, "Sem a escala"
+    assert harmonic_centrality(G_dir)['C'] == 1 + 1 / 2, "Harmônica de C"
+
+    # Lotes pequenos (64 origens por lote) dão o mesmo resultado
+    G = _grafo_recife()
+    assert closeness_centrality(G, words=1) == closeness_centrality(G), "words não muda o resultado"
+
+    G_neg = Grafo(dirigido=True)
+    G_neg.add_edge('A', 'B', -1)
+    try:
+        closeness_centrality(G_neg, weighted=True)
+        assert False, "Deveria ter lançado exceção para peso negativo"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_closeness_harmonic_small_graphs")
+
+
+def test_top_k_closeness_recife():
+    print("\nTop-k de closeness no Grafo de Recife")
+
+    G = _grafo_recife()
+    n = G.get_numero_de_nos()
+
+    for harmonica in [False, True]:
+        funcao = harmonic_centrality if harmonica else closeness_centrality
+        exato = funcao(G, weighted=True)
+        melhores = sorted(exato.values(), reverse=True)[:5]
+
+        # Com todos os nós como pivôs a estimativa é exata
+        r = top_k_closeness(G, 5, weighted=True, harmonic=harmonica, num_pivots=n, seed=0)
+        assert [valor for _, valor in r['top']] == melhores, "Top-5 exato"
+
+        # Amostrado: menos buscas que n, valores devolvidos são exatos
+        r = top_k_closeness(G, 5, weighted=True, harmonic=harmonica, seed=0)
+        assert r['num_pivots'] + r['num_exact'] < 2 * n, "Menos buscas que os dois modos exatos"
+        for no, valor in r['top']:
+            assert abs(valor - exato[no]) < 1e-12, f"Valor de {no} deve ser exato"
+        print(f"  -> {'Harmônica' if harmonica else 'Closeness'}: {r['num_pivots']} pivôs, "
+              f"{r['num_exact']} buscas exatas, topo {r['top'][0][0]}")
+
+    try:
+        top_k_closeness(G, 0)
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_top_k_closeness_recife")
+
+
+def test_pagerank_power_iteration():
+    print("\nPageRank por iteração de potência")
+
+    # Ciclo dirigido: todos iguais
+    G = Grafo(dirigido=True)
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A')]:
+        G.add_edge(u, v, 1)
+    r = pagerank(G, tol=1e-12)
+    assert all(abs(valor - 1 / 3) < 1e-9 for valor in r['scores'].values()), "Ciclo é uniforme"
+
+    # Nó sem saída (D): sua massa volta para a distribuição de teletransporte
+    G.add_edge('C', 'D', 1)
+    r = pagerank(G, tol=1e-12, max_iter=1000)
+    assert abs(sum(r['scores'].values()) - 1) < 1e-9, "Soma 1 mesmo com nó sem saída"
+    assert r['scores']['A'] < r['scores']['B'] < r['scores']['C'], "C recebe de B, que recebe de A"
+
+    # Pesos como probabilidades de transição
+    G = Grafo(dirigido=True)
+    G.add_edge('A', 'B', 3)
+    G.add_edge('A', 'C', 1)
+    G.add_edge('B', 'A', 1)
+    G.add_edge('C', 'A', 1)
+    com_peso = pagerank(G, weighted=True, tol=1e-12, max_iter=1000)['scores']
+    sem_peso = pagerank(G, tol=1e-12, max_iter=1000)['scores']
+    assert abs(sem_peso['B'] - sem_peso['C']) < 1e-12, "Sem pesos B e C são simétricos"
+    assert com_peso['B'] > com_peso['C'], "Aresta A -> B pesa 3 vezes mais"
+
+    # Partida a quente depois de uma pequena alteração converge em menos iterações
+    G = _grafo_recife()
+    antes = pagerank(G, tol=1e-12, max_iter=1000)
+    G.add_edge('boa viagem', 'recife', 1)
+    frio = pagerank(G, tol=1e-12, max_iter=1000)
+    quente = pagerank(G, start=antes['scores'], tol=1e-12, max_iter=1000)
+    assert quente['iterations'] < frio['iterations'], "Partida a quente deve ser mais rápida"
+    for no, valor in frio['scores'].items():
+        assert abs(quente['scores'][no] - valor) < 1e-9, f"Mesmo resultado em {no}"
+
+    try:
+        pagerank(G, personalization={'bairro inexistente': 1})
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "not found in graph" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Iterações: a frio {frio['iterations']}, a quente {quente['iterations']}")
+    print("PASSOU test_pagerank_power_iteration")
+
+
+def test_personalized_pagerank_local_push():
+    print("\nPageRank personalizado por push local")
+
+    G = _grafo_recife()
+    G.add_edge('ilha x', 'ilha y', 1)  # componente separada: o push nunca chega nela
+
+    global_ = pagerank(G, personalization={'boa viagem': 1}, tol=1e-14, max_iter=1000)['scores']
+    local = personalized_pagerank(G, 'boa viagem', epsilon=1e-9)
+    erro = sum(abs(local['scores'].get(no, 0.0) - valor) for no, valor in global_.items())
+    assert erro <= local['residual'] + 1e-12, "Erro L1 limitado pelo resíduo"
+    assert erro < 1e-6, "Push com epsilon pequeno se aproxima da iteração global"
+    assert 'ilha x' not in local['scores'], "Push só toca o que é alcançável"
+    assert max(local['scores'], key=local['scores'].get) == 'boa viagem', "A origem é a mais importante"
+
+    # Epsilon maior: menos pushes, menos nós tocados, resíduo maior
+    grosso = personalized_pagerank(G, 'boa viagem', epsilon=1e-3)
+    assert grosso['pushes'] < local['pushes'], "Menos pushes"
+    assert len(grosso['scores']) <= len(local['scores']), "Menos nós tocados"
+    assert grosso['residual'] > local['residual'], "Resíduo maior"
+
+    # Nó sem saída devolve a massa para a origem
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    r = personalized_pagerank(G_dir, 'A', epsilon=1e-12)
+    assert abs(r['scores']['A'] - 1 / 1.85) < 1e-9, "A = 0.15 / (1 - 0.85^2)"
+
+    try:
+        personalized_pagerank(G, 'bairro inexistente')
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "not found in graph" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> {local['pushes']} pushes, {len(local['scores'])} nós, resíduo {local['residual']:.2e}")
+    print("PASSOU test_personalized_pagerank_local_push")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes de Centralidade")
+    print("="*60)
+
+    test_betweenness_small_graphs()
+    test_betweenness_recife_exact_parallel_sampled()
+    test_closeness_harmonic_small_graphs()
+    test_top_k_closeness_recife()
+    test_pagerank_power_iteration()
+    test_personalized_pagerank_local_push()
+
+    print("\n" + "="*60)
+    print("Todos os Testes de Centralidade Passaram!")
+    print("="*60 + "\n")
@@ -12,7 +12,8 @@ os.chdir(project_root)
 sys.path.insert(0, project_root)
 
 from src.graphs.graph import Grafo
-from src.graphs.algorithms import dfs, dfs_full
+from src.graphs.algorithms import (dfs, dfs_full, DFS_EDGE_TYPES, strongly_connected_components,
+                                   bridges_and_articulation_points)
 from src.graphs.io import carregar_dados_principais, carregar_dataset_parte2
 
 
@@ -203,6 +204,208 @@ def test_dfs_source_not_in_graph():
     print("PASSOU test_dfs_source_not_in_graph")
 
 
+def test_dfs_deep_chain_iterative():
+    print("\nDFS em cadeia mais profunda que o limite de recursão")
+
+    n = sys.getrecursionlimit() * 5
+    G = Grafo(dirigido=True)
+    for i in range(n - 1):
+        G.add_edge(i, i + 1, 1)
+    G.add_edge(n - 1, 0, 1)
+
+    result = dfs(G, 0)
+
+    assert result['order'] == list(range(n)), "Ordem deve seguir a cadeia"
+    assert result['discovery_time'][n - 1] == n, "Último nó descoberto no tempo n"
+    assert result['finish_time'][0] == 2 * n, "Origem termina por último"
+    assert result['parent'][n - 1] == n - 2, "Pai do último nó deve ser o penúltimo"
+    assert result['has_cycle'] == True, "Aresta de volta fecha o ciclo"
+    assert result['edge_classification'][(n - 1, 0)] == 'back_edge', "Aresta final deve ser de retorno"
+
+    full = dfs_full(G)
+    assert full['finish_time'] == result['finish_time'], "dfs_full deve concordar com dfs"
+
+    print(f"  -> {n} nós percorridos sem recursão")
+    print("PASSOU test_dfs_deep_chain_iterative")
+
+
+def test_dfs_edge_modes():
+    print("\nDFS: modos de contagem e de array de arestas")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'boa viagem'
+    completo = dfs(G, source)
+    contagem = dfs(G, source, edge_mode='counts')
+    vetor = dfs(G, source, edge_mode='array')
+
+    esperado = {}
+    for edge_type in completo['edge_classification'].values():
+        esperado[edge_type] = esperado.get(edge_type, 0) + 1
+
+    assert set(contagem) == {'num_visited', 'has_cycle', 'edge_counts'}, "Modo counts só retorna contagens"
+    assert contagem['num_visited'] == len(completo['visited']), "Mesmo número de visitados"
+    assert contagem['has_cycle'] == completo['has_cycle'], "Mesma detecção de ciclo"
+    assert contagem['edge_counts'] == esperado, "Contagens devem bater com o dicionário"
+
+    csr = G.para_csr()
+    origens = csr.origens()
+    decodificado = {}
+    for slot, codigo in enumerate(vetor['edge_classification']):
+        if codigo:
+            edge = (csr.nos[origens[slot]], csr.nos[csr.indices[slot]])
+            decodificado[edge] = DFS_EDGE_TYPES[codigo]
+
+    assert len(vetor['edge_classification']) == len(csr.indices), "Um código por posição da CSR"
+    assert decodificado == completo['edge_classification'], "Array decodificado deve bater com o dicionário"
+    assert vetor['order'] == completo['order'], "Mesma ordem de visita"
+
+    try:
+        dfs(G, source, edge_mode='lista')
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Contagens: {contagem['edge_counts']}")
+    print("PASSOU test_dfs_edge_modes")
+
+
+def test_strongly_connected_components():
+    print("\nComponentes fortemente conexas e DAG de condensação")
+
+    G = Grafo(dirigido=True)
+    # {A, B, C} -> {D, E} -> F, e G isolado
+    G.add_edge('A', 'B', 1)
+    G.add_edge('B', 'C', 1)
+    G.add_edge('C', 'A', 1)
+    G.add_edge('C', 'D', 5)
+    G.add_edge('B', 'E', 2)
+    G.add_edge('D', 'E', 1)
+    G.add_edge('E', 'D', 1)
+    G.add_edge('E', 'F', 3)
+    G.add_node('G')
+
+    result = strongly_connected_components(G)
+    comp = dict(zip(result['nodes'], result['component'].tolist()))
+
+    assert result['num_components'] == 4, "Devem existir 4 componentes"
+    assert comp['A'] == comp['B'] == comp['C'], "A, B e C são mutuamente alcançáveis"
+    assert comp['D'] == comp['E'], "D e E são mutuamente alcançáveis"
+    assert len({comp['A'], comp['D'], comp['F'], comp['G']}) == 4, "Componentes distintas"
+    assert sorted(result['components'][comp['A']]) == ['A', 'B', 'C'], "Membros da componente de A"
+
+    dag = result['condensation']
+    arestas = {(c1, c2): w for c1 in range(result['num_components']) for c2, w in dag.get_vizinhos(c1)}
+    assert arestas == {(comp['A'], comp['D']): 2, (comp['D'], comp['F']): 3}, \
+        "Arestas paralelas entre componentes devem virar uma, com o menor peso"
+    assert all(c1 < c2 for c1, c2 in arestas), "Ids seguem ordem topológica"
+
+    # Ciclo mais longo que o limite de recursão: uma única componente
+    n = sys.getrecursionlimit() * 5
+    G_ciclo = Grafo(dirigido=True)
+    for i in range(n):
+        G_ciclo.add_edge(i, (i + 1) % n, 1)
+    assert strongly_connected_components(G_ciclo)['num_components'] == 1, "Ciclo inteiro é uma componente"
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G_recife = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G_recife.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G_recife.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    result = strongly_connected_components(G_recife)
+    alcancados = len(dfs(G_recife, 'boa viagem')['visited'])
+    assert len(result['components'][result['component'][result['nodes'].index('boa viagem')]]) == alcancados, \
+        "Em grafo não-dirigido a componente é o conjunto alcançável"
+
+    print(f"  -> Recife: {result['num_components']} componente(s)")
+    print("PASSOU test_strongly_connected_components")
+
+
+def test_bridges_and_articulation_points():
+    print("\nPontes, articulações e componentes biconexas")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    result = bridges_and_articulation_points(G)
+
+    # Conferir cada ponte removendo a aresta e refazendo a busca
+    total = len(dfs(G, 'recife')['visited'])
+    for u, v in result['bridges']:
+        G_sem = Grafo()
+        for no in G.get_todos_os_nos():
+            G_sem.add_node(no)
+        for _, linha in df_adjacencias.iterrows():
+            if {linha['bairro_origem'], linha['bairro_destino']} != {u, v}:
+                G_sem.add_edge(linha['bairro_origem'], linha['bairro_destino'], linha['peso'])
+        assert len(dfs(G_sem, u)['visited']) < total, f"Remover {u} - {v} deve desconectar o grafo"
+
+    for u, v in result['bridges']:
+        assert u in result['articulation_points'] or len(G.get_vizinhos(u)) == 1 \
+            or len(G.get_vizinhos(v)) == 1, "Extremo de ponte com grau > 1 é articulação"
+
+    assert sorted(no for c in result['biconnected_components'] for no in c if no not in
+                  result['articulation_points']) == sorted(set(G.get_todos_os_nos()) - set(result['articulation_points'])), \
+        "Todo bairro que não é articulação está em exatamente uma componente biconexa"
+
+    # Aresta paralela não é ponte; caminho longo sem recursão
+    G_par = Grafo()
+    G_par.add_edge('A', 'B', 1)
+    G_par.add_edge('A', 'B', 2)
+    G_par.add_edge('B', 'C', 1)
+    result_par = bridges_and_articulation_points(G_par)
+    assert result_par['bridges'] == [('B', 'C')], "A - B duplicada não é ponte"
+    assert result_par['articulation_points'] == ['B'], "B liga as duas partes"
+    assert sorted(map(sorted, result_par['biconnected_components'])) == [['A', 'B'], ['B', 'C']], \
+        "Duas componentes biconexas"
+
+    n = sys.getrecursionlimit() * 5
+    G_linha = Grafo()
+    for i in range(n - 1):
+        G_linha.add_edge(i, i + 1, 1)
+    result_linha = bridges_and_articulation_points(G_linha)
+    assert len(result_linha['bridges']) == n - 1, "Toda aresta de um caminho é ponte"
+    assert len(result_linha['articulation_points']) == n - 2, "Todo nó interno é articulação"
+
+    try:
+        bridges_and_articulation_points(Grafo(dirigido=True))
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Pontes em Recife: {result['bridges']}")
+    print("PASSOU test_bridges_and_articulation_points")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("Executando Testes do DFS")
@@ -213,7 +416,11 @@ if __name__ == "__main__":
     test_dfs_edge_classification()
     test_dfs_europe_air_routes()
     test_dfs_discovery_finish_times()
+    test_dfs_deep_chain_iterative()
     test_dfs_source_not_in_graph()
+    test_strongly_connected_components()
+    test_dfs_edge_modes()
+    test_bridges_and_articulation_points()
 
     print("\n" + "="*60)
     print("Todos os Testes do DFS Passaram!")
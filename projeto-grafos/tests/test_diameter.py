@@ -0,0 +1,121 @@
+"""
+- Diâmetro (iFUB): caminhos, ciclos, maior componente e maior componente fortemente conexa
+- Excentricidades (Takes-Kosters): raio, centro e periferia
+- Grafo de Recife: comparação com uma busca a partir de cada bairro, em saltos e ponderado
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.algorithms import (diameter, eccentricities, multi_source_bfs,
+                                  single_source_dijkstra)
+from src.graphs.io import carregar_dados_principais
+
+
+def test_diameter_small_graphs():
+    print("\nDiâmetro e excentricidades em grafos pequenos")
+
+    # Caminho A - B - C - D - E com pesos 1, 1, 1, 5 e componente separada X - Y
+    G = Grafo()
+    for u, v, peso in [('A', 'B', 1), ('B', 'C', 1), ('C', 'D', 1), ('D', 'E', 5), ('X', 'Y', 1)]:
+        G.add_edge(u, v, peso)
+
+    d = diameter(G)
+    assert d['diameter'] == 4, "Caminho de 5 nós tem diâmetro 4"
+    assert set(d['endpoints']) == {'A', 'E'}, "Extremos do caminho"
+    assert d['component_size'] == 5, "Só a maior componente"
+
+    e = eccentricities(G)
+    assert e['eccentricity'] == {'A': 4, 'B': 3, 'C': 2, 'D': 3, 'E': 4}, "Excentricidades no caminho"
+    assert e['radius'] == 2 and e['center'] == ['C'], "C é o centro"
+    assert sorted(e['periphery']) == ['A', 'E'], "Periferia"
+
+    e = eccentricities(G, weighted=True)
+    assert diameter(G, weighted=True)['diameter'] == 8, "A até E pesa 8"
+    assert e['radius'] == 5 and e['center'] == ['D'], "D é o centro ponderado"
+
+    # Dirigido: ciclo A -> B -> C -> A com cauda C -> D fora da componente forte
+    G_dir = Grafo(dirigido=True)
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')]:
+        G_dir.add_edge(u, v, 1)
+    assert diameter(G_dir)['diameter'] == 2, "Ciclo dirigido de 3 nós"
+    e = eccentricities(G_dir)
+    assert e['eccentricity'] == {'A': 2, 'B': 2, 'C': 2}, "D fica fora da componente forte"
+
+    try:
+        diameter(Grafo())
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    G.add_edge('A', 'C', -1)
+    try:
+        eccentricities(G, weighted=True)
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_diameter_small_graphs")
+
+
+def test_diameter_recife():
+    print("\nDiâmetro e excentricidades no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    # Referência em saltos: BFS a partir de todos os bairros
+    saltos = multi_source_bfs(G)
+    esperado = {origem: int(saltos['hops'][i].max()) for i, origem in enumerate(saltos['sources'])}
+    e = eccentricities(G)
+    assert e['eccentricity'] == esperado, "Excentricidades em saltos"
+    assert diameter(G)['diameter'] == max(esperado.values()) == e['diameter'], "Diâmetro em saltos"
+    assert e['radius'] == min(esperado.values()), "Raio em saltos"
+    assert e['num_searches'] < G.get_numero_de_nos(), "Menos buscas que o método ingênuo"
+
+    # Referência ponderada: Dijkstra a partir de todos os bairros
+    esperado = {}
+    for bairro in G.get_todos_os_nos():
+        distancias, _ = single_source_dijkstra(G, bairro, weight='weight')
+        esperado[bairro] = max(distancias.values())
+    e = eccentricities(G, weighted=True)
+    for bairro, valor in esperado.items():
+        assert abs(e['eccentricity'][bairro] - valor) < 1e-9, f"Excentricidade ponderada de {bairro}"
+    d = diameter(G, weighted=True)
+    assert abs(d['diameter'] - max(esperado.values())) < 1e-9, "Diâmetro ponderado"
+    x, y = d['endpoints']
+    distancias, _ = single_source_dijkstra(G, x, weight='weight')
+    assert abs(distancias[y] - d['diameter']) < 1e-9, "Extremos realizam o diâmetro"
+
+    print(f"  -> Diâmetro: {diameter(G)['diameter']} saltos, {d['diameter']} ponderado; "
+          f"centro ponderado: {e['center']}")
+    print("PASSOU test_diameter_recife")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes de Diâmetro")
+    print("="*60)
+
+    test_diameter_small_graphs()
+    test_diameter_recife()
+
+    print("\n" + "="*60)
+    print("Todos os Testes de Diâmetro Passaram!")
+    print("="*60 + "\n")
@@ -14,6 +14,10 @@ sys.path.insert(0, project_root)
 
 from src.graphs.graph import Grafo
 from src.graphs.algorithms import dijkstra_path, dijkstra_path_length, single_source_dijkstra
+from src.graphs.algorithms import k_shortest_paths
+from src.graphs.algorithms import reachable_within_budget, multi_source_reachable_within_budget
+from src.graphs.algorithms import single_source_dijkstra_auto
+from src.graphs.algorithms import delta_stepping
 from src.graphs.io import carregar_dados_principais, carregar_dataset_parte2
 
 
@@ -347,6 +351,202 @@ def test_dijkstra_weighted_vs_unweighted():
     print("PASSOU test_dijkstra_weighted_vs_unweighted")
 
 
+def test_k_shortest_paths_recife():
+    print("\nK Caminhos Mais Curtos (Yen) Nova Descoberta -> Setúbal")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'nova descoberta'
+    target = 'setubal'
+    k = 4
+
+    result = k_shortest_paths(G, source, target, k)
+    paths, lengths = result['paths'], result['lengths']
+
+    assert len(paths) == k, f"Deve encontrar {k} caminhos"
+    assert lengths[0] == dijkstra_path_length(G, source, target), "Primeiro caminho deve ser o mais curto"
+    assert lengths == sorted(lengths), "Custos devem estar em ordem crescente"
+    assert len({tuple(p) for p in paths}) == k, "Caminhos devem ser distintos"
+
+    for path, length in zip(paths, lengths):
+        assert path[0] == source and path[-1] == target, "Caminho deve ligar origem e destino"
+        assert len(set(path)) == len(path), "Caminho não deve repetir bairros"
+        custo = sum(G._adj[u][v]['weight'] for u, v in zip(path[:-1], path[1:]))
+        assert custo == length, "Custo informado deve ser a soma dos pesos"
+
+    assert result['num_searches'] >= k, "Cada caminho extra exige ao menos uma busca"
+
+    for i, (path, length) in enumerate(zip(paths, lengths), 1):
+        print(f"  -> {i}º caminho (custo {length}): {' -> '.join(path)}")
+    print(f"  -> Buscas de Dijkstra realizadas: {result['num_searches']}")
+    print("PASSOU test_k_shortest_paths_recife")
+
+
+def test_reachable_within_budget():
+    print("\nDestinos Alcançáveis Dentro do Orçamento")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'boa viagem'
+    budget = 10.0
+
+    resultados = list(reachable_within_budget(G, source, budget))
+    custos = [custo for _, custo in resultados]
+    distancias, _ = single_source_dijkstra(G, source, cutoff=budget)
+
+    assert resultados[0] == (source, 0), "A origem deve vir primeiro, com custo 0"
+    assert custos == sorted(custos), "Resultados devem vir em ordem crescente de custo"
+    assert dict(resultados) == distancias, "Deve concordar com Dijkstra com cutoff"
+
+    # O gerador pode ser interrompido sem calcular o resto
+    gerador = reachable_within_budget(G, source, budget)
+    primeiros = [next(gerador) for _ in range(3)]
+    assert primeiros == resultados[:3], "Primeira página deve ser igual ao início da lista completa"
+
+    # Várias origens: custo é o mínimo entre as origens
+    origens = ['boa viagem', 'casa amarela']
+    multi = {no: (custo, origem) for no, custo, origem in
+             multi_source_reachable_within_budget(G, origens, budget)}
+    for no, (custo, origem) in multi.items():
+        assert origem in origens, "Origem informada deve ser uma das origens"
+        assert custo == min(dijkstra_path_length(G, o, no) for o in origens), \
+            f"Custo de {no} deve ser o menor entre as origens"
+
+    print(f"  -> {len(resultados)} bairros a até {budget} de '{source}'")
+    print(f"  -> {len(multi)} bairros a até {budget} de {origens}")
+    print("PASSOU test_reachable_within_budget")
+
+
+def test_dijkstra_bucket_engines():
+    print("\nDijkstra com Fila de Baldes (Dial / Radix Heap)")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'boa viagem'
+    esperado, _ = single_source_dijkstra(G, source)
+
+    result = single_source_dijkstra_auto(G, source)
+    assert result['engine'] == 'dial', "Pesos inteiros pequenos devem usar os baldes de Dial"
+    assert result['distances'] == esperado, "Dial deve concordar com o heap binário"
+
+    result = single_source_dijkstra_auto(G, source, dial_max_weight=2)
+    assert result['engine'] == 'radix', "Pesos inteiros acima do limite devem usar o radix heap"
+    assert result['distances'] == esperado, "Radix heap deve concordar com o heap binário"
+
+    for node, pred in result['predecessors'].items():
+        if pred is not None:
+            assert result['distances'][pred] + G._adj[pred][node]['weight'] == result['distances'][node], \
+                f"Predecessor de {node} inconsistente"
+
+    # Preços em centavos: inteiros apenas depois da escala
+    G_precos = Grafo(dirigido=True)
+    G_precos.add_edge('REC', 'FOR', 129.90)
+    G_precos.add_edge('FOR', 'LIS', 310.45)
+    G_precos.add_edge('REC', 'LIS', 460.99)
+
+    result = single_source_dijkstra_auto(G_precos, 'REC')
+    assert result['engine'] == 'binary_heap', "Pesos fracionários devem usar o heap binário"
+
+    result = single_source_dijkstra_auto(G_precos, 'REC', scale=100)
+    assert result['engine'] == 'radix', "Centavos acima de dial_max_weight usam o radix heap"
+    assert result['distances']['LIS'] == 440.35, "REC -> FOR -> LIS custa 440.35"
+
+    print(f"  -> Motor para Recife: dial; para preços em centavos: {result['engine']}")
+    print("PASSOU test_dijkstra_bucket_engines")
+
+
+def test_delta_stepping_recife():
+    print("\nDelta-stepping no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    source = 'nova descoberta'
+    esperado, _ = single_source_dijkstra(G, source)
+
+    for delta in (None, 1.0, 2.5, 100.0):
+        result = delta_stepping(G, source, delta=delta)
+        assert result['distances'] == esperado, f"Delta-stepping (Δ={result['delta']}) deve concordar com Dijkstra"
+
+    # Δ pequeno: um balde por distância; Δ enorme: um único balde
+    assert delta_stepping(G, source, delta=100.0)['num_buckets'] == 1, "Δ grande deve usar um único balde"
+
+    # Lotes divididos entre processos sobre memória compartilhada
+    result = delta_stepping(G, source, workers=2, parallel_threshold=1)
+    assert result['distances'] == esperado, "Versão paralela deve concordar com Dijkstra"
+    for node, pred in result['predecessors'].items():
+        if pred is not None:
+            assert result['distances'][pred] + G._adj[pred][node]['weight'] == result['distances'][node], \
+                f"Predecessor de {node} inconsistente"
+
+    print(f"  -> Distâncias idênticas às do Dijkstra (Δ padrão = {result['delta']:.4f})")
+    print("PASSOU test_delta_stepping_recife")
+
+
+def test_dijkstra_auto_parallel_edges():
+    print("\nDijkstra automático com arestas paralelas")
+
+    # a -> b duas vezes: todos os motores devem usar a mais barata
+    casos = [((1, 5), 'dial', {}), ((1, 5), 'radix', {'dial_max_weight': 2}),
+             ((1.0, 5.5), 'binary_heap', {})]
+    for pesos, motor, opcoes in casos:
+        G = Grafo(dirigido=True)
+        for peso in pesos:
+            G.add_edge('a', 'b', peso)
+        G.add_edge('b', 'c', 2)
+
+        result = single_source_dijkstra_auto(G, 'a', **opcoes)
+        assert result['engine'] == motor, f"Motor esperado: {motor}"
+        assert result['distances'] == {'a': 0, 'b': 1, 'c': 3}, f"{motor} deve usar a aresta paralela mais barata"
+        assert result['predecessors'] == {'a': None, 'b': 'a', 'c': 'b'}, f"Predecessores com {motor}"
+        print(f"  -> {motor}: b = {result['distances']['b']}")
+
+    print("PASSOU test_dijkstra_auto_parallel_edges")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("Executando Testes do Dijkstra")
@@ -363,6 +563,11 @@ if __name__ == "__main__":
     test_dijkstra_source_not_in_graph()
     test_dijkstra_target_not_in_graph()
     test_dijkstra_weighted_vs_unweighted()
+    test_reachable_within_budget()
+    test_k_shortest_paths_recife()
+    test_delta_stepping_recife()
+    test_dijkstra_bucket_engines()
+    test_dijkstra_auto_parallel_edges()
 
     print("\n" + "="*60)
     print("Todos os Testes do Dijkstra Passaram!")
@@ -0,0 +1,189 @@
+"""
+- Ego-redes por triângulos: valores conhecidos, laços, arestas paralelas e grafos dirigidos
+- Métodos forward e matricial iguais; Grafo de Recife igual à varredura das adjacências
+- Ego-redes de raio k (BFS truncado) e de raio em distância (Dijkstra truncado), modo paralelo
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.algorithms import (ego_network_metrics, ego_networks, multi_source_bfs,
+                                  single_source_dijkstra)
+from src.graphs.io import carregar_dados_principais
+
+
+def _por_no(metricas, chave):
+    return dict(zip(metricas['nodes'], metricas[chave].tolist()))
+
+
+def test_ego_network_metrics_small_graphs():
+    print("\nMétricas de ego-rede em grafos pequenos")
+
+    # Triângulo A, B, C com cauda C - D
+    G = Grafo()
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')]:
+        G.add_edge(u, v, 1)
+
+    for metodo in ['forward', 'matrix']:
+        m = ego_network_metrics(G, method=metodo)
+        assert _por_no(m, 'triangles') == {'A': 1, 'B': 1, 'C': 1, 'D': 0}, f"Triângulos ({metodo})"
+        assert _por_no(m, 'ego_order') == {'A': 3, 'B': 3, 'C': 4, 'D': 2}, f"Ordem ({metodo})"
+        assert _por_no(m, 'ego_size') == {'A': 3, 'B': 3, 'C': 4, 'D': 1}, f"Tamanho ({metodo})"
+        assert _por_no(m, 'ego_density')['C'] == 4 / 6, f"Densidade de C ({metodo})"
+        assert _por_no(m, 'clustering') == {'A': 1.0, 'B': 1.0, 'C': 1 / 3, 'D': 0.0}, f"Clustering ({metodo})"
+
+    # Arestas paralelas e laços contam no tamanho, não nos triângulos
+    G.add_edge('A', 'B', 2)
+    G.add_edge('B', 'B', 1)
+    forward = ego_network_metrics(G, method='forward')
+    matricial = ego_network_metrics(G, method='matrix')
+    for chave in ['degree', 'self_loops', 'triangles', 'ego_order', 'ego_size']:
+        assert _por_no(forward, chave) == _por_no(matricial, chave), f"Métodos iguais em {chave}"
+    assert _por_no(forward, 'ego_size')['C'] == 6, "A - B duas vezes e o laço em B"
+    assert _por_no(forward, 'triangles')['C'] == 1, "Ainda um triângulo"
+
+    # Dirigido: grafo não-dirigido subjacente, densidade sobre n(n-1)
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'A', 1)
+    G_dir.add_edge('B', 'C', 1)
+    m = ego_network_metrics(G_dir)
+    assert _por_no(m, 'ego_size')['B'] == 3, "Arestas nos dois sentidos"
+    assert _por_no(m, 'ego_density')['B'] == 3 / 6, "Densidade dirigida"
+
+    try:
+        ego_network_metrics(G, method='outro')
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_ego_network_metrics_small_graphs")
+
+
+def test_ego_network_metrics_recife():
+    print("\nMétricas de ego-rede no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    m = ego_network_metrics(G)
+    ordem = _por_no(m, 'ego_order')
+    tamanho = _por_no(m, 'ego_size')
+    densidade = _por_no(m, 'ego_density')
+    clustering = _por_no(m, 'clustering')
+    forward = ego_network_metrics(G, method='forward')
+    assert _por_no(forward, 'ego_size') == tamanho, "Métodos iguais no Grafo de Recife"
+
+    # Referência: varrer todas as adjacências para cada bairro
+    arestas = list(zip(df_adjacencias['bairro_origem'], df_adjacencias['bairro_destino']))
+    for bairro in G.get_todos_os_nos():
+        vizinhos = {v for v, _ in G.get_vizinhos(bairro)}
+        ego = vizinhos | {bairro}
+        assert ordem[bairro] == len(ego), f"Ordem da ego-rede de {bairro}"
+        arestas_ego = sum(1 for u, v in arestas if u in ego and v in ego)
+        assert tamanho[bairro] == arestas_ego, f"Tamanho da ego-rede de {bairro}"
+        assert densidade[bairro] == 2 * arestas_ego / (len(ego) * (len(ego) - 1)), f"Densidade de {bairro}"
+
+        grau = len(vizinhos)
+        if grau >= 2:
+            ligados = arestas_ego - grau
+            assert abs(clustering[bairro] - ligados / (grau * (grau - 1) / 2)) < 1e-12, f"Clustering de {bairro}"
+
+    mais_denso = max(densidade, key=densidade.get)
+    print(f"  -> Bairro mais denso: {mais_denso} ({densidade[mais_denso]:.4f})")
+    print("PASSOU test_ego_network_metrics_recife")
+
+
+def test_ego_networks_radius():
+    print("\nEgo-redes de raio k (saltos) e de raio em distância")
+
+    # Caminho A - B - C - D com pesos 1, 2, 1
+    G = Grafo()
+    G.add_edge('A', 'B', 1)
+    G.add_edge('B', 'C', 2)
+    G.add_edge('C', 'D', 1)
+    r = ego_networks(G, radius=2)
+    assert _por_no(r, 'ego_order') == {'A': 3, 'B': 4, 'C': 4, 'D': 3}, "Ordem com 2 saltos"
+    assert _por_no(r, 'ego_size') == {'A': 2, 'B': 3, 'C': 3, 'D': 2}, "Arestas induzidas"
+    r = ego_networks(G, radius=2.5, weighted=True, sources=['A'])
+    assert r['ego_order'].tolist() == [2], "B a 1, C a 3: só A e B dentro de 2.5"
+
+    # Dirigido: segue as arestas de saída
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'C', 1)
+    r = ego_networks(G_dir, radius=5)
+    assert _por_no(r, 'ego_order') == {'A': 3, 'B': 2, 'C': 1}, "Só o que é alcançável"
+    assert _por_no(r, 'ego_density')['A'] == 2 / 6, "Densidade dirigida"
+
+    # Grafo de Recife: raio 1 igual ao motor de triângulos, raio k igual às distâncias
+    df_bairros, df_adjacencias = carregar_dados_principais()
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(linha['bairro_origem'], linha['bairro_destino'], linha['peso'])
+
+    triangulos = ego_network_metrics(G)
+    raio_1 = ego_networks(G, radius=1)
+    assert (raio_1['ego_size'] == triangulos['ego_size']).all(), "Raio 1 = ego_network_metrics"
+    assert (raio_1['ego_density'] == triangulos['ego_density']).all(), "Mesma densidade"
+
+    saltos = multi_source_bfs(G)
+    raio_3 = ego_networks(G, radius=3)
+    for i in range(len(saltos['sources'])):
+        linha = saltos['hops'][i]
+        assert raio_3['ego_order'][i] == ((linha >= 0) & (linha <= 3)).sum(), "Ordem com 3 saltos"
+
+    ponderado = ego_networks(G, radius=5.0, weighted=True, sources=['boa viagem', 'recife'])
+    for i, origem in enumerate(ponderado['nodes']):
+        distancias, _ = single_source_dijkstra(G, origem, weight='weight')
+        dentro = {no for no, d in distancias.items() if d <= 5.0}
+        assert ponderado['ego_order'][i] == len(dentro), f"Bola de raio 5 em {origem}"
+        arestas = sum(1 for u, v in zip(df_adjacencias['bairro_origem'], df_adjacencias['bairro_destino'])
+                      if u in dentro and v in dentro)
+        assert ponderado['ego_size'][i] == arestas, f"Arestas da bola de {origem}"
+
+    paralelo = ego_networks(G, radius=2, workers=2)
+    sequencial = ego_networks(G, radius=2)
+    assert (paralelo['ego_size'] == sequencial['ego_size']).all(), "Modo paralelo deve bater"
+
+    try:
+        ego_networks(G, radius=1, sources=['bairro inexistente'])
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "not found in graph" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print(f"  -> Ordem média com 3 saltos: {raio_3['ego_order'].mean():.1f}")
+    print("PASSOU test_ego_networks_radius")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes de Ego-Redes")
+    print("="*60)
+
+    test_ego_network_metrics_small_graphs()
+    test_ego_network_metrics_recife()
+    test_ego_networks_radius()
+
+    print("\n" + "="*60)
+    print("Todos os Testes de Ego-Redes Passaram!")
+    print("="*60 + "\n")
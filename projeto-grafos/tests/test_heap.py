@@ -0,0 +1,99 @@
+"""
+- Heap d-ário indexado: ordem correta de remoção e decrease-key
+- Dijkstra com heap indexado: mesmas distâncias do Dijkstra com heapq
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.heap import IndexedDaryHeap
+from src.graphs.algorithms import single_source_dijkstra, single_source_dijkstra_indexed
+from src.graphs.io import carregar_dados_principais
+
+
+def test_heap_pop_order_and_decrease_key():
+    print("\nHeap d-ário indexado: ordem e decrease-key")
+
+    for d in (2, 3, 4, 8):
+        heap = IndexedDaryHeap(10, d)
+        chaves = [7, 3, 9, 1, 8, 2, 6, 5, 4, 0]
+        for id_, chave in enumerate(chaves):
+            heap.push(id_, chave)
+
+        assert len(heap) == 10, "Heap deve ter 10 itens"
+
+        heap.decrease_key(2, -1)            # id 2: 9 -> -1
+        assert heap.push_or_decrease(4, 0.5) == True, "8 -> 0.5 deve mudar o heap"
+        assert heap.push_or_decrease(4, 10) == False, "Chave maior não deve mudar o heap"
+        assert heap.peek() == (2, -1), "Mínimo deve ser o id 2"
+
+        removidos = [heap.pop() for _ in range(10)]
+        ordem = [chave for _, chave in removidos]
+        assert ordem == sorted(ordem), f"Remoção deve sair em ordem crescente (d={d})"
+        assert len(heap) == 0, "Heap deve ficar vazio"
+        assert 2 not in heap, "Id removido não deve estar no heap"
+
+    heap = IndexedDaryHeap(3)
+    heap.push(0, 5)
+    try:
+        heap.push(0, 1)
+        assert False, "Deveria ter lançado exceção"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_heap_pop_order_and_decrease_key")
+
+
+def test_dijkstra_indexed_heap_recife():
+    print("\nDijkstra com heap indexado no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    for source in ['boa viagem', 'nova descoberta', 'recife']:
+        esperado, _ = single_source_dijkstra(G, source)
+        for d in (2, 4):
+            result = single_source_dijkstra_indexed(G, source, d=d)
+            assert result['distances'] == esperado, \
+                f"Heap {d}-ário deve concordar com heapq a partir de {source}"
+            assert result['predecessors'][source] is None, f"{source} não deve ter predecessor"
+
+    G_neg = Grafo(dirigido=True)
+    G_neg.add_edge('A', 'B', -1.0)
+    try:
+        single_source_dijkstra_indexed(G_neg, 'A')
+        assert False, "Deveria ter lançado exceção para peso negativo"
+    except ValueError as e:
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("  -> Distâncias idênticas às do Dijkstra com heapq")
+    print("PASSOU test_dijkstra_indexed_heap_recife")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes do Heap Indexado")
+    print("="*60)
+
+    test_heap_pop_order_and_decrease_key()
+    test_dijkstra_indexed_heap_recife()
+
+    print("\n" + "="*60)
+    print("Todos os Testes do Heap Indexado Passaram!")
+    print("="*60 + "\n")
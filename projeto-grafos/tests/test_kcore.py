@@ -0,0 +1,104 @@
+"""
+- k-core (Batagelj-Zaversnik): core numbers conhecidos, grafos dirigidos e laços
+- Subgrafo k-core: todos os nós com grau >= k, comparação com remoção ingênua no Grafo de Recife
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.algorithms import core_number, k_core
+from src.graphs.io import carregar_dados_principais
+
+
+def test_core_number_small_graphs():
+    print("\nCore numbers em grafos pequenos")
+
+    # Clique A, B, C, D com cauda D - E - F e nó isolado G
+    G = Grafo()
+    for u, v in [('A', 'B'), ('A', 'C'), ('A', 'D'), ('B', 'C'), ('B', 'D'), ('C', 'D'),
+                 ('D', 'E'), ('E', 'F')]:
+        G.add_edge(u, v, 1)
+    G.add_node('G')
+    core = core_number(G)
+    assert core == {'A': 3, 'B': 3, 'C': 3, 'D': 3, 'E': 1, 'F': 1, 'G': 0}, "Clique é o 3-core"
+
+    # Laços são ignorados
+    G.add_edge('F', 'F', 1)
+    assert core_number(G)['F'] == 1, "Laço não aumenta o core"
+
+    # Dirigido: grau de entrada + grau de saída
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_edge('B', 'A', 1)
+    G_dir.add_edge('B', 'C', 1)
+    core = core_number(G_dir)
+    assert core == {'A': 2, 'B': 2, 'C': 1}, "A e B têm grau total 2 entre si"
+
+    assert core_number(Grafo()) == {}, "Grafo vazio"
+
+    print("PASSOU test_core_number_small_graphs")
+
+
+def test_k_core_recife():
+    print("\nSubgrafo k-core no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    core = core_number(G)
+    core_max = max(core.values())
+
+    for k in range(core_max + 1):
+        # Referência: remover repetidamente os nós de grau < k
+        restantes = set(G.get_todos_os_nos())
+        mudou = True
+        while mudou:
+            mudou = False
+            for no in list(restantes):
+                grau = sum(1 for vizinho, _ in G.get_vizinhos(no) if vizinho in restantes)
+                if grau < k:
+                    restantes.discard(no)
+                    mudou = True
+
+        subgrafo = k_core(G, k, core=core)
+        assert set(subgrafo.get_todos_os_nos()) == restantes, f"Nós do {k}-core"
+        for no in subgrafo.get_todos_os_nos():
+            assert len(subgrafo.get_vizinhos(no)) >= k, f"{no} deve ter grau >= {k} no {k}-core"
+
+    nucleo = k_core(G)
+    assert all(core[no] == core_max for no in nucleo.get_todos_os_nos()), "Núcleo é o core máximo"
+    arestas = sum(1 for no in nucleo.get_todos_os_nos() for vizinho, _ in G.get_vizinhos(no)
+                  if vizinho in nucleo) // 2
+    assert nucleo.get_numero_de_arestas() == arestas, "Todas as arestas induzidas, uma vez cada"
+
+    print(f"  -> Core máximo: {core_max} ({nucleo.get_numero_de_nos()} bairros)")
+    print("PASSOU test_k_core_recife")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes de k-core")
+    print("="*60)
+
+    test_core_number_small_graphs()
+    test_k_core_recife()
+
+    print("\n" + "="*60)
+    print("Todos os Testes de k-core Passaram!")
+    print("="*60 + "\n")
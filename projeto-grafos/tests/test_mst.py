@@ -0,0 +1,129 @@
+"""
+- Árvore geradora mínima (Kruskal e Prim): pesos conhecidos, arestas paralelas, laços e pesos negativos
+- Florestas em grafos desconexos; grafos dirigidos tratados como não-dirigidos
+- Grafo de Recife: Kruskal igual a Prim e propriedade do ciclo para todas as arestas fora da árvore
+"""
+
+import sys
+import os
+from collections import deque
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.algorithms import kruskal_mst, prim_mst
+from src.graphs.union_find import UnionFind
+from src.graphs.io import carregar_dados_principais
+
+
+def _e_floresta(G, resultado):
+    componentes = UnionFind(G.get_todos_os_nos())
+    return all(componentes.union(u, v) for u, v, _ in resultado['edges'])
+
+
+def test_mst_small_graphs():
+    print("\nÁrvore geradora mínima em grafos pequenos")
+
+    # Quadrado A - B - C - D com diagonal A - C, aresta paralela e laço
+    G = Grafo()
+    for u, v, peso in [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3), ('D', 'A', 4), ('A', 'C', 5),
+                       ('A', 'B', 0.5), ('C', 'C', -10)]:
+        G.add_edge(u, v, peso)
+
+    for resultado in [kruskal_mst(G), prim_mst(G), prim_mst(G, root='D', d=2)]:
+        assert resultado['total_weight'] == 5.5, "0.5 + 2 + 3: paralela mais barata, laço ignorado"
+        assert len(resultado['edges']) == 3 and resultado['num_trees'] == 1, "Árvore com n - 1 arestas"
+        assert _e_floresta(G, resultado), "Sem ciclos"
+
+    # Pesos negativos são aceitos
+    G.add_edge('B', 'D', -1)
+    assert kruskal_mst(G)['total_weight'] == prim_mst(G)['total_weight'] == 1.5, "0.5 - 1 + 2"
+
+    # Desconexo: uma árvore por componente
+    G.add_edge('X', 'Y', 7)
+    G.add_node('Z')
+    for resultado in [kruskal_mst(G), prim_mst(G, root='X')]:
+        assert resultado['num_trees'] == 3, "Componentes {A, B, C, D}, {X, Y} e {Z}"
+        assert len(resultado['edges']) == 4, "n - número de árvores"
+        assert resultado['total_weight'] == 8.5, "1.5 + 7"
+
+    # Dirigido: cada arco vira uma aresta, vale o sentido mais barato
+    G_dir = Grafo(dirigido=True)
+    for u, v, peso in [('A', 'B', 5), ('B', 'A', 1), ('C', 'B', 2), ('A', 'C', 4)]:
+        G_dir.add_edge(u, v, peso)
+    for resultado in [kruskal_mst(G_dir), prim_mst(G_dir, root='C')]:
+        assert resultado['total_weight'] == 3, "B - A (1) e C - B (2)"
+
+    try:
+        prim_mst(G, root='inexistente')
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "not found in graph" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    print("PASSOU test_mst_small_graphs")
+
+
+def test_mst_recife():
+    print("\nÁrvore geradora mínima no Grafo de Recife")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    kruskal = kruskal_mst(G)
+    prim = prim_mst(G, root='nova descoberta')
+    assert abs(kruskal['total_weight'] - prim['total_weight']) < 1e-9, "Kruskal e Prim com o mesmo peso"
+    assert len(kruskal['edges']) == G.get_numero_de_nos() - G.get_numero_de_componentes(), "Floresta geradora"
+    assert _e_floresta(G, kruskal) and _e_floresta(G, prim), "Sem ciclos"
+
+    # Propriedade do ciclo: nenhuma aresta fora da árvore é mais barata que
+    # a aresta mais pesada do caminho entre suas pontas na árvore
+    arvore = {no: [] for no in G.get_todos_os_nos()}
+    for u, v, peso in kruskal['edges']:
+        arvore[u].append((v, peso))
+        arvore[v].append((u, peso))
+
+    def maior_peso_no_caminho(origem, destino):
+        maior = {origem: float('-inf')}
+        fila = deque([origem])
+        while fila:
+            u = fila.popleft()
+            for v, peso in arvore[u]:
+                if v not in maior:
+                    maior[v] = max(maior[u], peso)
+                    fila.append(v)
+        return maior[destino]
+
+    for u, v, peso in zip(df_adjacencias['bairro_origem'], df_adjacencias['bairro_destino'],
+                          df_adjacencias['peso']):
+        if u != v:
+            assert maior_peso_no_caminho(u, v) <= peso, f"Propriedade do ciclo em {u} - {v}"
+
+    print(f"  -> Peso total: {kruskal['total_weight']} ({len(kruskal['edges'])} adjacências)")
+    print("PASSOU test_mst_recife")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes de Árvore Geradora Mínima")
+    print("="*60)
+
+    test_mst_small_graphs()
+    test_mst_recife()
+
+    print("\n" + "="*60)
+    print("Todos os Testes de Árvore Geradora Mínima Passaram!")
+    print("="*60 + "\n")
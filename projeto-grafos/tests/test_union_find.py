@@ -0,0 +1,112 @@
+"""
+- Union-find: uniões, tamanhos, ids de componente e same_component
+- Grafo: componentes atualizadas a cada aresta, iguais às alcançadas pelo BFS
+"""
+
+import sys
+import os
+
+# Muda para o diretório raiz do projeto para que os paths relativos funcionem
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+os.chdir(project_root)
+sys.path.insert(0, project_root)
+
+from src.graphs.graph import Grafo
+from src.graphs.union_find import UnionFind
+from src.graphs.algorithms import bfs, bfs_path, bidirectional_bfs_path, single_source_dijkstra
+from src.graphs.io import carregar_dados_principais
+
+
+def test_union_find_basico():
+    print("\nUnion-find: uniões e consultas")
+
+    uf = UnionFind(range(6))
+    assert uf.num_componentes == 6, "Seis conjuntos unitários"
+
+    assert uf.union(0, 1) == True, "0 e 1 estavam separados"
+    assert uf.union(1, 2) == True, "1 e 2 estavam separados"
+    assert uf.union(0, 2) == False, "0 e 2 já estão juntos"
+    uf.union(3, 4)
+
+    assert uf.num_componentes == 3, "Restam {0,1,2}, {3,4} e {5}"
+    assert uf.same_component(0, 2), "0 e 2 no mesmo conjunto"
+    assert not uf.same_component(2, 3), "2 e 3 em conjuntos diferentes"
+    assert not uf.same_component(0, 'x'), "Elemento inexistente não está em nenhum conjunto"
+    assert uf.size(1) == 3 and uf.size(4) == 2 and uf.size(5) == 1, "Tamanhos dos conjuntos"
+
+    ids = uf.component_ids()
+    assert ids == {0: 0, 1: 0, 2: 0, 3: 1, 4: 1, 5: 2}, "Ids densos na ordem de inserção"
+    assert uf.component_sizes() == [3, 2, 1], "Tamanhos indexados pelos ids"
+
+    uf.union('a', 'b')
+    assert 'a' in uf and len(uf) == 8, "union cria elementos novos"
+
+    print("PASSOU test_union_find_basico")
+
+
+def test_grafo_componentes_incrementais():
+    print("\nGrafo: componentes conexas incrementais")
+
+    df_bairros, df_adjacencias = carregar_dados_principais()
+
+    G = Grafo()
+    for bairro in df_bairros['bairro'].unique():
+        G.add_node(bairro)
+
+    for _, linha in df_adjacencias.iterrows():
+        G.add_edge(
+            linha['bairro_origem'],
+            linha['bairro_destino'],
+            linha['peso']
+        )
+
+    G.add_node('bairro isolado')
+
+    ids = G.get_componentes()
+    for source in ['boa viagem', 'recife', 'bairro isolado']:
+        alcancados = bfs(G, source)['visited']
+        assert G.get_tamanho_componente(source) == len(alcancados), f"Tamanho da componente de {source}"
+        for no in G.get_todos_os_nos():
+            assert G.mesmo_componente(source, no) == (no in alcancados), \
+                f"mesmo_componente({source}, {no}) deve bater com o BFS"
+            assert (ids[no] == ids[source]) == (no in alcancados), "Ids devem bater com o BFS"
+
+    assert G.get_numero_de_componentes() == len(set(ids.values())), "Número de componentes"
+
+    # Consultas sem caminho respondem sem busca
+    assert bfs_path(G, 'boa viagem', 'bairro isolado') is None, "Sem caminho para o nó isolado"
+    assert bidirectional_bfs_path(G, 'boa viagem', 'bairro isolado') is None, "Sem caminho bidirecional"
+    try:
+        single_source_dijkstra(G, 'boa viagem', target='bairro isolado')
+        assert False, "Deveria ter lançado exceção"
+    except Exception as e:
+        assert "No path" in str(e)
+        print(f"  -> Exceção lançada corretamente: {e}")
+
+    # Ligar o nó isolado une as componentes
+    G.add_edge('bairro isolado', 'boa viagem', 1)
+    assert G.mesmo_componente('bairro isolado', 'recife'), "Aresta nova une as componentes"
+    assert bfs_path(G, 'bairro isolado', 'boa viagem') == ['bairro isolado', 'boa viagem'], "Caminho novo"
+
+    # Dirigido: componentes fracamente conexas
+    G_dir = Grafo(dirigido=True)
+    G_dir.add_edge('A', 'B', 1)
+    G_dir.add_node('C')
+    assert G_dir.mesmo_componente('B', 'A'), "Fracamente conexos mesmo sem aresta B -> A"
+    assert not G_dir.mesmo_componente('A', 'C'), "C está isolado"
+
+    print(f"  -> Componentes: {G.get_numero_de_componentes()}")
+    print("PASSOU test_grafo_componentes_incrementais")
+
+
+if __name__ == "__main__":
+    print("\n" + "="*60)
+    print("Executando Testes do Union-Find")
+    print("="*60)
+
+    test_union_find_basico()
+    test_grafo_componentes_incrementais()
+
+    print("\n" + "="*60)
+    print("Todos os Testes do Union-Find Passaram!")
+    print("="*60 + "\n")